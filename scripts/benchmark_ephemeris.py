@@ -0,0 +1,74 @@
+import argparse
+import random
+import sys
+import time
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.positions import BACKEND_POSITIONS, swiss_position
+from life_chart_api.ephemeris.table import DEFAULT_TABLE_BODIES, EphemerisTable
+
+
+def _wrap180(value: float) -> float:
+    return (value + 180.0) % 360.0 - 180.0
+
+
+def _benchmark(position, reference, bodies, jds) -> dict[int, tuple[float, float]]:
+    results = {}
+    for body in bodies:
+        started = time.perf_counter()
+        values = [position(jd_ut, body)[0] for jd_ut in jds]
+        elapsed = time.perf_counter() - started
+        error = max(abs(_wrap180(value - reference(jd_ut, body)[0])) for jd_ut, value in zip(jds, values, strict=True))
+        results[body] = (len(jds) / elapsed, error)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare ephemeris backends for speed and accuracy.")
+    parser.add_argument("--table", default=None, help="Ephemeris table file to include.")
+    parser.add_argument("--ephe-path", default=None, help="Swiss Ephemeris data directory.")
+    parser.add_argument("--start-year", type=int, default=1900)
+    parser.add_argument("--end-year", type=int, default=2100)
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per body and backend.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        print("end-year must be >= start-year", file=sys.stderr)
+        return 1
+    if args.ephe_path:
+        swe.set_ephe_path(args.ephe_path)
+
+    _, retflag = swe.calc_ut(2451545.0, swe.SUN, swe.FLG_SWIEPH)
+    reference_name = "swiss" if retflag & swe.FLG_SWIEPH else "moshier"
+    print(f"swiss files available: {'yes' if reference_name == 'swiss' else 'no (falls back to moshier)'}")
+    print(f"reference: {reference_name}")
+
+    start_jd = swe.julday(args.start_year, 1, 1, 0.0, swe.GREG_CAL)
+    end_jd = swe.julday(args.end_year + 1, 1, 1, 0.0, swe.GREG_CAL)
+    backends = dict(BACKEND_POSITIONS)
+    table = None
+    if args.table:
+        table = EphemerisTable(args.table)
+        backends["table"] = table.position
+        start_jd = max(start_jd, table.start_jd)
+        end_jd = min(end_jd, table.end_jd)
+
+    rng = random.Random(args.seed)
+    jds = [rng.uniform(start_jd, end_jd) for _ in range(args.calls)]
+    bodies = DEFAULT_TABLE_BODIES if table is None else table.bodies
+
+    try:
+        print(f"{'backend':>8} {'body':>12} {'calls/sec':>12} {'max error':>14}")
+        for name, position in backends.items():
+            for body, (rate, error) in _benchmark(position, swiss_position, bodies, jds).items():
+                print(f"{name:>8} {swe.get_planet_name(body):>12} {rate:>12.0f} {error * 3600.0:>10.3f} arcsec")
+    finally:
+        if table is not None:
+            table.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+import argparse
+import sys
+import time
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.positions import swiss_position
+from life_chart_api.ephemeris.table import (
+    DEFAULT_TABLE_BODIES,
+    EphemerisTable,
+    measure_error_bounds,
+    record_error_bounds,
+    write_table,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build a memory-mappable daily ephemeris table.")
+    parser.add_argument("output", help="Path of the table file to write.")
+    parser.add_argument("--start-year", type=int, default=1800)
+    parser.add_argument("--end-year", type=int, default=2200)
+    parser.add_argument("--ephe-path", default=None, help="Swiss Ephemeris data directory.")
+    parser.add_argument("--samples", type=int, default=5000, help="Validation samples per body.")
+    args = parser.parse_args()
+
+    if args.end_year < args.start_year:
+        print("end-year must be >= start-year", file=sys.stderr)
+        return 1
+    if args.ephe_path:
+        swe.set_ephe_path(args.ephe_path)
+
+    start_jd = swe.julday(args.start_year, 1, 1, 0.0, swe.GREG_CAL)
+    end_jd = swe.julday(args.end_year + 1, 1, 1, 0.0, swe.GREG_CAL)
+    day_count = int(round(end_jd - start_jd)) + 1
+
+    started = time.perf_counter()
+    write_table(
+        args.output,
+        start_jd=start_jd,
+        day_count=day_count,
+        position=swiss_position,
+        bodies=DEFAULT_TABLE_BODIES,
+    )
+    print(f"wrote {day_count} days x {len(DEFAULT_TABLE_BODIES)} bodies in {time.perf_counter() - started:.1f}s")
+
+    table = EphemerisTable(args.output)
+    try:
+        bounds = measure_error_bounds(table, swiss_position, samples=args.samples)
+    finally:
+        table.close()
+    record_error_bounds(args.output, bounds)
+
+    for body, bound in bounds.items():
+        print(f"{swe.get_planet_name(body):>12}: max error {bound * 3600.0:.3f} arcsec")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,8 @@
 """Vedic astrology feature and mapping helpers."""
 
-from life_chart_api.astrology.vedic.compute import compute_vedic_features
+from life_chart_api.astrology.vedic.compute import (
+    compute_vedic_features,
+    compute_vedic_features_batch,
+)
+
+__all__ = ["compute_vedic_features", "compute_vedic_features_batch"]
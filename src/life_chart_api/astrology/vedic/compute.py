@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from datetime import datetime
+from typing import Sequence
 
 import swisseph as swe
 
-from life_chart_api.astrology.vedic.types import VedicChartFeatures
+from life_chart_api.astrology.vedic.types import VedicChartFeatures, VedicChartFeaturesBatch
+from life_chart_api.ephemeris.natal import (
+    NatalContext,
+    batch_julian_days,
+    build_natal_context,
+    placidus_houses,
+)
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.inputs.birth_moment import birth_utc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 _SIGN_NAMES = [
     "Aries",
@@ -59,43 +72,6 @@ def setup_swe(ephe_path: str | None = None, sid_mode: int = swe.SIDM_LAHIRI) ->
     swe.set_sid_mode(sid_mode)
 
 
-def _normalize_time(time_str: str) -> str:
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{time_str}:00"
-    if len(parts) == 3:
-        return time_str
-    raise ValueError("time must be HH:MM or HH:MM:SS")
-
-
-def _to_utc(date_str: str, time_str: str, tz_name: str) -> datetime:
-    normalized_time = _normalize_time(time_str)
-    try:
-        tzinfo = ZoneInfo(tz_name)
-    except Exception as exc:
-        raise ValueError(f"Invalid timezone: {tz_name}") from exc
-    local_dt = datetime.strptime(
-        f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S"
-    ).replace(tzinfo=tzinfo)
-    return local_dt.astimezone(timezone.utc)
-
-
-def _julday_ut(dt_utc: datetime) -> float:
-    hour_decimal = (
-        dt_utc.hour
-        + dt_utc.minute / 60.0
-        + dt_utc.second / 3600.0
-        + dt_utc.microsecond / 3_600_000_000.0
-    )
-    return swe.julday(
-        dt_utc.year,
-        dt_utc.month,
-        dt_utc.day,
-        hour_decimal,
-        swe.GREG_CAL,
-    )
-
-
 def _norm360(value: float) -> float:
     return value % 360.0
 
@@ -121,21 +97,8 @@ def _whole_sign_house(asc_sign_index: int, planet_sign_index: int) -> int:
     return ((planet_sign_index - asc_sign_index) % 12) + 1
 
 
-def _calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
-    values, _ = swe.calc_ut(jd_ut, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
-    return values[0], values[3]
-
-
-def _ascendant_longitude(jd_ut: float, lat: float, lon: float) -> float:
-    try:
-        _, ascmc = swe.houses_ex(jd_ut, lat, lon, b"P", swe.FLG_SIDEREAL)
-    except Exception:
-        _, ascmc = swe.houses(jd_ut, lat, lon, b"P")
-    return ascmc[0]
-
-
 def _planet_placements(
-    jd_ut: float, ayanamsa: float, asc_sign_index: int
+    natal: NatalContext, asc_sign_index: int
 ) -> dict[str, dict[str, float | int | bool]]:
     bodies = {
         "Sun": swe.SUN,
@@ -150,8 +113,8 @@ def _planet_placements(
 
     placements: dict[str, dict[str, float | int | bool]] = {}
     for name, body in bodies.items():
-        lon_trop, speed = _calc_lon_ut(jd_ut, body)
-        lon_sid = _norm360(lon_trop - ayanamsa)
+        lon_trop, speed = natal.positions[body]
+        lon_sid = _norm360(lon_trop - natal.ayanamsa)
         sign_index = _sign_index_from_lon(lon_sid)
         house = _whole_sign_house(asc_sign_index, sign_index)
         nak_index, pada = _nakshatra_from_lon(lon_sid)
@@ -191,24 +154,19 @@ def compute_vedic_features(
     lon: float,
     utc_dt: datetime | None = None,
     ephe_path: str | None = None,
+    natal: NatalContext | None = None,
 ) -> VedicChartFeatures:
     setup_swe(ephe_path)
 
-    if utc_dt is None:
-        utc_dt = _to_utc(date, time, tz)
-    else:
-        if utc_dt.tzinfo is None:
-            raise ValueError("utc_dt must be timezone-aware")
-        utc_dt = utc_dt.astimezone(timezone.utc)
-
-    jd_ut = _julday_ut(utc_dt)
-    ayanamsa = swe.get_ayanamsa_ut(jd_ut)
+    if natal is None:
+        if utc_dt is None:
+            utc_dt = birth_utc(date, time, tz)
+        natal = build_natal_context(utc_dt, lat, lon)
 
-    asc_lon = _norm360(_ascendant_longitude(jd_ut, lat, lon))
-    asc_sign_index = _sign_index_from_lon(asc_lon)
+    asc_sign_index = _sign_index_from_lon(natal.sidereal_ascendant)
     asc_sign = _SIGN_NAMES[asc_sign_index]
 
-    placements = _planet_placements(jd_ut, ayanamsa, asc_sign_index)
+    placements = _planet_placements(natal, asc_sign_index)
 
     moon_sign = _SIGN_NAMES[int(placements["Moon"]["sign_index"])]
     lagna_lord = _SIGN_LORDS.get(asc_sign)
@@ -251,3 +209,117 @@ def compute_vedic_features(
         current_phase_hint=None,
         notes=[],
     )
+
+
+def _shifted_column(longitudes: list[float], shifts: list[float], vectorized: bool) -> list[float]:
+    if vectorized and np is not None:
+        return np.mod(np.asarray(longitudes) + np.asarray(shifts), 360.0).tolist()
+    return [_norm360(lon + shift) for lon, shift in zip(longitudes, shifts, strict=True)]
+
+
+def _placement_columns(
+    sidereal: list[float], asc_indexes: list[int], vectorized: bool
+) -> dict[str, list[int]]:
+    if vectorized and np is not None:
+        lons = np.asarray(sidereal)
+        segment = 360.0 / 27.0
+        signs = np.floor_divide(lons, 30.0).astype(np.int64) % 12
+        return {
+            "sign_index": signs.tolist(),
+            "house": ((signs - np.asarray(asc_indexes, dtype=np.int64)) % 12 + 1).tolist(),
+            "nakshatra": (np.floor_divide(lons, segment).astype(np.int64) + 1).tolist(),
+            "pada": (
+                np.floor_divide(np.mod(lons, segment), segment / 4.0).astype(np.int64) + 1
+            ).tolist(),
+        }
+    signs = [_sign_index_from_lon(lon) for lon in sidereal]
+    nakshatras = [_nakshatra_from_lon(lon) for lon in sidereal]
+    return {
+        "sign_index": signs,
+        "house": [
+            _whole_sign_house(asc, sign) for asc, sign in zip(asc_indexes, signs, strict=True)
+        ],
+        "nakshatra": [nakshatra for nakshatra, _ in nakshatras],
+        "pada": [pada for _, pada in nakshatras],
+    }
+
+
+def compute_vedic_features_batch(
+    dates: Sequence[str],
+    times: Sequence[str],
+    tzs: Sequence[str],
+    lats: Sequence[float],
+    lons: Sequence[float],
+    ephe_path: str | None = None,
+    vectorized: bool | None = None,
+) -> VedicChartFeaturesBatch:
+    setup_swe(ephe_path)
+    if vectorized is None:
+        vectorized = np is not None
+    jds = batch_julian_days(dates, times, tzs, lats, lons)
+    ayanamsa_shifts = [-swe.get_ayanamsa_ut(jd_ut) for jd_ut in jds]
+    asc_indexes = [
+        _sign_index_from_lon(placidus_houses(jd_ut, lat, lon, swe.FLG_SIDEREAL)[1][0] % 360.0)
+        for jd_ut, lat, lon in zip(jds, lats, lons, strict=True)
+    ]
+
+    sidereal = {
+        body: _shifted_column(
+            [body_position(jd_ut, body)[0] for jd_ut in jds], ayanamsa_shifts, vectorized
+        )
+        for body in (swe.MOON, swe.MARS, swe.SATURN, swe.MEAN_NODE)
+    }
+    sidereal["Ketu"] = _shifted_column(sidereal[swe.MEAN_NODE], [180.0] * len(jds), vectorized)
+    placements = {
+        key: _placement_columns(column, asc_indexes, vectorized) for key, column in sidereal.items()
+    }
+
+    moon = placements[swe.MOON]["sign_index"]
+    rahu = placements[swe.MEAN_NODE]["sign_index"]
+    ketu = placements["Ketu"]["sign_index"]
+    lagna_signs = [_SIGN_NAMES[index] for index in asc_indexes]
+    count = len(jds)
+
+    return VedicChartFeaturesBatch(
+        lagna_sign=lagna_signs,
+        lagna_lord=[_SIGN_LORDS.get(sign) for sign in lagna_signs],
+        moon_sign=[_SIGN_NAMES[index] for index in moon],
+        moon_nakshatra=placements[swe.MOON]["nakshatra"],
+        moon_pada=placements[swe.MOON]["pada"],
+        moon_afflicted=[
+            row[0] in set(row[1:])
+            for row in zip(
+                moon,
+                placements[swe.SATURN]["sign_index"],
+                placements[swe.MARS]["sign_index"],
+                rahu,
+                ketu,
+                strict=True,
+            )
+        ],
+        saturn_theme=[
+            _SATURN_THEME_MAP.get(_SIGN_NAMES[index], "Responsibility through structure")
+            for index in placements[swe.SATURN]["sign_index"]
+        ],
+        rahu_ketu_emphasis=[
+            rahu_house in {1, 4, 7, 10}
+            or ketu_house in {1, 4, 7, 10}
+            or rahu_sign == asc
+            or ketu_sign == asc
+            or rahu_sign == moon_sign
+            or ketu_sign == moon_sign
+            for rahu_house, ketu_house, rahu_sign, ketu_sign, asc, moon_sign in zip(
+                placements[swe.MEAN_NODE]["house"],
+                placements["Ketu"]["house"],
+                rahu,
+                ketu,
+                asc_indexes,
+                moon,
+                strict=True,
+            )
+        ],
+        life_direction_hint=[None] * count,
+        timing_sensitivity_hint=[None] * count,
+        current_phase_hint=[None] * count,
+        notes=[[] for _ in range(count)],
+    )
@@ -18,3 +18,28 @@ class VedicChartFeatures(BaseModel):
     timing_sensitivity_hint: str | None
     current_phase_hint: str | None
     notes: List[str] = Field(default_factory=list)
+
+
+class VedicChartFeaturesBatch(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    lagna_sign: List[str]
+    lagna_lord: List[str | None]
+    moon_sign: List[str | None]
+    moon_nakshatra: List[int]
+    moon_pada: List[int]
+    moon_afflicted: List[bool]
+    saturn_theme: List[str | None]
+    rahu_ketu_emphasis: List[bool]
+    life_direction_hint: List[str | None]
+    timing_sensitivity_hint: List[str | None]
+    current_phase_hint: List[str | None]
+    notes: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.lagna_sign)
+
+    def row(self, index: int) -> VedicChartFeatures:
+        return VedicChartFeatures(
+            **{name: getattr(self, name)[index] for name in VedicChartFeatures.model_fields}
+        )
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
+from typing import Sequence
 
 import swisseph as swe
 
-from life_chart_api.astrology.western.types import WesternChartFeatures
+from life_chart_api.astrology.western.types import WesternChartFeatures, WesternChartFeaturesBatch
+from life_chart_api.ephemeris.natal import (
+    NatalContext,
+    batch_julian_days,
+    build_natal_context,
+    placidus_houses,
+)
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.inputs.birth_moment import birth_utc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 _SIGN_NAMES = [
     "Aries",
@@ -113,60 +125,10 @@ _SATURN_THEME_MAP = {
 }
 
 
-def _normalize_time(time_str: str) -> str:
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{time_str}:00"
-    if len(parts) == 3:
-        return time_str
-    raise ValueError("time must be HH:MM or HH:MM:SS")
-
-
-def _to_utc(date_str: str, time_str: str, tz_name: str) -> datetime:
-    normalized_time = _normalize_time(time_str)
-    try:
-        tzinfo = ZoneInfo(tz_name)
-    except Exception as exc:
-        raise ValueError(f"Invalid timezone: {tz_name}") from exc
-    local_dt = datetime.strptime(
-        f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S"
-    ).replace(tzinfo=tzinfo)
-    return local_dt.astimezone(timezone.utc)
-
-
-def _julian_day(utc_dt: datetime) -> float:
-    hour_decimal = (
-        utc_dt.hour
-        + utc_dt.minute / 60.0
-        + utc_dt.second / 3600.0
-        + utc_dt.microsecond / 3_600_000_000.0
-    )
-    return swe.julday(
-        utc_dt.year,
-        utc_dt.month,
-        utc_dt.day,
-        hour_decimal,
-        swe.GREG_CAL,
-    )
-
-
-def _longitude_for(jd_ut: float, planet_id: int) -> float:
-    values, _ = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-    return values[0] % 360.0
-
-
 def _sign_from_longitude(lon: float) -> str:
     return _SIGN_NAMES[int(lon // 30) % 12]
 
 
-def _ascendant_longitude(jd_ut: float, lat: float, lon: float) -> float:
-    try:
-        _, ascmc = swe.houses_ex(jd_ut, lat, lon, b"P")
-    except Exception:
-        _, ascmc = swe.houses(jd_ut, lat, lon, b"P")
-    return ascmc[0] % 360.0
-
-
 def _dominant_from_signs(signs: list[str], mapping: dict[str, str]) -> str | None:
     counts: dict[str, int] = {}
     for sign in signs:
@@ -189,18 +151,23 @@ def _whole_sign_notes(asc_sign: str) -> list[str]:
 
 
 def compute_western_features(
-    date: str, time: str, tz: str, lat: float, lon: float
+    date: str,
+    time: str,
+    tz: str,
+    lat: float,
+    lon: float,
+    natal: NatalContext | None = None,
 ) -> WesternChartFeatures:
-    utc_dt = _to_utc(date, time, tz)
-    jd_ut = _julian_day(utc_dt)
+    if natal is None:
+        natal = build_natal_context(birth_utc(date, time, tz), lat, lon)
 
-    sun_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.SUN))
-    moon_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.MOON))
-    mercury_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.MERCURY))
-    venus_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.VENUS))
-    mars_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.MARS))
-    saturn_sign = _sign_from_longitude(_longitude_for(jd_ut, swe.SATURN))
-    asc_sign = _sign_from_longitude(_ascendant_longitude(jd_ut, lat, lon))
+    sun_sign = _sign_from_longitude(natal.longitude(swe.SUN))
+    moon_sign = _sign_from_longitude(natal.longitude(swe.MOON))
+    mercury_sign = _sign_from_longitude(natal.longitude(swe.MERCURY))
+    venus_sign = _sign_from_longitude(natal.longitude(swe.VENUS))
+    mars_sign = _sign_from_longitude(natal.longitude(swe.MARS))
+    saturn_sign = _sign_from_longitude(natal.longitude(swe.SATURN))
+    asc_sign = _sign_from_longitude(natal.ascendant)
 
     dominant_element = _dominant_from_signs(
         [sun_sign, moon_sign, asc_sign], _ELEMENT_BY_SIGN
@@ -221,3 +188,55 @@ def compute_western_features(
         saturn_theme=_SATURN_THEME_MAP.get(saturn_sign, "Responsibility through limits"),
         notes=_whole_sign_notes(asc_sign),
     )
+
+
+def _sign_column(longitudes: list[float], vectorized: bool) -> list[str]:
+    if vectorized and np is not None:
+        indexes = (np.floor_divide(np.asarray(longitudes), 30.0).astype(np.int64) % 12).tolist()
+        return [_SIGN_NAMES[index] for index in indexes]
+    return [_SIGN_NAMES[int(lon // 30) % 12] for lon in longitudes]
+
+
+def compute_western_features_batch(
+    dates: Sequence[str],
+    times: Sequence[str],
+    tzs: Sequence[str],
+    lats: Sequence[float],
+    lons: Sequence[float],
+    vectorized: bool | None = None,
+) -> WesternChartFeaturesBatch:
+    if vectorized is None:
+        vectorized = np is not None
+    jds = batch_julian_days(dates, times, tzs, lats, lons)
+
+    signs = {
+        body: _sign_column([body_position(jd_ut, body)[0] for jd_ut in jds], vectorized)
+        for body in (swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.SATURN)
+    }
+    asc_signs = _sign_column(
+        [
+            placidus_houses(jd_ut, lat, lon)[1][0] % 360.0
+            for jd_ut, lat, lon in zip(jds, lats, lons, strict=True)
+        ],
+        vectorized,
+    )
+    sun_signs = signs[swe.SUN]
+    moon_signs = signs[swe.MOON]
+    triads = [list(triad) for triad in zip(sun_signs, moon_signs, asc_signs, strict=True)]
+
+    return WesternChartFeaturesBatch(
+        sun_sign=sun_signs,
+        moon_sign=moon_signs,
+        ascendant_sign=asc_signs,
+        dominant_element=[_dominant_from_signs(triad, _ELEMENT_BY_SIGN) for triad in triads],
+        dominant_modality=[_dominant_from_signs(triad, _MODALITY_BY_SIGN) for triad in triads],
+        mercury_style=[
+            _MERCURY_STYLE_MAP.get(sign, "Balanced and observant") for sign in signs[swe.MERCURY]
+        ],
+        mars_style=[_MARS_STYLE_MAP.get(sign, "Measured and steady") for sign in signs[swe.MARS]],
+        venus_style=[_VENUS_STYLE_MAP.get(sign, "Warm and sincere") for sign in signs[swe.VENUS]],
+        saturn_theme=[
+            _SATURN_THEME_MAP.get(sign, "Responsibility through limits") for sign in signs[swe.SATURN]
+        ],
+        notes=[_whole_sign_notes(sign) for sign in asc_signs],
+    )
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from typing import Any, Callable
+
+import swisseph as swe
+
+from life_chart_api.astrology.western.compute import compute_western_features
+from life_chart_api.ephemeris.natal import (
+    build_natal_context,
+    datetime_from_julian_day,
+    julian_day,
+    natal_context_for_birth,
+)
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.temporal.transit_solver import find_root, wrap180
+from life_chart_api.versioning import SCHEMA_VERSION_RETURNS
+
+RETURN_BODIES = {"sun": swe.SUN, "moon": swe.MOON}
+
+# Bounds on geocentric daily motion. Sun and Moon never station, so the return
+# always lies between the arrival times at the fastest and slowest speeds.
+_SPEED_BOUNDS = {
+    swe.SUN: (0.94, 1.03),
+    swe.MOON: (11.5, 15.5),
+}
+_RESTART_DAYS = 1.0
+
+
+@dataclass(frozen=True)
+class ReturnMoment:
+    jd_ut: float
+    utc: datetime
+    longitude: float
+
+
+def find_return_moments(
+    natal_lon: float,
+    body: int,
+    jd_start: float,
+    count: int,
+    position: Callable[[float, int], tuple[float, float]] = body_position,
+) -> list[ReturnMoment]:
+    def offset(jd_ut: float) -> tuple[float, float]:
+        lon, speed = position(jd_ut, body)
+        return wrap180(lon - natal_lon), speed
+
+    slowest, fastest = _SPEED_BOUNDS[body]
+    moments: list[ReturnMoment] = []
+    jd_from = jd_start
+    while len(moments) < count:
+        lon, _ = position(jd_from, body)
+        remaining = (natal_lon - lon) % 360.0
+        lo = jd_from + remaining / fastest
+        hi = jd_from + remaining / slowest
+        f_lo, _ = offset(lo)
+        f_hi, _ = offset(hi)
+        while f_lo > 0.0:
+            lo -= 1.0
+            f_lo, _ = offset(lo)
+        while f_hi < 0.0:
+            hi += 1.0
+            f_hi, _ = offset(hi)
+        root = find_root(offset, lo, hi, f_lo, f_hi)
+        moments.append(
+            ReturnMoment(
+                jd_ut=root,
+                utc=datetime_from_julian_day(root),
+                longitude=position(root, body)[0],
+            )
+        )
+        jd_from = root + _RESTART_DAYS
+    return moments
+
+
+def build_returns_response(
+    *,
+    name: str | None,
+    birth: dict[str, Any],
+    body: str,
+    count: int,
+    start: date,
+) -> dict[str, Any]:
+    natal = natal_context_for_birth(birth)
+    location = birth.get("location") or {}
+    lat = location.get("lat", 0.0)
+    lon = location.get("lon", 0.0)
+    jd_start = julian_day(datetime.combine(start, time.min, tzinfo=timezone.utc))
+    body_id = RETURN_BODIES[body]
+    moments = find_return_moments(natal.longitude(body_id), body_id, jd_start, count)
+
+    returns = []
+    for index, moment in enumerate(moments, start=1):
+        chart = build_natal_context(moment.utc, lat, lon)
+        features = compute_western_features(
+            moment.utc.strftime("%Y-%m-%d"),
+            moment.utc.strftime("%H:%M:%S"),
+            "UTC",
+            lat,
+            lon,
+            natal=chart,
+        )
+        returns.append(
+            {
+                "index": index,
+                "moment": moment.utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "longitude": round(moment.longitude, 4),
+                "ascendant": round(chart.ascendant, 2),
+                "chart": features.model_dump(),
+            }
+        )
+
+    response: dict[str, Any] = {
+        "meta": {"version": SCHEMA_VERSION_RETURNS, "body": body, "from": start.strftime("%Y-%m-%d")},
+        "input": {"birth": birth},
+        "returns": returns,
+    }
+    if name:
+        response["input"]["name"] = name
+    return response
@@ -18,3 +18,26 @@ class WesternChartFeatures(BaseModel):
     venus_style: str | None
     saturn_theme: str | None
     notes: List[str] = Field(default_factory=list)
+
+
+class WesternChartFeaturesBatch(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    sun_sign: List[str]
+    moon_sign: List[str]
+    ascendant_sign: List[str]
+    dominant_element: List[str | None]
+    dominant_modality: List[str | None]
+    mercury_style: List[str | None]
+    mars_style: List[str | None]
+    venus_style: List[str | None]
+    saturn_theme: List[str | None]
+    notes: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.sun_sign)
+
+    def row(self, index: int) -> WesternChartFeatures:
+        return WesternChartFeatures(
+            **{name: getattr(self, name)[index] for name in WesternChartFeatures.model_fields}
+        )
@@ -0,0 +1 @@
+"""Ephemeris position backends shared by astrology and temporal engines."""
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Mapping, Sequence
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.inputs.birth_moment import birth_utc
+
+NATAL_BODIES = (
+    swe.SUN,
+    swe.MOON,
+    swe.MERCURY,
+    swe.VENUS,
+    swe.MARS,
+    swe.JUPITER,
+    swe.SATURN,
+    swe.URANUS,
+    swe.NEPTUNE,
+    swe.PLUTO,
+    swe.MEAN_NODE,
+)
+
+HOUSE_CACHE_SIZE = 4096
+_SECONDS_PER_DAY = 86400.0
+_LOCATION_SCALE = 10000.0
+
+
+@dataclass(frozen=True)
+class NatalContext:
+    utc: datetime
+    jd_ut: float
+    lat: float
+    lon: float
+    positions: Mapping[int, tuple[float, float]]
+    ayanamsa: float
+    cusps: tuple[float, ...]
+    ascmc: tuple[float, ...]
+    sidereal_ascendant: float
+
+    @property
+    def ascendant(self) -> float:
+        return self.ascmc[0] % 360.0
+
+    def longitude(self, body: int) -> float:
+        return self.positions[body][0]
+
+    def speed(self, body: int) -> float:
+        return self.positions[body][1]
+
+    def sidereal_longitude(self, body: int) -> float:
+        return (self.positions[body][0] - self.ayanamsa) % 360.0
+
+
+def julian_day(utc_dt: datetime) -> float:
+    hour_decimal = (
+        utc_dt.hour
+        + utc_dt.minute / 60.0
+        + utc_dt.second / 3600.0
+        + utc_dt.microsecond / 3_600_000_000.0
+    )
+    return swe.julday(
+        utc_dt.year,
+        utc_dt.month,
+        utc_dt.day,
+        hour_decimal,
+        swe.GREG_CAL,
+    )
+
+
+def datetime_from_julian_day(jd_ut: float) -> datetime:
+    year, month, day, hour = swe.revjul(jd_ut, swe.GREG_CAL)
+    return datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hour)
+
+
+def batch_julian_days(
+    dates: Sequence[str],
+    times: Sequence[str],
+    tzs: Sequence[str],
+    lats: Sequence[float],
+    lons: Sequence[float],
+) -> list[float]:
+    if not len(dates) == len(times) == len(tzs) == len(lats) == len(lons):
+        raise ValueError("batch columns must have the same length")
+    return [julian_day(birth_utc(*row)) for row in zip(dates, times, tzs, strict=True)]
+
+
+@lru_cache(maxsize=HOUSE_CACHE_SIZE)
+def _cached_houses(
+    jd_key: int, lat_key: int, lon_key: int, flags: int, ayanamsa: float
+) -> tuple[tuple, tuple]:
+    jd_ut = jd_key / _SECONDS_PER_DAY
+    lat = lat_key / _LOCATION_SCALE
+    lon = lon_key / _LOCATION_SCALE
+    try:
+        return swe.houses_ex(jd_ut, lat, lon, b"P", flags)
+    except swe.Error:
+        return swe.houses(jd_ut, lat, lon, b"P")
+
+
+def placidus_houses(jd_ut: float, lat: float, lon: float, flags: int = 0) -> tuple[tuple, tuple]:
+    jd_key = round(jd_ut * _SECONDS_PER_DAY)
+    # Sidereal cusps depend on the global set_sid_mode, so the active ayanamsa is part of the key.
+    ayanamsa = swe.get_ayanamsa_ut(jd_key / _SECONDS_PER_DAY) if flags & swe.FLG_SIDEREAL else 0.0
+    return _cached_houses(
+        jd_key,
+        round(lat * _LOCATION_SCALE),
+        round(lon * _LOCATION_SCALE),
+        flags,
+        ayanamsa,
+    )
+
+
+def house_cache_stats() -> dict[str, Any]:
+    info = _cached_houses.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def build_natal_context(utc_dt: datetime, lat: float, lon: float) -> NatalContext:
+    if utc_dt.tzinfo is None:
+        raise ValueError("utc_dt must be timezone-aware")
+    utc_dt = utc_dt.astimezone(timezone.utc)
+    jd_ut = julian_day(utc_dt)
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    ayanamsa = swe.get_ayanamsa_ut(jd_ut)
+    cusps, ascmc = placidus_houses(jd_ut, lat, lon)
+    _, sidereal_ascmc = placidus_houses(jd_ut, lat, lon, swe.FLG_SIDEREAL)
+
+    return NatalContext(
+        utc=utc_dt,
+        jd_ut=jd_ut,
+        lat=lat,
+        lon=lon,
+        positions={body: body_position(jd_ut, body) for body in NATAL_BODIES},
+        ayanamsa=ayanamsa,
+        cusps=tuple(cusps),
+        ascmc=tuple(ascmc),
+        sidereal_ascendant=sidereal_ascmc[0] % 360.0,
+    )
+
+
+def natal_context_for_birth(birth: dict[str, Any]) -> NatalContext:
+    location = birth.get("location") or {}
+    utc_dt = birth_utc(
+        birth.get("date", ""),
+        birth.get("time", ""),
+        birth.get("timezone", "UTC"),
+    )
+    return build_natal_context(utc_dt, location.get("lat", 0.0), location.get("lon", 0.0))
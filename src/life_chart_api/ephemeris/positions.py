@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.table import EphemerisTable, open_table
+from life_chart_api.settings import get_settings
+
+TABLE_ERROR_LIMIT_DEG = 0.005
+
+
+def active_backend() -> str:
+    settings = get_settings()
+    if settings.EPHEMERIS_BACKEND:
+        return settings.EPHEMERIS_BACKEND
+    return "table" if settings.EPHEMERIS_TABLE_PATH else "swiss"
+
+
+def active_table() -> EphemerisTable | None:
+    settings = get_settings()
+    if not settings.EPHEMERIS_TABLE_PATH or active_backend() != "table":
+        return None
+    return open_table(settings.EPHEMERIS_TABLE_PATH)
+
+
+def _table_accurate(table: EphemerisTable, body: int) -> bool:
+    bound = table.error_bound(body)
+    return bound is not None and bound <= TABLE_ERROR_LIMIT_DEG
+
+
+def _table_serves(table: EphemerisTable, jd_ut: float, body: int) -> bool:
+    return table.covers(jd_ut, body) and _table_accurate(table, body)
+
+
+def swiss_position(jd_ut: float, body: int) -> tuple[float, float]:
+    values, _ = swe.calc_ut(jd_ut, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return values[0] % 360.0, values[3]
+
+
+def moshier_position(jd_ut: float, body: int) -> tuple[float, float]:
+    values, _ = swe.calc_ut(jd_ut, body, swe.FLG_MOSEPH | swe.FLG_SPEED)
+    return values[0] % 360.0, values[3]
+
+
+def body_position(jd_ut: float, body: int) -> tuple[float, float]:
+    backend = active_backend()
+    if backend == "moshier":
+        return moshier_position(jd_ut, body)
+    if backend == "table":
+        table = active_table()
+        if table is not None and _table_serves(table, jd_ut, body):
+            return table.position(jd_ut, body)
+    return swiss_position(jd_ut, body)
+
+
+BACKEND_POSITIONS: dict[str, Callable[[float, int], tuple[float, float]]] = {
+    "swiss": swiss_position,
+    "moshier": moshier_position,
+}
+
+
+def ephemeris_status() -> dict[str, Any]:
+    backend = active_backend()
+    _, retflag = swe.calc_ut(2451545.0, swe.SUN, swe.FLG_SWIEPH)
+    files = "swiss" if retflag & swe.FLG_SWIEPH else "moshier"
+    table = active_table()
+    if backend == "moshier":
+        effective = "moshier"
+    elif table is not None and any(_table_accurate(table, body) for body in table.bodies):
+        effective = "table"
+    else:
+        effective = files
+    return {
+        "backend": backend,
+        "effective": effective,
+        "table": str(table.path) if table is not None else None,
+    }
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import mmap
+import random
+import struct
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable
+
+import swisseph as swe
+
+TABLE_MAGIC = b"LCEPHEM1"
+TABLE_VERSION = 1
+
+DEFAULT_TABLE_BODIES = (
+    swe.SUN,
+    swe.MOON,
+    swe.MERCURY,
+    swe.VENUS,
+    swe.MARS,
+    swe.JUPITER,
+    swe.SATURN,
+    swe.URANUS,
+    swe.NEPTUNE,
+    swe.PLUTO,
+    swe.MEAN_NODE,
+)
+
+# magic, version, body count, day count, reserved, start jd, step in days
+_HEADER = struct.Struct("<8sIIIIdd")
+
+
+def _header_size(body_count: int) -> int:
+    # header + body ids (int32) + validated error bounds (float64), padded to 8 bytes
+    size = _HEADER.size + 4 * body_count
+    size += (-size) % 8
+    return size + 8 * body_count
+
+
+def _wrap180(value: float) -> float:
+    return (value + 180.0) % 360.0 - 180.0
+
+
+class EphemerisTable:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, body_count, day_count, _, start_jd, step = _HEADER.unpack_from(self._mmap, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Not an ephemeris table: {self.path}")
+        offset = _HEADER.size
+        self.bodies = struct.unpack_from(f"<{body_count}i", self._mmap, offset)
+        offset += 4 * body_count
+        offset += (-offset) % 8
+        bounds = struct.unpack_from(f"<{body_count}d", self._mmap, offset)
+        self.start_jd = start_jd
+        self.step = step
+        self.day_count = day_count
+        self.end_jd = start_jd + step * (day_count - 1)
+        self._error_bounds = dict(zip(self.bodies, bounds, strict=True))
+        self._columns = {body: index for index, body in enumerate(self.bodies)}
+        self._stride = 2 * body_count
+        self._values = memoryview(self._mmap)[_header_size(body_count) :].cast("f")
+
+    def close(self) -> None:
+        self._values.release()
+        self._mmap.close()
+
+    def covers(self, jd_ut: float, body: int) -> bool:
+        return body in self._columns and self.start_jd <= jd_ut < self.end_jd
+
+    def error_bound(self, body: int) -> float | None:
+        bound = self._error_bounds.get(body)
+        if bound is None or bound < 0.0:
+            return None
+        return bound
+
+    def position(self, jd_ut: float, body: int) -> tuple[float, float]:
+        column = self._columns[body]
+        offset = (jd_ut - self.start_jd) / self.step
+        index = min(int(offset), self.day_count - 2)
+        s = offset - index
+        base = index * self._stride + 2 * column
+        values = self._values
+        lon0, speed0 = values[base], values[base + 1]
+        lon1, speed1 = values[base + self._stride], values[base + self._stride + 1]
+        lon1 = lon0 + _wrap180(lon1 - lon0)
+        h = self.step
+        s2 = s * s
+        s3 = s2 * s
+        lon = (
+            (2.0 * s3 - 3.0 * s2 + 1.0) * lon0
+            + (s3 - 2.0 * s2 + s) * h * speed0
+            + (-2.0 * s3 + 3.0 * s2) * lon1
+            + (s3 - s2) * h * speed1
+        )
+        speed = (
+            (6.0 * s2 - 6.0 * s) / h * lon0
+            + (3.0 * s2 - 4.0 * s + 1.0) * speed0
+            + (-6.0 * s2 + 6.0 * s) / h * lon1
+            + (3.0 * s2 - 2.0 * s) * speed1
+        )
+        return lon % 360.0, speed
+
+
+def write_table(
+    path: str | Path,
+    *,
+    start_jd: float,
+    day_count: int,
+    position: Callable[[float, int], tuple[float, float]],
+    bodies: Iterable[int] = DEFAULT_TABLE_BODIES,
+    step: float = 1.0,
+) -> None:
+    bodies = tuple(bodies)
+    header = bytearray(_header_size(len(bodies)))
+    _HEADER.pack_into(header, 0, TABLE_MAGIC, TABLE_VERSION, len(bodies), day_count, 0, start_jd, step)
+    struct.pack_into(f"<{len(bodies)}i", header, _HEADER.size, *bodies)
+    bounds_offset = len(header) - 8 * len(bodies)
+    struct.pack_into(f"<{len(bodies)}d", header, bounds_offset, *([-1.0] * len(bodies)))
+
+    with Path(path).open("wb") as handle:
+        handle.write(header)
+        for day in range(day_count):
+            jd_ut = start_jd + day * step
+            row = array("f")
+            for body in bodies:
+                lon, speed = position(jd_ut, body)
+                row.append(lon % 360.0)
+                row.append(speed)
+            handle.write(row.tobytes())
+
+
+def measure_error_bounds(
+    table: EphemerisTable,
+    reference: Callable[[float, int], tuple[float, float]],
+    *,
+    samples: int = 2000,
+    seed: int = 0,
+) -> dict[int, float]:
+    rng = random.Random(seed)
+    bounds = {body: 0.0 for body in table.bodies}
+    for _ in range(samples):
+        jd_ut = rng.uniform(table.start_jd, table.end_jd)
+        for body in table.bodies:
+            expected, _ = reference(jd_ut, body)
+            actual, _ = table.position(jd_ut, body)
+            error = abs(_wrap180(actual - expected))
+            if error > bounds[body]:
+                bounds[body] = error
+    return bounds
+
+
+def record_error_bounds(path: str | Path, bounds: dict[int, float]) -> None:
+    with Path(path).open("r+b") as handle:
+        header = handle.read(_HEADER.size)
+        _, _, body_count, _, _, _, _ = _HEADER.unpack(header)
+        handle.seek(_HEADER.size)
+        bodies = struct.unpack(f"<{body_count}i", handle.read(4 * body_count))
+        handle.seek(_header_size(body_count) - 8 * body_count)
+        handle.write(struct.pack(f"<{body_count}d", *(bounds.get(body, -1.0) for body in bodies)))
+
+
+@lru_cache(maxsize=4)
+def open_table(path: str) -> EphemerisTable:
+    return EphemerisTable(path)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+import swisseph as swe
+
+from life_chart_api.settings import get_settings
+
+T = TypeVar("T")
+
+
+def _init_worker(ephe_path: str | None) -> None:
+    if ephe_path:
+        swe.set_ephe_path(ephe_path)
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+
+class EphemerisWorkerPool:
+    def __init__(self, workers: int, ephe_path: str | None = None) -> None:
+        self.workers = max(0, workers)
+        self._executor: ProcessPoolExecutor | None = None
+        if not self.workers:
+            _init_worker(ephe_path)
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(ephe_path,),
+            )
+
+    @property
+    def in_process(self) -> bool:
+        return self._executor is None
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        if self._executor is not None:
+            return self._executor.submit(fn, *args, **kwargs)
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+    def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        if self._executor is None:
+            return fn(*args, **kwargs)
+        return self._executor.submit(fn, *args, **kwargs).result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+_POOL: EphemerisWorkerPool | None = None
+_POOL_LOCK = Lock()
+
+
+def get_worker_pool() -> EphemerisWorkerPool:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                settings = get_settings()
+                _POOL = EphemerisWorkerPool(settings.EPHEMERIS_WORKERS, settings.EPHEMERIS_PATH)
+    return _POOL
+
+
+def shutdown_worker_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown()
+            _POOL = None
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Literal
+from zoneinfo import ZoneInfo
+
+BIRTH_MOMENT_CACHE_SIZE = 8192
+
+Resolution = Literal["exact", "ambiguous", "nonexistent"]
+
+
+@dataclass(frozen=True)
+class BirthMoment:
+    local: datetime
+    utc: datetime
+    fold: int
+    resolution: Resolution
+
+
+def normalize_time(time_str: str) -> str:
+    parts = time_str.split(":")
+    if len(parts) == 2:
+        return f"{time_str}:00"
+    if len(parts) == 3:
+        return time_str
+    raise ValueError("time must be HH:MM or HH:MM:SS")
+
+
+@lru_cache(maxsize=512)
+def get_zone(tz_name: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(tz_name)
+    except Exception as exc:
+        raise ValueError(f"Invalid timezone: {tz_name}") from exc
+
+
+def _resolve(naive: datetime, zone: ZoneInfo) -> tuple[datetime, Resolution]:
+    earlier = naive.replace(tzinfo=zone, fold=0)
+    later = naive.replace(tzinfo=zone, fold=1)
+    if earlier.utcoffset() == later.utcoffset():
+        return earlier, "exact"
+    round_trip = earlier.astimezone(timezone.utc).astimezone(zone).replace(tzinfo=None)
+    if round_trip == naive:
+        return earlier, "ambiguous"
+    return earlier, "nonexistent"
+
+
+@lru_cache(maxsize=BIRTH_MOMENT_CACHE_SIZE)
+def normalize_birth_moment(date_str: str, time_str: str, tz_name: str) -> BirthMoment:
+    normalized_time = normalize_time(time_str)
+    zone = get_zone(tz_name)
+    naive = datetime.strptime(f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S")
+    local_dt, resolution = _resolve(naive, zone)
+    return BirthMoment(
+        local=local_dt,
+        utc=local_dt.astimezone(timezone.utc),
+        fold=local_dt.fold,
+        resolution=resolution,
+    )
+
+
+def birth_utc(date_str: str, time_str: str, tz_name: str) -> datetime:
+    return normalize_birth_moment(date_str, time_str, tz_name).utc
+
+
+def birth_local(date_str: str, time_str: str, tz_name: str) -> datetime:
+    return normalize_birth_moment(date_str, time_str, tz_name).local
+
+
+def birth_moment_cache_stats() -> dict[str, Any]:
+    info = normalize_birth_moment.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
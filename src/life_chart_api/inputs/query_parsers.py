@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import re
-from datetime import date
+from calendar import monthrange
+from datetime import date, timedelta
 from typing import Iterable
 
 from life_chart_api.errors import APIError
 
 _YM_PATTERN = re.compile(r"^\d{4}-\d{2}$")
 _YMD_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_HORIZON_PATTERN = re.compile(r"^(\d{1,3})m$")
 
 
 def parse_ym(value: str, *, path: str) -> str:
@@ -49,6 +51,16 @@ def parse_ymd(value: str, *, path: str) -> str:
     return parsed.strftime("%Y-%m-%d")
 
 
+def parse_range_date(value: str, *, path: str, end: bool) -> tuple[str, date]:
+    if isinstance(value, str) and _YMD_PATTERN.match(value):
+        normalized = parse_ymd(value, path=path)
+        return normalized, date.fromisoformat(normalized)
+    normalized = parse_ym(value, path=path)
+    year, month = map(int, normalized.split("-"))
+    day = monthrange(year, month)[1] if end else 1
+    return normalized, date(year, month, day)
+
+
 def parse_include_csv(value: str | None, *, allowed: Iterable[str], default: str, path: str) -> list[str]:
     allowed_set = {item.lower() for item in allowed}
     raw = value if value is not None else default
@@ -68,11 +80,76 @@ def parse_include_csv(value: str | None, *, allowed: Iterable[str], default: str
 def parse_granularity(value: str | None, *, path: str) -> str:
     if value is None:
         return "month"
-    if value not in {"month", "quarter"}:
+    if value not in {"month", "quarter", "week", "day"}:
         raise APIError(
             code="INVALID_INPUT",
             message="Invalid granularity.",
-            details=[{"path": path, "issue": "must be month or quarter"}],
+            details=[{"path": path, "issue": "must be month, quarter, week, or day"}],
+            status_code=400,
+        )
+    return value
+
+
+def parse_dasha_depth(value: str | None, *, path: str) -> str:
+    if value is None:
+        return "maha"
+    if value not in {"maha", "antar", "pratyantar", "sookshma"}:
+        raise APIError(
+            code="INVALID_INPUT",
+            message="Invalid dasha depth.",
+            details=[{"path": path, "issue": "must be maha, antar, pratyantar, or sookshma"}],
+            status_code=400,
+        )
+    return value
+
+
+def parse_horizons(value: str, *, path: str) -> list[int]:
+    months: set[int] = set()
+    for item in value.split(","):
+        match = _HORIZON_PATTERN.match(item.strip().lower())
+        if not match or int(match.group(1)) < 1:
+            raise APIError(
+                code="INVALID_INPUT",
+                message="Invalid horizons parameter.",
+                details=[{"path": path, "issue": "must be a CSV of month counts such as 3m,12m,60m"}],
+                status_code=400,
+            )
+        months.add(int(match.group(1)))
+    return sorted(months)
+
+
+def horizon_end(range_from: str, months: int, *, path: str) -> str:
+    start, start_date = parse_range_date(range_from, path=path, end=False)
+    index = start_date.year * 12 + start_date.month - 1 + months
+    if len(start) == 7:
+        year, month = divmod(index - 1, 12)
+        return f"{year:04d}-{month + 1:02d}"
+    year, month = divmod(index, 12)
+    month_days = monthrange(year, month + 1)[1]
+    if start_date.day > month_days:
+        return date(year, month + 1, month_days).strftime("%Y-%m-%d")
+    return (date(year, month + 1, start_date.day) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def parse_return_body(value: str | None, *, path: str) -> str:
+    if value is None:
+        return "sun"
+    if value not in {"sun", "moon"}:
+        raise APIError(
+            code="INVALID_INPUT",
+            message="Invalid return body.",
+            details=[{"path": path, "issue": "must be sun or moon"}],
+            status_code=400,
+        )
+    return value
+
+
+def parse_return_count(value: int, *, path: str, max_count: int) -> int:
+    if not 1 <= value <= max_count:
+        raise APIError(
+            code="INVALID_INPUT",
+            message="Invalid return count.",
+            details=[{"path": path, "issue": f"must be between 1 and {max_count}"}],
             status_code=400,
         )
     return value
@@ -100,7 +177,19 @@ def validate_range(
     path_to: str,
     max_months: int = 60,
     max_quarters: int = 80,
+    max_weeks: int = 104,
+    max_days: int = 92,
 ) -> tuple[str, str]:
+    if granularity in {"week", "day"}:
+        return _validate_day_range(
+            range_from=range_from,
+            range_to=range_to,
+            granularity=granularity,
+            path_from=path_from,
+            path_to=path_to,
+            max_weeks=max_weeks,
+            max_days=max_days,
+        )
     start = parse_ym(range_from, path=path_from)
     end = parse_ym(range_to, path=path_to)
     start_year, start_month = map(int, start.split("-"))
@@ -132,3 +221,44 @@ def validate_range(
                 status_code=400,
             )
     return start, end
+
+
+def _validate_day_range(
+    *,
+    range_from: str,
+    range_to: str,
+    granularity: str,
+    path_from: str,
+    path_to: str,
+    max_weeks: int,
+    max_days: int,
+) -> tuple[str, str]:
+    start, start_date = parse_range_date(range_from, path=path_from, end=False)
+    end, end_date = parse_range_date(range_to, path=path_to, end=True)
+    if end_date < start_date:
+        raise APIError(
+            code="INVALID_INPUT",
+            message="Invalid range.",
+            details=[{"path": path_to, "issue": "must be greater than or equal to from"}],
+            status_code=400,
+        )
+    if granularity == "week":
+        first_monday = start_date - timedelta(days=start_date.weekday())
+        weeks = (end_date - first_monday).days // 7 + 1
+        if weeks > max_weeks:
+            raise APIError(
+                code="INVALID_INPUT",
+                message="Range too large for week granularity.",
+                details=[{"path": "query.range", "issue": f"max {max_weeks} weeks"}],
+                status_code=400,
+            )
+    else:
+        days = (end_date - start_date).days + 1
+        if days > max_days:
+            raise APIError(
+                code="INVALID_INPUT",
+                message="Range too large for day granularity.",
+                details=[{"path": "query.range", "issue": f"max {max_days} days"}],
+                status_code=400,
+            )
+    return start, end
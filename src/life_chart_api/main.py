@@ -1,10 +1,16 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
 
+from life_chart_api.ephemeris.natal import house_cache_stats
+from life_chart_api.ephemeris.positions import ephemeris_status
+from life_chart_api.ephemeris.workers import shutdown_worker_pool
 from life_chart_api.errors import APIError, error_envelope
+from life_chart_api.inputs.birth_moment import birth_moment_cache_stats
 from life_chart_api.logging_config import configure_logging
 from life_chart_api.middleware.rate_limit import create_rate_limit_middleware
 from life_chart_api.middleware.metrics import metrics_middleware
@@ -18,19 +24,34 @@ from life_chart_api.routes.profile_compute import router as profile_compute_rout
 from life_chart_api.routes.profile_forecast import router as profile_forecast_router
 from life_chart_api.routes.profile_intersection import router as profile_intersection_router
 from life_chart_api.routes.profile_narrative import router as profile_narrative_router
+from life_chart_api.routes.profile_now import router as profile_now_router
+from life_chart_api.routes.profile_returns import router as profile_returns_router
 from life_chart_api.routes.profile_stub import router as profile_router
 from life_chart_api.routes.profile_timeline import router as profile_timeline_router
+from life_chart_api.routes.profile_transits import router as profile_transits_router
 from life_chart_api.settings import get_settings
+from life_chart_api.temporal.sky_table import sky_table_stats
+from life_chart_api.temporal.timeline_cache import timeline_cache_stats
 from life_chart_api.versioning import (
     API_VERSION,
     SCHEMA_VERSION_ERROR,
     SCHEMA_VERSION_FORECAST,
     SCHEMA_VERSION_NARRATIVE,
+    SCHEMA_VERSION_NOW,
     SCHEMA_VERSION_PROFILE,
+    SCHEMA_VERSION_RETURNS,
     SCHEMA_VERSION_TIMELINE,
+    SCHEMA_VERSION_TRANSITS,
 )
 
-app = FastAPI(title="Life Chart API")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    shutdown_worker_pool()
+
+
+app = FastAPI(title="Life Chart API", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -51,6 +72,9 @@ app.include_router(profile_timeline_router)
 app.include_router(profile_forecast_router)
 app.include_router(profile_narrative_router)
 app.include_router(profile_intersection_router)
+app.include_router(profile_returns_router)
+app.include_router(profile_now_router)
+app.include_router(profile_transits_router)
 settings = get_settings()
 configure_logging(settings.LOG_LEVEL)
 app.middleware("http")(create_rate_limit_middleware(max_requests=settings.RATE_LIMIT_PER_MIN))
@@ -81,6 +105,9 @@ def meta():
             "timeline": SCHEMA_VERSION_TIMELINE,
             "forecast": SCHEMA_VERSION_FORECAST,
             "narrative": SCHEMA_VERSION_NARRATIVE,
+            "returns": SCHEMA_VERSION_RETURNS,
+            "now": SCHEMA_VERSION_NOW,
+            "transits": SCHEMA_VERSION_TRANSITS,
             "error": SCHEMA_VERSION_ERROR,
         },
     }
@@ -88,7 +115,14 @@ def meta():
 
 @app.get("/metrics")
 def metrics():
-    return METRICS.snapshot()
+    snapshot = METRICS.snapshot()
+    snapshot["caches"] = {
+        "houses": house_cache_stats(),
+        "birth_moments": birth_moment_cache_stats(),
+        **timeline_cache_stats(),
+        "sky_table": sky_table_stats(),
+    }
+    return snapshot
 
 
 @app.get("/ready")
@@ -99,6 +133,7 @@ def ready():
         "checks": {
             "schemasLoaded": True,
             "rateLimiter": "ok",
+            "ephemeris": ephemeris_status(),
         },
     }
 
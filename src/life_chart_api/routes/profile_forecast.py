@@ -4,23 +4,19 @@ from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel, ConfigDict, Field
 
 from life_chart_api.inputs.query_parsers import (
+    parse_dasha_depth,
+    horizon_end,
     parse_granularity,
+    parse_horizons,
     parse_ymd,
     parse_include_csv,
     validate_range,
 )
-from life_chart_api.schemas.example_loader import load_example_json, stamp_meta_and_input
-from life_chart_api.synthesis.overlay_chinese import (
-    compute_chinese_tier1,
-    compute_chinese_tier2,
-    overlay_chinese_tier1,
-    overlay_chinese_tier2,
+from life_chart_api.temporal.cycle_sources import build_timeline_records
+from life_chart_api.temporal.forecast_view import (
+    build_forecast_response,
+    build_horizon_forecast_response,
 )
-from life_chart_api.temporal.chinese_luck_pillars import build_chinese_luck_pillar_cycles
-from life_chart_api.temporal.forecast_view import build_forecast_response
-from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
-from life_chart_api.temporal.vedic_dashas import build_vedic_dasha_cycles
-from life_chart_api.temporal.western_transits import build_western_transit_cycles
 from life_chart_api.settings import get_settings
 
 router = APIRouter(prefix="/profile", tags=["profile"])
@@ -43,6 +39,9 @@ class ForecastRequest(BaseModel):
     include: str | None = None
     granularity: str = "month"
     as_of: str | None = None
+    dasha_depth: str = "maha"
+    horizons: str | None = None
+    cache_stats: bool = False
 
 
 def build_forecast_from_payload(
@@ -50,9 +49,14 @@ def build_forecast_from_payload(
     *,
     raw_from: str | None = None,
     raw_to: str | None = None,
+    horizons: str | None = None,
+    cache_stats: bool = False,
 ) -> dict:
     settings = get_settings()
     granularity = parse_granularity(payload.granularity, path="query.granularity")
+    horizon_months = parse_horizons(horizons, path="query.horizons") if horizons else []
+    if horizon_months:
+        raw_to = horizon_end(raw_from or payload.from_, horizon_months[-1], path="query.from")
     range_from, range_to = validate_range(
         range_from=raw_from or payload.from_,
         range_to=raw_to or payload.to,
@@ -61,14 +65,17 @@ def build_forecast_from_payload(
         path_to="query.to",
         max_months=settings.MAX_FORECAST_RANGE_MONTHS,
         max_quarters=settings.MAX_RANGE_QUARTERS,
+        max_weeks=settings.MAX_RANGE_WEEKS,
+        max_days=settings.MAX_RANGE_DAYS,
     )
     include = parse_include_csv(
         payload.include,
-        allowed={"western", "vedic", "chinese"},
+        allowed={"western", "vedic", "chinese", "chinese_flow", "progressed", "numerology"},
         default="western,vedic,chinese",
         path="query.include",
     )
     as_of = parse_ymd(payload.as_of, path="query.as_of") if payload.as_of else None
+    dasha_depth = parse_dasha_depth(payload.dasha_depth, path="query.dasha_depth")
     birth = {
         "date": payload.date,
         "time": payload.time,
@@ -82,76 +89,55 @@ def build_forecast_from_payload(
         },
     }
 
-    cycles: list[dict] = []
-
-    if "vedic" in include:
-        cycles.extend(
-            build_vedic_dasha_cycles(
-                birth=birth,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    if "chinese" in include:
-        chinese = stamp_meta_and_input(
-            load_example_json("chinese_profile.example.json"),
-            payload.name or "Unknown",
-            birth,
-        )
-        tier1 = compute_chinese_tier1(
-            date_str=birth.get("date", ""),
-            time_str=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-        )
-        chinese = overlay_chinese_tier1(chinese, tier1)
-        tier2 = compute_chinese_tier2(
-            date_str=birth.get("date", ""),
-            time_str=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-            tier1=tier1,
-        )
-        chinese = overlay_chinese_tier2(chinese, tier2)
-        cycles.extend(
-            build_chinese_luck_pillar_cycles(
-                chinese_system_output=chinese,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    if "western" in include:
-        cycles.extend(
-            build_western_transit_cycles(
-                birth=birth,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    intersection_cycles = build_temporal_intersection_cycles(
-        cycles,
-        range_from,
-        range_to,
-        granularity,
-    )
-
-    return build_forecast_response(
+    records = build_timeline_records(
         name=payload.name,
         birth=birth,
+        include=include,
         range_from=range_from,
         range_to=range_to,
-        granularity=granularity,
         as_of=as_of,
-        intersection_cycles=intersection_cycles,
+        dasha_depth=dasha_depth,
+        granularity=granularity,
+        numerology_days=granularity == "day",
     )
+    intersection_cycles = records.intersection
+
+    if horizon_months:
+        response = build_horizon_forecast_response(
+            name=payload.name,
+            birth=birth,
+            range_from=range_from,
+            horizons=[
+                (f"{months}m", horizon_end(range_from, months, path="query.from"))
+                for months in horizon_months
+            ],
+            granularity=granularity,
+            as_of=as_of,
+            intersection_cycles=intersection_cycles,
+        )
+    else:
+        response = build_forecast_response(
+            name=payload.name,
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            granularity=granularity,
+            as_of=as_of,
+            intersection_cycles=intersection_cycles,
+        )
+    if cache_stats:
+        response["meta"] = {**response["meta"], "cache": records.cache}
+    return response
 
 
 @router.get("/forecast")
 def get_forecast(payload: ForecastRequest = Depends(), request: Request = None) -> dict:
     raw_from = request.query_params.get("from") if request else None
     raw_to = request.query_params.get("to") if request else None
-    return build_forecast_from_payload(payload, raw_from=raw_from, raw_to=raw_to)
+    return build_forecast_from_payload(
+        payload,
+        raw_from=raw_from,
+        raw_to=raw_to,
+        horizons=payload.horizons,
+        cache_stats=payload.cache_stats,
+    )
@@ -63,6 +63,7 @@ class NarrativeRequest(BaseModel):
     granularity: str = "month"
     as_of: str | None = None
     tone: str = "neutral"
+    dasha_depth: str = "maha"
 
 
 def _apply_query_overrides(
@@ -80,6 +81,8 @@ def _apply_query_overrides(
         updates["granularity"] = params.get("granularity", "")
     if "tone" in params:
         updates["tone"] = params.get("tone", "")
+    if "dasha_depth" in params:
+        updates["dasha_depth"] = params.get("dasha_depth", "")
 
     if updates:
         payload = payload.model_copy(update=updates)
@@ -422,6 +425,7 @@ def get_narrative(request: Request) -> dict:
     raw_from = _get_query_param(params, "from", use_query_prefix)
     raw_to = _get_query_param(params, "to", use_query_prefix)
     as_of = _get_query_param(params, "as_of", use_query_prefix)
+    dasha_depth = _get_query_param(params, "dasha_depth", use_query_prefix)
 
     payload = NarrativeRequest.model_validate(
         {
@@ -438,6 +442,7 @@ def get_narrative(request: Request) -> dict:
             "granularity": granularity or "month",
             "tone": tone_value or "neutral",
             "as_of": as_of,
+            "dasha_depth": dasha_depth or "maha",
         }
     )
     forecast = build_forecast_from_payload(payload, raw_from=raw_from, raw_to=raw_to)
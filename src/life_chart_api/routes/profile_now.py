@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, ConfigDict
+
+from life_chart_api.inputs.query_parsers import (
+    parse_dasha_depth,
+    parse_granularity,
+    parse_include_csv,
+    parse_ymd,
+)
+from life_chart_api.temporal.cycle_sources import build_now_records
+from life_chart_api.temporal.models import cycles_to_dicts
+from life_chart_api.versioning import SCHEMA_VERSION_NOW
+
+router = APIRouter(prefix="/profile", tags=["profile"])
+
+
+class NowRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    name: str | None = None
+    date: str
+    time: str
+    timezone: str
+    city: str
+    region: str
+    country: str
+    lat: float
+    lon: float
+    as_of: str | None = None
+    include: str | None = None
+    granularity: str = "day"
+    dasha_depth: str = "maha"
+
+
+@router.get("/now")
+def get_now(payload: NowRequest = Depends()) -> dict:
+    if payload.as_of:
+        as_of = parse_ymd(payload.as_of, path="query.as_of")
+    else:
+        as_of = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    include = parse_include_csv(
+        payload.include,
+        allowed={"western", "vedic", "chinese", "chinese_flow", "progressed", "numerology"},
+        default="western,vedic,chinese",
+        path="query.include",
+    )
+    granularity = parse_granularity(payload.granularity, path="query.granularity")
+    dasha_depth = parse_dasha_depth(payload.dasha_depth, path="query.dasha_depth")
+    birth = {
+        "date": payload.date,
+        "time": payload.time,
+        "timezone": payload.timezone,
+        "location": {
+            "city": payload.city,
+            "region": payload.region,
+            "country": payload.country,
+            "lat": payload.lat,
+            "lon": payload.lon,
+        },
+    }
+
+    records = build_now_records(
+        birth=birth,
+        include=include,
+        as_of=as_of,
+        dasha_depth=dasha_depth,
+        granularity=granularity,
+    )
+
+    response = {
+        "meta": {"version": SCHEMA_VERSION_NOW, "as_of": as_of, "granularity": granularity},
+        "input": {"birth": birth},
+        "active": cycles_to_dicts(records.active),
+        "window": records.window.to_dict() if records.window is not None else None,
+    }
+    if payload.name:
+        response["input"]["name"] = payload.name
+    return response
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, ConfigDict, Field
+
+from life_chart_api.astrology.western.returns import build_returns_response
+from life_chart_api.ephemeris.workers import get_worker_pool
+from life_chart_api.inputs.query_parsers import (
+    parse_range_date,
+    parse_return_body,
+    parse_return_count,
+)
+
+router = APIRouter(prefix="/profile", tags=["profile"])
+
+MAX_RETURN_COUNT = 24
+
+
+class ReturnsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    name: str | None = None
+    date: str
+    time: str
+    timezone: str
+    city: str
+    region: str
+    country: str
+    lat: float
+    lon: float
+    body: str = "sun"
+    count: int = 1
+    from_: str = Field("2026-01", alias="from")
+
+
+@router.get("/returns")
+def get_returns(payload: ReturnsRequest = Depends(), request: Request = None) -> dict:
+    raw_from = request.query_params.get("from") if request else None
+    body = parse_return_body(payload.body, path="query.body")
+    count = parse_return_count(payload.count, path="query.count", max_count=MAX_RETURN_COUNT)
+    _, start = parse_range_date(raw_from or payload.from_, path="query.from", end=False)
+    birth = {
+        "date": payload.date,
+        "time": payload.time,
+        "timezone": payload.timezone,
+        "location": {
+            "city": payload.city,
+            "region": payload.region,
+            "country": payload.country,
+            "lat": payload.lat,
+            "lon": payload.lon,
+        },
+    }
+
+    return get_worker_pool().run(
+        build_returns_response,
+        name=payload.name,
+        birth=birth,
+        body=body,
+        count=count,
+        start=start,
+    )
@@ -3,25 +3,16 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel, ConfigDict, Field
 
-from life_chart_api.schemas.example_loader import load_example_json, stamp_meta_and_input
-from life_chart_api.synthesis.overlay_chinese import (
-    compute_chinese_tier1,
-    compute_chinese_tier2,
-    overlay_chinese_tier1,
-    overlay_chinese_tier2,
-)
 from life_chart_api.inputs.query_parsers import (
+    parse_dasha_depth,
     parse_granularity,
     parse_ymd,
     parse_include_csv,
     validate_range,
 )
-from life_chart_api.temporal.chinese_luck_pillars import build_chinese_luck_pillar_cycles
+from life_chart_api.temporal.cycle_sources import build_timeline_records
 from life_chart_api.temporal.scaffold import build_timeline_scaffold
-from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
-from life_chart_api.temporal.vedic_dashas import build_vedic_dasha_cycles
-from life_chart_api.temporal.western_transits import build_western_transit_cycles
-from life_chart_api.temporal.models import sort_cycles
+from life_chart_api.temporal.models import cycles_to_dicts, sort_records
 from life_chart_api.settings import get_settings
 
 router = APIRouter(prefix="/profile", tags=["profile"])
@@ -98,6 +89,8 @@ class TimelineRequest(BaseModel):
     include: str | None = None
     as_of: str | None = None
     granularity: str = "month"
+    dasha_depth: str = "maha"
+    cache_stats: bool = False
 
 
 @router.get("/timeline")
@@ -114,14 +107,17 @@ def get_timeline(payload: TimelineRequest = Depends(), request: Request = None)
         path_to="query.to",
         max_months=settings.MAX_TIMELINE_RANGE_MONTHS,
         max_quarters=settings.MAX_RANGE_QUARTERS,
+        max_weeks=settings.MAX_RANGE_WEEKS,
+        max_days=settings.MAX_RANGE_DAYS,
     )
     include = parse_include_csv(
         payload.include,
-        allowed={"vedic", "chinese", "western", "intersection_time"},
+        allowed={"vedic", "chinese", "western", "progressed", "chinese_flow", "numerology", "intersection_time"},
         default="vedic",
         path="query.include",
     )
     as_of = parse_ymd(payload.as_of, path="query.as_of") if payload.as_of else None
+    dasha_depth = parse_dasha_depth(payload.dasha_depth, path="query.dasha_depth")
     birth = {
         "date": payload.date,
         "time": payload.time,
@@ -135,74 +131,27 @@ def get_timeline(payload: TimelineRequest = Depends(), request: Request = None)
         },
     }
 
-    cycles: list[dict] = []
-
-    if "vedic" in include:
-        cycles.extend(
-            build_vedic_dasha_cycles(
-                birth=birth,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    if "chinese" in include:
-        chinese = stamp_meta_and_input(
-            load_example_json("chinese_profile.example.json"),
-            payload.name or "Unknown",
-            birth,
-        )
-        tier1 = compute_chinese_tier1(
-            date_str=birth.get("date", ""),
-            time_str=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-        )
-        chinese = overlay_chinese_tier1(chinese, tier1)
-        tier2 = compute_chinese_tier2(
-            date_str=birth.get("date", ""),
-            time_str=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-            tier1=tier1,
-        )
-        chinese = overlay_chinese_tier2(chinese, tier2)
-        cycles.extend(
-            build_chinese_luck_pillar_cycles(
-                chinese_system_output=chinese,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    if "western" in include:
-        cycles.extend(
-            build_western_transit_cycles(
-                birth=birth,
-                range_from=range_from,
-                range_to=range_to,
-                as_of=as_of,
-            )
-        )
-
-    if "intersection_time" in include:
-        cycles.extend(
-            build_temporal_intersection_cycles(
-                cycles,
-                range_from,
-                range_to,
-                granularity,
-            )
-        )
-
-    cycles = sort_cycles(cycles)
+    records = build_timeline_records(
+        name=payload.name,
+        birth=birth,
+        include=include,
+        range_from=range_from,
+        range_to=range_to,
+        as_of=as_of,
+        dasha_depth=dasha_depth,
+        granularity=granularity if "intersection_time" in include else None,
+        numerology_days=granularity == "day",
+    )
+    cycles = sort_records(records.cycles + records.intersection)
 
     response = {
         "meta": {"version": "phase2.3"},
         "input": {"birth": birth},
         "range": {"from": range_from, "to": range_to},
-        "cycles": cycles,
+        "cycles": cycles_to_dicts(cycles),
     }
+    if payload.cache_stats:
+        response["meta"]["cache"] = records.cache
     if payload.name:
         response["input"]["name"] = payload.name
     return response
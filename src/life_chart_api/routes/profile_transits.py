@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, ConfigDict, Field
+
+from life_chart_api.inputs.query_parsers import validate_range
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.daily_transits import build_daily_transit_response
+from life_chart_api.temporal.models import parse_cycle_date
+
+router = APIRouter(prefix="/profile", tags=["profile"])
+
+
+class DailyTransitsRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    name: str | None = None
+    date: str
+    time: str
+    timezone: str
+    city: str
+    region: str
+    country: str
+    lat: float
+    lon: float
+    from_: str = Field("2026-01", alias="from")
+    to: str = Field("2026-01")
+
+
+@router.get("/transits/daily")
+def get_daily_transits(payload: DailyTransitsRequest = Depends(), request: Request = None) -> dict:
+    settings = get_settings()
+    raw_from = request.query_params.get("from") if request else None
+    raw_to = request.query_params.get("to") if request else None
+    range_from, range_to = validate_range(
+        range_from=raw_from or payload.from_,
+        range_to=raw_to or payload.to,
+        granularity="day",
+        path_from="query.from",
+        path_to="query.to",
+        max_days=settings.MAX_DAILY_TRANSIT_DAYS,
+    )
+    birth = {
+        "date": payload.date,
+        "time": payload.time,
+        "timezone": payload.timezone,
+        "location": {
+            "city": payload.city,
+            "region": payload.region,
+            "country": payload.country,
+            "lat": payload.lat,
+            "lon": payload.lon,
+        },
+    }
+
+    range_start: date = parse_cycle_date(range_from, end=False)
+    range_end: date = parse_cycle_date(range_to, end=True)
+    return build_daily_transit_response(
+        name=payload.name,
+        birth=birth,
+        range_start=range_start,
+        range_end=range_end,
+    )
@@ -4,6 +4,8 @@ from typing import Any
 
 from life_chart_api.astrology.western.compute import compute_western_features
 from life_chart_api.astrology.vedic.compute import compute_vedic_features
+from life_chart_api.ephemeris.natal import natal_context_for_birth
+from life_chart_api.ephemeris.workers import get_worker_pool
 from life_chart_api.numerology.adapter import build_numerology_response_v1
 from life_chart_api.schemas.example_loader import load_example_json, stamp_meta_and_input
 from life_chart_api.synthesis.overlay_chinese import (
@@ -25,29 +27,41 @@ def build_profile_response(
     vedic = stamp_meta_and_input(load_example_json("vedic_profile.example.json"), name, birth)
     chinese = stamp_meta_and_input(load_example_json("chinese_profile.example.json"), name, birth)
 
+    pool = get_worker_pool()
     try:
-        location = birth.get("location", {})
-        computed = compute_western_features(
-            date=birth.get("date", ""),
-            time=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-            lat=location.get("lat", 0.0),
-            lon=location.get("lon", 0.0),
-        )
+        natal = pool.run(natal_context_for_birth, birth)
+    except Exception:
+        natal = None
+
+    location = birth.get("location", {})
+    western_features = pool.submit(
+        compute_western_features,
+        date=birth.get("date", ""),
+        time=birth.get("time", ""),
+        tz=birth.get("timezone", ""),
+        lat=location.get("lat", 0.0),
+        lon=location.get("lon", 0.0),
+        natal=natal,
+    )
+    vedic_features = pool.submit(
+        compute_vedic_features,
+        date=birth.get("date", ""),
+        time=birth.get("time", ""),
+        tz=birth.get("timezone", ""),
+        lat=location.get("lat", 0.0),
+        lon=location.get("lon", 0.0),
+        natal=natal,
+    )
+
+    try:
+        computed = western_features.result()
         western = overlay_western_tier1(western, computed)
         western = overlay_western_tier2(western, computed)
     except Exception:
         pass
 
     try:
-        location = birth.get("location", {})
-        computed = compute_vedic_features(
-            date=birth.get("date", ""),
-            time=birth.get("time", ""),
-            tz=birth.get("timezone", ""),
-            lat=location.get("lat", 0.0),
-            lon=location.get("lon", 0.0),
-        )
+        computed = vedic_features.result()
         vedic = overlay_vedic_tier1(vedic, computed)
         vedic = overlay_vedic_tier2(vedic, computed)
     except Exception:
@@ -14,6 +14,19 @@ class Settings(BaseModel):
     MAX_FORECAST_RANGE_MONTHS: int = 60
     MAX_TIMELINE_RANGE_MONTHS: int = 60
     MAX_RANGE_QUARTERS: int = 80
+    MAX_RANGE_WEEKS: int = 104
+    MAX_RANGE_DAYS: int = 92
+    WESTERN_TRANSIT_METHOD: Literal["solver", "scan", "index"] = "solver"
+    WESTERN_EVENT_CALL_BUDGET: int = 400
+    WESTERN_TRANSIT_CALL_CAP: int = 4000
+    EPHEMERIS_BACKEND: Literal["swiss", "moshier", "table"] | None = None
+    EPHEMERIS_TABLE_PATH: str | None = None
+    EPHEMERIS_PATH: str | None = None
+    EPHEMERIS_WORKERS: int = 0
+    TIMELINE_CYCLE_CACHE_BLOCKS: int = 4096
+    TIMELINE_WINDOW_CACHE_SIZE: int = 65536
+    SKY_TABLE_CACHE_MONTHS: int = 600
+    MAX_DAILY_TRANSIT_DAYS: int = 366
 
 
 def _env_value(key: str, default: str | None = None) -> str | None:
@@ -34,6 +47,19 @@ def load_settings() -> Settings:
         "MAX_FORECAST_RANGE_MONTHS": _env_value("MAX_FORECAST_RANGE_MONTHS", "60"),
         "MAX_TIMELINE_RANGE_MONTHS": _env_value("MAX_TIMELINE_RANGE_MONTHS", "60"),
         "MAX_RANGE_QUARTERS": _env_value("MAX_RANGE_QUARTERS", "80"),
+        "MAX_RANGE_WEEKS": _env_value("MAX_RANGE_WEEKS", "104"),
+        "MAX_RANGE_DAYS": _env_value("MAX_RANGE_DAYS", "92"),
+        "WESTERN_TRANSIT_METHOD": _env_value("WESTERN_TRANSIT_METHOD", "solver"),
+        "WESTERN_EVENT_CALL_BUDGET": _env_value("WESTERN_EVENT_CALL_BUDGET", "400"),
+        "WESTERN_TRANSIT_CALL_CAP": _env_value("WESTERN_TRANSIT_CALL_CAP", "4000"),
+        "EPHEMERIS_BACKEND": _env_value("EPHEMERIS_BACKEND"),
+        "EPHEMERIS_TABLE_PATH": _env_value("EPHEMERIS_TABLE_PATH"),
+        "EPHEMERIS_PATH": _env_value("EPHEMERIS_PATH"),
+        "EPHEMERIS_WORKERS": _env_value("EPHEMERIS_WORKERS", "0"),
+        "TIMELINE_CYCLE_CACHE_BLOCKS": _env_value("TIMELINE_CYCLE_CACHE_BLOCKS", "4096"),
+        "TIMELINE_WINDOW_CACHE_SIZE": _env_value("TIMELINE_WINDOW_CACHE_SIZE", "65536"),
+        "SKY_TABLE_CACHE_MONTHS": _env_value("SKY_TABLE_CACHE_MONTHS", "600"),
+        "MAX_DAILY_TRANSIT_DAYS": _env_value("MAX_DAILY_TRANSIT_DAYS", "366"),
     }
 
     def to_int(value: str, field: str) -> int:
@@ -50,10 +76,26 @@ def load_settings() -> Settings:
             "MAX_FORECAST_RANGE_MONTHS": to_int(raw["MAX_FORECAST_RANGE_MONTHS"], "MAX_FORECAST_RANGE_MONTHS"),
             "MAX_TIMELINE_RANGE_MONTHS": to_int(raw["MAX_TIMELINE_RANGE_MONTHS"], "MAX_TIMELINE_RANGE_MONTHS"),
             "MAX_RANGE_QUARTERS": to_int(raw["MAX_RANGE_QUARTERS"], "MAX_RANGE_QUARTERS"),
+            "MAX_RANGE_WEEKS": to_int(raw["MAX_RANGE_WEEKS"], "MAX_RANGE_WEEKS"),
+            "MAX_RANGE_DAYS": to_int(raw["MAX_RANGE_DAYS"], "MAX_RANGE_DAYS"),
+            "WESTERN_TRANSIT_METHOD": raw["WESTERN_TRANSIT_METHOD"],
+            "WESTERN_EVENT_CALL_BUDGET": to_int(raw["WESTERN_EVENT_CALL_BUDGET"], "WESTERN_EVENT_CALL_BUDGET"),
+            "WESTERN_TRANSIT_CALL_CAP": to_int(raw["WESTERN_TRANSIT_CALL_CAP"], "WESTERN_TRANSIT_CALL_CAP"),
+            "EPHEMERIS_BACKEND": raw["EPHEMERIS_BACKEND"] or None,
+            "EPHEMERIS_TABLE_PATH": raw["EPHEMERIS_TABLE_PATH"] or None,
+            "EPHEMERIS_PATH": raw["EPHEMERIS_PATH"] or None,
+            "EPHEMERIS_WORKERS": to_int(raw["EPHEMERIS_WORKERS"], "EPHEMERIS_WORKERS"),
+            "TIMELINE_CYCLE_CACHE_BLOCKS": to_int(raw["TIMELINE_CYCLE_CACHE_BLOCKS"], "TIMELINE_CYCLE_CACHE_BLOCKS"),
+            "TIMELINE_WINDOW_CACHE_SIZE": to_int(raw["TIMELINE_WINDOW_CACHE_SIZE"], "TIMELINE_WINDOW_CACHE_SIZE"),
+            "SKY_TABLE_CACHE_MONTHS": to_int(raw["SKY_TABLE_CACHE_MONTHS"], "SKY_TABLE_CACHE_MONTHS"),
+            "MAX_DAILY_TRANSIT_DAYS": to_int(raw["MAX_DAILY_TRANSIT_DAYS"], "MAX_DAILY_TRANSIT_DAYS"),
         }
     except ValueError as exc:
         raise RuntimeError(f"Invalid settings: {exc}") from exc
 
+    if parsed["EPHEMERIS_BACKEND"] == "table" and not parsed["EPHEMERIS_TABLE_PATH"]:
+        raise RuntimeError("Invalid settings: EPHEMERIS_BACKEND=table requires EPHEMERIS_TABLE_PATH")
+
     if parsed["ENV"] == "test":
         parsed["RATE_LIMIT_PER_MIN"] = max(parsed["RATE_LIMIT_PER_MIN"], 1000)
 
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from zoneinfo import ZoneInfo
 from typing import Any
 
+from life_chart_api.inputs.birth_moment import birth_local
+
 _STEMS = ["jia", "yi", "bing", "ding", "wu", "ji", "geng", "xin", "ren", "gui"]
 _BRANCHES = ["zi", "chou", "yin", "mao", "chen", "si", "wu", "wei", "shen", "you", "xu", "hai"]
 _MONTH_BRANCHES = ["yin", "mao", "chen", "si", "wu", "wei", "shen", "you", "xu", "hai", "zi", "chou"]
@@ -116,23 +117,6 @@ class ChineseTier2:
     luck_current: dict[str, Any]
 
 
-def _normalize_time(time_str: str) -> str:
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{time_str}:00"
-    if len(parts) == 3:
-        return time_str
-    raise ValueError("time must be HH:MM or HH:MM:SS")
-
-
-def _local_datetime(date_str: str, time_str: str, tz_name: str) -> datetime:
-    normalized_time = _normalize_time(time_str)
-    tzinfo = ZoneInfo(tz_name)
-    return datetime.strptime(
-        f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S"
-    ).replace(tzinfo=tzinfo)
-
-
 def _sexagenary_index(base: date, target: date) -> int:
     delta = (target - base).days
     return delta % 60
@@ -179,7 +163,7 @@ def _element_distribution(stems: list[str]) -> dict[str, float]:
 
 
 def compute_chinese_tier1(date_str: str, time_str: str, tz: str) -> ChineseTier1:
-    local_dt = _local_datetime(date_str, time_str, tz)
+    local_dt = birth_local(date_str, time_str, tz)
     year_stem, year_branch = _year_pillar(local_dt.year)
     month_stem, month_branch = _month_pillar(year_stem, local_dt.month)
     day_stem, day_branch = _day_pillar(local_dt)
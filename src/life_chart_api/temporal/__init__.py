@@ -1 +1,21 @@
-from .models import Cycle, clamp01, normalize_iso_ym, normalize_iso_ymd, sort_cycles, stable_id
+from .models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    normalize_iso_ym,
+    normalize_iso_ymd,
+    sort_cycles,
+    sort_records,
+    stable_id,
+)
+
+__all__ = [
+    "Cycle",
+    "clamp01",
+    "cycles_to_dicts",
+    "normalize_iso_ym",
+    "normalize_iso_ymd",
+    "sort_cycles",
+    "sort_records",
+    "stable_id",
+]
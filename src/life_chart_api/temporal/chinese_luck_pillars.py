@@ -3,7 +3,46 @@ from __future__ import annotations
 from datetime import date
 from typing import Any
 
-from life_chart_api.temporal.models import clamp01, normalize_iso_ym, sort_cycles, stable_id
+from life_chart_api.synthesis.overlay_chinese import (
+    _BRANCHES,
+    _STEM_META,
+    ChineseTier1,
+    ChineseTier2,
+    _month_pillar,
+    _ten_god,
+    _year_pillar,
+    compute_chinese_tier1,
+    compute_chinese_tier2,
+)
+from life_chart_api.temporal.models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    normalize_iso_ym,
+    sort_records,
+    stable_id,
+)
+
+_NATAL_PILLARS = ("year", "month", "day", "hour")
+
+_TEN_GOD_CYCLE_DOMAINS = {
+    "friend": "personality",
+    "robWealth": "money",
+    "eatingGod": "mind",
+    "hurtingOfficer": "career",
+    "directWealth": "money",
+    "indirectWealth": "money",
+    "directOfficer": "career",
+    "sevenKillings": "career",
+    "directResource": "growth",
+    "indirectResource": "growth",
+}
+
+# (favourable, unfavourable, neutral) base intensity per flowing pillar kind.
+_FLOWING_INTENSITY = {
+    "annual_pillar": (0.55, 0.6, 0.45),
+    "monthly_pillar": (0.35, 0.4, 0.3),
+}
 
 
 def _pillar_label(pillar: dict[str, Any]) -> str:
@@ -32,6 +71,23 @@ def build_chinese_luck_pillar_cycles(
     range_to: str,
     as_of: str | None = None,
 ) -> list[dict[str, Any]]:
+    return cycles_to_dicts(
+        build_chinese_luck_pillar_records(
+            chinese_system_output=chinese_system_output,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+        )
+    )
+
+
+def build_chinese_luck_pillar_records(
+    *,
+    chinese_system_output: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+) -> list[Cycle]:
     range_from_norm = normalize_iso_ym(range_from)
     range_to_norm = normalize_iso_ym(range_to)
 
@@ -53,7 +109,7 @@ def build_chinese_luck_pillar_cycles(
     unfavourable = chinese_system_output.get("elements", {}).get("unfavourable", [])
     dm_strength = chinese_system_output.get("dayMaster", {}).get("strength")
 
-    cycles: list[dict[str, Any]] = []
+    cycles: list[Cycle] = []
     for pillar_entry in pillars:
         if not isinstance(pillar_entry, dict):
             continue
@@ -102,17 +158,17 @@ def build_chinese_luck_pillar_cycles(
             evidence_note = "Approx: placeholder range used."
 
         cycles.append(
-            {
-                "cycleId": stable_id(["chinese", "luck_pillar", label, start_str, end_str]),
-                "system": "chinese",
-                "kind": "luck_pillar",
-                "domain": "growth",
-                "themes": themes,
-                "start": start_str,
-                "end": end_str,
-                "intensity": clamp01(intensity),
-                "polarity": polarity,
-                "evidence": [
+            Cycle(
+                cycle_id=stable_id(["chinese", "luck_pillar", label, start_str, end_str]),
+                system="chinese",
+                kind="luck_pillar",
+                domain="growth",
+                themes=themes,
+                start=start_str,
+                end=end_str,
+                intensity=clamp01(intensity),
+                polarity=polarity,
+                evidence=[
                     {
                         "source": "chinese.luck_pillars",
                         "value": {
@@ -125,8 +181,156 @@ def build_chinese_luck_pillar_cycles(
                         "note": evidence_note,
                     }
                 ],
-                "notes": ["approx"] if approx else [],
+                notes=["approx"] if approx else [],
+            )
+        )
+
+    return sort_records(cycles)
+
+
+def _branch_relation(branch: str, other: str) -> str | None:
+    first = _BRANCHES.index(branch)
+    second = _BRANCHES.index(other)
+    if (first - second) % 12 == 6:
+        return "clash"
+    if (first + second) % 12 == 1:
+        return "combination"
+    return None
+
+
+def _flowing_record(
+    *,
+    kind: str,
+    stem: str,
+    branch: str,
+    start: str,
+    end: str,
+    tier1: ChineseTier1,
+    tier2: ChineseTier2,
+) -> Cycle:
+    label = f"{stem}-{branch}"
+    element = _STEM_META[stem][0]
+    ten_god = _ten_god(tier1.day_master["element"], tier1.day_master["yinYang"], stem)
+    clashes: list[str] = []
+    combinations: list[str] = []
+    for key in _NATAL_PILLARS:
+        relation = _branch_relation(branch, tier1.pillars[key]["branch"])
+        if relation == "clash":
+            clashes.append(key)
+        elif relation == "combination":
+            combinations.append(key)
+
+    favourable_base, unfavourable_base, neutral_base = _FLOWING_INTENSITY[kind]
+    if element in tier2.favourable_elements:
+        intensity = favourable_base
+        polarity = "supporting"
+    elif element in tier2.unfavourable_elements:
+        intensity = unfavourable_base
+        polarity = "challenging"
+    else:
+        intensity = neutral_base
+        polarity = "challenging" if clashes else "supporting" if combinations else "neutral"
+    intensity += 0.1 * len(clashes) + 0.05 * len(combinations)
+
+    themes = [f"pillar:{label}", f"element:{element}", f"tenGod:{ten_god}"]
+    themes.extend(f"clash:{key}" for key in clashes)
+    themes.extend(f"combination:{key}" for key in combinations)
+    period = "Annual" if kind == "annual_pillar" else "Monthly"
+
+    return Cycle(
+        cycle_id=stable_id(["chinese", kind, label, start, end]),
+        system="chinese",
+        kind=kind,
+        domain=_TEN_GOD_CYCLE_DOMAINS[ten_god],
+        themes=themes,
+        start=start,
+        end=end,
+        intensity=clamp01(intensity),
+        polarity=polarity,
+        evidence=[
+            {
+                "source": "chinese.flowing_pillars",
+                "value": {
+                    "label": label,
+                    "element": element,
+                    "tenGod": ten_god,
+                    "clashes": clashes,
+                    "combinations": combinations,
+                },
+                "weight": 0.6,
+                "note": f"{period} pillar from the sexagenary cycle.",
             }
+        ],
+        notes=[],
+    )
+
+
+def build_chinese_flowing_pillar_cycles(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+) -> list[dict[str, Any]]:
+    return cycles_to_dicts(
+        build_chinese_flowing_pillar_records(
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+        )
+    )
+
+
+def build_chinese_flowing_pillar_records(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    tier1: ChineseTier1 | None = None,
+    tier2: ChineseTier2 | None = None,
+) -> list[Cycle]:
+    date_str = birth.get("date", "")
+    time_str = birth.get("time", "")
+    tz = birth.get("timezone", "")
+    if tier1 is None:
+        tier1 = compute_chinese_tier1(date_str, time_str, tz)
+    if tier2 is None:
+        tier2 = compute_chinese_tier2(date_str, time_str, tz, tier1=tier1)
+
+    from_year, from_month = map(int, normalize_iso_ym(range_from).split("-"))
+    to_year, to_month = map(int, normalize_iso_ym(range_to).split("-"))
+
+    cycles: list[Cycle] = []
+    for year in range(from_year, to_year + 1):
+        year_stem, year_branch = _year_pillar(year)
+        cycles.append(
+            _flowing_record(
+                kind="annual_pillar",
+                stem=year_stem,
+                branch=year_branch,
+                start=f"{year:04d}-01",
+                end=f"{year:04d}-12",
+                tier1=tier1,
+                tier2=tier2,
+            )
         )
+        first = from_month if year == from_year else 1
+        last = to_month if year == to_year else 12
+        for month in range(first, last + 1):
+            stem, branch = _month_pillar(year_stem, month)
+            month_str = f"{year:04d}-{month:02d}"
+            cycles.append(
+                _flowing_record(
+                    kind="monthly_pillar",
+                    stem=stem,
+                    branch=branch,
+                    start=month_str,
+                    end=month_str,
+                    tier1=tier1,
+                    tier2=tier2,
+                )
+            )
 
-    return sort_cycles(cycles)
+    return sort_records(cycles)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.temporal.transit_solver import (
+    TransitWindow,
+    find_root,
+    peak_inside,
+    rank_window,
+    sample_nodes,
+    wrap180,
+)
+
+_J2000 = 2451545.0
+_BLOCK_DAYS = 3652.5
+_INDEX_STEP_DAYS = {
+    swe.SUN: 2.0,
+    swe.MOON: 0.5,
+    swe.MERCURY: 2.0,
+    swe.VENUS: 2.0,
+    swe.MARS: 2.0,
+}
+_DEFAULT_INDEX_STEP_DAYS = 5.0
+_MERGE_GAP_DAYS = 1.0 / 1440.0
+
+
+@dataclass(frozen=True)
+class CrossingSegment:
+    start_jd: float
+    end_jd: float
+    lon_start: float
+    lon_end: float
+    direction: int
+    first_node: int
+    last_node: int
+
+
+class _IndexBlock:
+    __slots__ = ("jds", "lons", "speeds", "segments", "segment_starts")
+
+    def __init__(self, nodes: list[tuple[float, float, float]]) -> None:
+        self.jds = [node[0] for node in nodes]
+        self.speeds = [node[2] for node in nodes]
+        lons = [nodes[0][1]]
+        for _, lon, _ in nodes[1:]:
+            lons.append(lons[-1] + wrap180(lon - lons[-1] % 360.0))
+        self.lons = lons
+
+        segments: list[CrossingSegment] = []
+        first = 0
+        for idx in range(1, len(nodes)):
+            is_last = idx == len(nodes) - 1
+            turning = (
+                not is_last
+                and (self.speeds[idx - 1] < 0.0) != (self.speeds[idx + 1] < 0.0)
+                and abs(self.speeds[idx]) < min(abs(self.speeds[idx - 1]), abs(self.speeds[idx + 1]))
+            )
+            if turning or is_last:
+                direction = 1 if lons[idx] >= lons[first] else -1
+                segments.append(
+                    CrossingSegment(
+                        start_jd=self.jds[first],
+                        end_jd=self.jds[idx],
+                        lon_start=lons[first],
+                        lon_end=lons[idx],
+                        direction=direction,
+                        first_node=first,
+                        last_node=idx,
+                    )
+                )
+                first = idx
+        self.segments = segments
+        self.segment_starts = [segment.start_jd for segment in segments]
+
+    def _hermite(self, idx: int, jd_ut: float) -> tuple[float, float]:
+        h = self.jds[idx + 1] - self.jds[idx]
+        s = (jd_ut - self.jds[idx]) / h
+        p0, p1 = self.lons[idx], self.lons[idx + 1]
+        m0, m1 = self.speeds[idx], self.speeds[idx + 1]
+        s2 = s * s
+        s3 = s2 * s
+        value = (
+            (2.0 * s3 - 3.0 * s2 + 1.0) * p0
+            + (s3 - 2.0 * s2 + s) * h * m0
+            + (-2.0 * s3 + 3.0 * s2) * p1
+            + (s3 - s2) * h * m1
+        )
+        slope = (
+            (6.0 * s2 - 6.0 * s) / h * p0
+            + (3.0 * s2 - 4.0 * s + 1.0) * m0
+            + (-6.0 * s2 + 6.0 * s) / h * p1
+            + (3.0 * s2 - 2.0 * s) * m1
+        )
+        return value, slope
+
+    def longitude(self, jd_ut: float) -> float:
+        idx = min(max(bisect_right(self.jds, jd_ut) - 1, 0), len(self.jds) - 2)
+        return self._hermite(idx, jd_ut)[0]
+
+    def time_of(self, segment: CrossingSegment, value: float) -> float:
+        lons = self.lons
+        lo, hi = segment.first_node, segment.last_node
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if (lons[mid] - value) * segment.direction < 0.0:
+                lo = mid
+            else:
+                hi = mid
+        idx = lo
+
+        def fn(jd_ut: float) -> tuple[float, float]:
+            lon, slope = self._hermite(idx, jd_ut)
+            return lon - value, slope
+
+        return find_root(fn, self.jds[idx], self.jds[idx + 1], lons[idx] - value, lons[idx + 1] - value)
+
+
+class CrossingIndex:
+    def __init__(
+        self,
+        position: Callable[[float, int], tuple[float, float]] = body_position,
+        block_days: float = _BLOCK_DAYS,
+    ) -> None:
+        self._position = position
+        self._block_days = block_days
+        self._blocks: dict[tuple[int, int], _IndexBlock] = {}
+        self._lock = Lock()
+
+    def _block(self, body: int, block_id: int) -> _IndexBlock:
+        key = (body, block_id)
+        block = self._blocks.get(key)
+        if block is not None:
+            return block
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                start = _J2000 + block_id * self._block_days
+                position = self._position
+                nodes = sample_nodes(
+                    lambda jd_ut: position(jd_ut, body),
+                    start,
+                    start + self._block_days,
+                    _INDEX_STEP_DAYS.get(body, _DEFAULT_INDEX_STEP_DAYS),
+                )
+                block = _IndexBlock(nodes)
+                self._blocks[key] = block
+        return block
+
+    def _block_ids(self, jd_start: float, jd_end: float) -> range:
+        first = math.floor((jd_start - _J2000) / self._block_days)
+        last = math.floor((jd_end - _J2000) / self._block_days)
+        return range(first, last + 1)
+
+    def windows(
+        self, body: int, target_lon: float, orb: float, jd_start: float, jd_end: float
+    ) -> list[TransitWindow]:
+        pieces: list[TransitWindow] = []
+        for block_id in self._block_ids(jd_start, jd_end):
+            block = self._block(body, block_id)
+            first = max(bisect_right(block.segment_starts, jd_start) - 1, 0)
+            for segment in block.segments[first:]:
+                if segment.start_jd > jd_end:
+                    break
+                seg_start = max(segment.start_jd, jd_start)
+                seg_end = min(segment.end_jd, jd_end)
+                if seg_end < seg_start:
+                    continue
+                pieces.extend(self._segment_pieces(block, segment, seg_start, seg_end, target_lon, orb))
+
+        pieces.sort(key=lambda piece: piece.start_jd)
+        merged: list[TransitWindow] = []
+        for piece in pieces:
+            if merged and piece.start_jd <= merged[-1].end_jd + _MERGE_GAP_DAYS:
+                prev = merged[-1]
+                peak = min(prev, piece, key=rank_window)
+                merged[-1] = TransitWindow(
+                    start_jd=prev.start_jd,
+                    end_jd=max(prev.end_jd, piece.end_jd),
+                    peak_jd=peak.peak_jd,
+                    peak_delta=peak.peak_delta,
+                    peak_longitude=peak.peak_longitude,
+                )
+            else:
+                merged.append(piece)
+        return merged
+
+    def _segment_pieces(
+        self,
+        block: _IndexBlock,
+        segment: CrossingSegment,
+        seg_start: float,
+        seg_end: float,
+        target_lon: float,
+        orb: float,
+    ) -> list[TransitWindow]:
+        lon_a = block.longitude(seg_start)
+        lon_b = block.longitude(seg_end)
+        low, high = min(lon_a, lon_b), max(lon_a, lon_b)
+        pieces = []
+        turn = math.floor((low - orb - target_lon) / 360.0)
+        while target_lon + 360.0 * turn - orb <= high:
+            target = target_lon + 360.0 * turn
+            turn += 1
+            if target + orb < low:
+                continue
+            start_jd = seg_start if abs(lon_a - target) <= orb else block.time_of(
+                segment, target - orb if lon_a < target else target + orb
+            )
+            end_jd = seg_end if abs(lon_b - target) <= orb else block.time_of(
+                segment, target - orb if lon_b < target else target + orb
+            )
+            if low <= target <= high:
+                peak_jd = block.time_of(segment, target)
+                peak_lon = target
+            elif abs(lon_a - target) <= abs(lon_b - target):
+                peak_jd, peak_lon = seg_start, lon_a
+            else:
+                peak_jd, peak_lon = seg_end, lon_b
+            pieces.append(
+                TransitWindow(
+                    start_jd=start_jd,
+                    end_jd=end_jd,
+                    peak_jd=peak_jd,
+                    peak_delta=abs(peak_lon - target),
+                    peak_longitude=peak_lon % 360.0,
+                )
+            )
+        return pieces
+
+    def window(
+        self,
+        body: int,
+        natal_lon: float,
+        aspect_angle: float,
+        orb: float,
+        jd_start: float,
+        jd_end: float,
+        peak_start: float | None = None,
+        peak_end: float | None = None,
+    ) -> TransitWindow | None:
+        targets = sorted({(natal_lon + aspect_angle) % 360.0, (natal_lon - aspect_angle) % 360.0})
+        best: TransitWindow | None = None
+        for target in targets:
+            for window in self.windows(body, target, orb, jd_start, jd_end):
+                if not peak_inside(window.peak_jd, peak_start, peak_end):
+                    continue
+                if best is None or rank_window(window) < rank_window(best):
+                    best = window
+        return best
+
+
+class CrossingIndexRange:
+    __slots__ = ("index", "jd_start", "jd_end")
+
+    def __init__(self, index: CrossingIndex, jd_start: float, jd_end: float) -> None:
+        self.index = index
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+
+    def window(
+        self,
+        body: int,
+        natal_lon: float,
+        aspect_angle: float,
+        orb: float,
+        peak_start: float | None = None,
+        peak_end: float | None = None,
+    ) -> TransitWindow | None:
+        return self.index.window(
+            body, natal_lon, aspect_angle, orb, self.jd_start, self.jd_end, peak_start, peak_end
+        )
+
+
+CROSSING_INDEX = CrossingIndex()
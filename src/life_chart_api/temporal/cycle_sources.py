@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from life_chart_api.ephemeris.natal import NatalContext, natal_context_for_birth
+from life_chart_api.ephemeris.workers import get_worker_pool
+from life_chart_api.inputs.birth_moment import normalize_time
+from life_chart_api.schemas.example_loader import load_example_json, stamp_meta_and_input
+from life_chart_api.settings import get_settings
+from life_chart_api.synthesis.overlay_chinese import (
+    ChineseTier1,
+    ChineseTier2,
+    compute_chinese_tier1,
+    compute_chinese_tier2,
+    overlay_chinese_tier1,
+    overlay_chinese_tier2,
+)
+from life_chart_api.temporal.chinese_luck_pillars import (
+    build_chinese_flowing_pillar_records,
+    build_chinese_luck_pillar_records,
+)
+from life_chart_api.temporal.models import Cycle, parse_cycle_date, sort_records
+from life_chart_api.temporal.numerology_cycles import build_numerology_records
+from life_chart_api.temporal.progressions import build_progressed_records
+from life_chart_api.temporal.temporal_intersection import build_window_records, iter_windows
+from life_chart_api.temporal.timeline_cache import (
+    cached_window_records,
+    lookup_cycle_blocks,
+    store_cycle_block,
+)
+from life_chart_api.temporal.vedic_dashas import build_vedic_dasha_records
+from life_chart_api.temporal.western_transits import (
+    build_western_transit_records,
+    plan_western_range,
+)
+
+CYCLE_SYSTEMS = ("vedic", "chinese", "chinese_flow", "western", "progressed", "numerology")
+
+# Yearly western blocks are solved over a bracket padded by a year on each side and keep
+# only events peaking inside the year, so contacts that straddle Jan 1 stay one cycle.
+# Their windows can reach into the neighbouring years, which are loaded as well.
+_WESTERN_BLOCK_PAD_MONTHS = 12
+_BLOCK_SPILL_YEARS = {"western": 1}
+
+
+@dataclass(frozen=True)
+class TimelineRecords:
+    cycles: list[Cycle]
+    intersection: list[Cycle]
+    cache: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class NowRecords:
+    active: list[Cycle]
+    window: Cycle | None
+
+
+def person_key(birth: dict[str, Any]) -> tuple:
+    location = birth.get("location") or {}
+    return (
+        birth.get("date", ""),
+        normalize_time(birth.get("time", "")),
+        birth.get("timezone", ""),
+        round(float(location.get("lat", 0.0)), 6),
+        round(float(location.get("lon", 0.0)), 6),
+    )
+
+
+def _chinese_tiers(birth: dict[str, Any]) -> tuple[ChineseTier1, ChineseTier2]:
+    date_str = birth.get("date", "")
+    time_str = birth.get("time", "")
+    tz = birth.get("timezone", "")
+    tier1 = compute_chinese_tier1(date_str=date_str, time_str=time_str, tz=tz)
+    return tier1, compute_chinese_tier2(date_str=date_str, time_str=time_str, tz=tz, tier1=tier1)
+
+
+def _chinese_output(name: str | None, birth: dict[str, Any]) -> dict[str, Any]:
+    chinese = stamp_meta_and_input(
+        load_example_json("chinese_profile.example.json"),
+        name or "Unknown",
+        birth,
+    )
+    tier1 = compute_chinese_tier1(
+        date_str=birth.get("date", ""),
+        time_str=birth.get("time", ""),
+        tz=birth.get("timezone", ""),
+    )
+    chinese = overlay_chinese_tier1(chinese, tier1)
+    tier2 = compute_chinese_tier2(
+        date_str=birth.get("date", ""),
+        time_str=birth.get("time", ""),
+        tz=birth.get("timezone", ""),
+        tier1=tier1,
+    )
+    return overlay_chinese_tier2(chinese, tier2)
+
+
+def build_timeline_records(
+    *,
+    name: str | None,
+    birth: dict[str, Any],
+    include: list[str],
+    range_from: str,
+    range_to: str,
+    as_of: str | None,
+    dasha_depth: str = "maha",
+    granularity: str | None = None,
+    numerology_days: bool = False,
+) -> TimelineRecords:
+    systems = [system for system in CYCLE_SYSTEMS if system in include]
+    method = get_settings().WESTERN_TRANSIT_METHOD
+    # Cache keys hold only the options a builder's output depends on; no builder reads as_of.
+    options = {
+        "vedic": (dasha_depth,),
+        "chinese": (),
+        "chinese_flow": (),
+        "western": (method,),
+        "progressed": (),
+        "numerology": (numerology_days,),
+    }
+    person = person_key(birth)
+
+    range_start = parse_cycle_date(range_from, end=False)
+    range_end = parse_cycle_date(range_to, end=True)
+    windows = iter_windows(range_from, range_to, granularity) if granularity else []
+    extent_start = min([range_start] + [window["start"] for window in windows[:1]])
+    extent_end = max([range_end] + [window["end"] for window in windows[-1:]])
+    years = range(extent_start.year, extent_end.year + 1)
+
+    pool = get_worker_pool()
+    natal: NatalContext | None = None
+    chinese: dict[str, Any] | None = None
+    tiers: tuple[ChineseTier1, ChineseTier2] | None = None
+    blocks: dict[str, dict[int, list[Cycle]]] = {}
+    pending: dict[str, dict[int, Future[list[Cycle]] | list[Cycle]]] = {}
+    block_counts = {"cached": 0, "computed": 0}
+    for system in systems:
+        key = (person, system, options[system])
+        spill = _BLOCK_SPILL_YEARS.get(system, 0)
+        blocks[system], missing = lookup_cycle_blocks(
+            key, range(years.start - spill, years.stop + spill)
+        )
+        block_counts["cached"] += len(blocks[system])
+        block_counts["computed"] += len(missing)
+        if missing and system in ("vedic", "western", "progressed") and natal is None:
+            natal = pool.run(natal_context_for_birth, birth)
+        pending[system] = {}
+        for year in missing:
+            block_from = f"{year:04d}-01"
+            block_to = f"{year:04d}-12"
+            if system == "vedic":
+                pending[system][year] = pool.submit(
+                    build_vedic_dasha_records,
+                    birth=birth,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                    natal=natal,
+                    depth=dasha_depth,
+                )
+            elif system == "western":
+                pending[system][year] = pool.submit(
+                    build_western_transit_records,
+                    birth=birth,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                    method=method,
+                    natal=natal,
+                    pad_months=_WESTERN_BLOCK_PAD_MONTHS,
+                )
+            elif system == "progressed":
+                pending[system][year] = pool.submit(
+                    build_progressed_records,
+                    birth=birth,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                    natal=natal,
+                )
+            elif system == "numerology":
+                pending[system][year] = build_numerology_records(
+                    birth=birth,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                    include_days=numerology_days,
+                )
+            elif system == "chinese_flow":
+                if tiers is None:
+                    tiers = _chinese_tiers(birth)
+                pending[system][year] = build_chinese_flowing_pillar_records(
+                    birth=birth,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                    tier1=tiers[0],
+                    tier2=tiers[1],
+                )
+            else:
+                if chinese is None:
+                    chinese = _chinese_output(name, birth)
+                pending[system][year] = build_chinese_luck_pillar_records(
+                    chinese_system_output=chinese,
+                    range_from=block_from,
+                    range_to=block_to,
+                    as_of=as_of,
+                )
+
+    all_cycles: list[Cycle] = []
+    for system in systems:
+        key = (person, system, options[system])
+        for year, result in pending[system].items():
+            block = result.result() if isinstance(result, Future) else result
+            store_cycle_block(key, year, block)
+            blocks[system][year] = block
+        merged: dict[str, Cycle] = {}
+        for year in sorted(blocks[system]):
+            for cycle in blocks[system][year]:
+                merged.setdefault(cycle.cycle_id, cycle)
+        all_cycles.extend(sort_records(list(merged.values())))
+
+    start_ordinal = range_start.toordinal()
+    end_ordinal = range_end.toordinal()
+    cycles = [
+        cycle
+        for cycle in all_cycles
+        if cycle.start_ordinal <= end_ordinal and cycle.end_ordinal >= start_ordinal
+    ]
+
+    intersection: list[Cycle] = []
+    window_counts = {"cached": 0, "computed": 0}
+    if granularity:
+        window_key = (person, tuple(systems), tuple(options[system] for system in systems))
+        intersection, computed = cached_window_records(
+            window_key, all_cycles, range_from, range_to, granularity
+        )
+        window_counts = {"cached": len(windows) - computed, "computed": computed}
+
+    cache: dict[str, dict[str, int]] = {"cycle_blocks": block_counts, "windows": window_counts}
+    if "western" in systems:
+        plans = {
+            year: plan_western_range(
+                range_from=f"{year:04d}-01",
+                range_to=f"{year:04d}-12",
+                method=method,
+                pad_months=_WESTERN_BLOCK_PAD_MONTHS,
+            )
+            for year in blocks["western"]
+        }
+        cache["western_plan"] = {
+            "estimated_calls": sum(plans[year].estimated_calls for year in pending["western"]),
+            "dropped": max(plan.dropped for plan in plans.values()),
+        }
+
+    return TimelineRecords(cycles=cycles, intersection=intersection, cache=cache)
+
+
+def _chinese_luck_input(birth: dict[str, Any], tiers: tuple[ChineseTier1, ChineseTier2]) -> dict[str, Any]:
+    _, tier2 = tiers
+    return {
+        "input": {"birth": birth},
+        "luckCycles": {"pillars": tier2.luck_pillars},
+        "elements": {
+            "favourable": tier2.favourable_elements,
+            "unfavourable": tier2.unfavourable_elements,
+        },
+        "dayMaster": {"strength": tier2.day_master_strength},
+    }
+
+
+def build_now_records(
+    *,
+    birth: dict[str, Any],
+    include: list[str],
+    as_of: str,
+    dasha_depth: str = "maha",
+    granularity: str = "day",
+) -> NowRecords:
+    systems = [system for system in CYCLE_SYSTEMS if system in include]
+    window = iter_windows(as_of, as_of, granularity)[0]
+    range_from = window["start"].isoformat()
+    range_to = window["end"].isoformat()
+
+    pool = get_worker_pool()
+    natal: NatalContext | None = None
+    if any(system in ("vedic", "progressed") for system in systems):
+        natal = pool.run(natal_context_for_birth, birth)
+    tiers = _chinese_tiers(birth) if any(system.startswith("chinese") for system in systems) else None
+
+    pending: list[Future[list[Cycle]] | list[Cycle]] = []
+    for system in systems:
+        if system == "vedic":
+            pending.append(
+                pool.submit(
+                    build_vedic_dasha_records,
+                    birth=birth,
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                    natal=natal,
+                    depth=dasha_depth,
+                )
+            )
+        elif system == "western":
+            # Transit windows come from the padded year blocks the timeline solves, so the
+            # windows covering as_of keep the timeline's bounds and cycle ids.
+            pending.append(
+                build_timeline_records(
+                    name=None,
+                    birth=birth,
+                    include=["western"],
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                ).cycles
+            )
+        elif system == "progressed":
+            pending.append(
+                pool.submit(
+                    build_progressed_records,
+                    birth=birth,
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                    natal=natal,
+                )
+            )
+        elif system == "numerology":
+            pending.append(
+                build_numerology_records(
+                    birth=birth,
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                    include_days=granularity == "day",
+                )
+            )
+        elif system == "chinese_flow":
+            pending.append(
+                build_chinese_flowing_pillar_records(
+                    birth=birth,
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                    tier1=tiers[0],
+                    tier2=tiers[1],
+                )
+            )
+        else:
+            pending.append(
+                build_chinese_luck_pillar_records(
+                    chinese_system_output=_chinese_luck_input(birth, tiers),
+                    range_from=range_from,
+                    range_to=range_to,
+                    as_of=as_of,
+                )
+            )
+
+    cycles: list[Cycle] = []
+    for result in pending:
+        cycles.extend(result.result() if isinstance(result, Future) else result)
+
+    as_of_ordinal = parse_cycle_date(as_of, end=False).toordinal()
+    active = [
+        cycle
+        for cycle in cycles
+        if cycle.start_ordinal <= as_of_ordinal <= cycle.end_ordinal
+    ]
+    windows = build_window_records(cycles, [window], granularity)
+    return NowRecords(active=sort_records(active), window=windows[0] if windows else None)
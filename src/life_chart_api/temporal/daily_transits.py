@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.natal import NatalContext, natal_context_for_birth
+from life_chart_api.temporal.sky_table import SkyDay, get_sky_table
+from life_chart_api.temporal.western_transits import ASPECTS, NATAL_POINTS
+from life_chart_api.versioning import SCHEMA_VERSION_TRANSITS
+
+# Orbs are sampled once a day at 00:00 UT; the Moon's orb covers half its daily motion
+# so every lunar aspect shows up on at least one day.
+_DAILY_ORBS = {swe.MOON: 6.0}
+_DEFAULT_DAILY_ORB = 1.0
+
+_ASPECT_ANGLES = tuple(ASPECTS.items())
+
+
+def _natal_points(natal: NatalContext) -> list[tuple[str, float]]:
+    points = [(name, natal.longitude(body)) for name, body in NATAL_POINTS]
+    points.append(("asc", natal.ascendant))
+    points.append(("mc", natal.ascmc[1] % 360.0))
+    return points
+
+
+def day_aspects(row: SkyDay, points: list[tuple[str, float]]) -> list[dict[str, Any]]:
+    aspects = []
+    for transit, body in NATAL_POINTS:
+        lon, speed = row.position(body)
+        orb = _DAILY_ORBS.get(body, _DEFAULT_DAILY_ORB)
+        for natal, natal_lon in points:
+            separation = (lon - natal_lon + 180.0) % 360.0 - 180.0
+            distance = abs(separation)
+            for aspect, angle in _ASPECT_ANGLES:
+                delta = distance - angle
+                if abs(delta) > orb:
+                    continue
+                closing = speed if separation >= 0.0 else -speed
+                aspects.append(
+                    {
+                        "transit": transit,
+                        "natal": natal,
+                        "aspect": aspect,
+                        "orb": round(abs(delta), 2),
+                        "applying": delta * closing < 0.0,
+                    }
+                )
+                break
+    aspects.sort(key=lambda item: item["orb"])
+    return aspects
+
+
+def build_daily_transit_response(
+    *,
+    name: str | None,
+    birth: dict[str, Any],
+    range_start: date,
+    range_end: date,
+    natal: NatalContext | None = None,
+) -> dict[str, Any]:
+    if natal is None:
+        natal = natal_context_for_birth(birth)
+    points = _natal_points(natal)
+    days = [
+        {"date": row.day.isoformat(), "aspects": day_aspects(row, points)}
+        for row in get_sky_table().days(range_start, range_end)
+    ]
+
+    response: dict[str, Any] = {
+        "meta": {
+            "version": SCHEMA_VERSION_TRANSITS,
+            "range": {"from": range_start.isoformat(), "to": range_end.isoformat()},
+        },
+        "input": {"birth": birth},
+        "days": days,
+    }
+    if name:
+        response["input"]["name"] = name
+    return response
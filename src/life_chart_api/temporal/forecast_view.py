@@ -3,7 +3,8 @@ from __future__ import annotations
 from collections import Counter
 from typing import Any
 
-from life_chart_api.temporal.models import clamp01
+from life_chart_api.temporal.models import Cycle, clamp01, parse_cycle_date
+from life_chart_api.temporal.temporal_intersection import GRANULARITIES
 
 _CAREER_TAGS = {"structure_discipline", "authority", "ambition", "responsibility", "pressure_maturation"}
 _RELATIONSHIP_TAGS = {"love_harmony", "relationships", "belonging"}
@@ -119,30 +120,58 @@ def _select_top_windows(summaries: list[dict[str, Any]], top_n: int) -> list[dic
     return selected
 
 
-def _compute_confidence(cycle: dict[str, Any]) -> float:
-    systems = _systems_aligned(cycle)
+def _compute_confidence(systems: list[str], intensity: Any) -> float:
     systems_factor = min(1.0, len(systems) / 3.0)
-    intensity_factor = clamp01(float(cycle.get("intensity", 0.0)))
+    intensity_factor = clamp01(float(intensity))
     confidence = clamp01(0.55 * systems_factor + 0.45 * intensity_factor)
     return round(confidence, 2)
 
 
-def summarize_window(cycle: dict[str, Any]) -> dict[str, Any]:
-    themes = list(cycle.get("themes", []))
-    systems = _systems_aligned(cycle)
-    evidence_ids = _evidence_cycle_ids(cycle)
+def _record_sources(cycle: Cycle) -> tuple[list[str], list[str]]:
+    if not cycle.sources:
+        evidence = {"evidence": cycle.evidence}
+        return _systems_aligned(evidence), _evidence_cycle_ids(evidence)
+    systems = {source.system for source in cycle.sources if isinstance(source.system, str)}
+    ids = {source.cycle_id for source in cycle.sources if isinstance(source.cycle_id, str)}
+    return sorted(systems), sorted(ids)
+
+
+def summarize_window(cycle: dict[str, Any] | Cycle) -> dict[str, Any]:
+    if isinstance(cycle, Cycle):
+        themes = list(cycle.themes)
+        systems, evidence_ids = _record_sources(cycle)
+        fields = {
+            "windowId": cycle.cycle_id if isinstance(cycle.cycle_id, str) else "unknown",
+            "start": cycle.start,
+            "end": cycle.end,
+            "polarity": cycle.polarity,
+            "intensity": cycle.intensity if cycle.intensity is not None else 0.0,
+            "confidence": cycle.confidence,
+        }
+    else:
+        themes = list(cycle.get("themes", []))
+        systems = _systems_aligned(cycle)
+        evidence_ids = _evidence_cycle_ids(cycle)
+        fields = {
+            "windowId": _window_id(cycle),
+            "start": cycle.get("start"),
+            "end": cycle.get("end"),
+            "polarity": cycle.get("polarity"),
+            "intensity": cycle.get("intensity", 0.0),
+            "confidence": cycle.get("confidence"),
+        }
     ui = _base_ui(themes)
-    confidence = cycle.get("confidence")
+    confidence = fields["confidence"]
     if isinstance(confidence, (int, float)):
         confidence_value = round(clamp01(float(confidence)), 2)
     else:
-        confidence_value = _compute_confidence(cycle)
+        confidence_value = _compute_confidence(systems, fields["intensity"])
     return {
-        "windowId": _window_id(cycle),
-        "start": cycle.get("start"),
-        "end": cycle.get("end"),
-        "polarity": cycle.get("polarity"),
-        "intensity": float(cycle.get("intensity", 0.0)),
+        "windowId": fields["windowId"],
+        "start": fields["start"],
+        "end": fields["end"],
+        "polarity": fields["polarity"],
+        "intensity": float(fields["intensity"]),
         "confidence": confidence_value,
         "themes": themes,
         "systemsAligned": systems,
@@ -228,10 +257,10 @@ def build_forecast_response(
     range_to: str,
     granularity: str,
     as_of: str | None,
-    intersection_cycles: list[dict[str, Any]],
+    intersection_cycles: list[dict[str, Any]] | list[Cycle],
     top_n: int = 6,
 ) -> dict[str, Any]:
-    granularity = "quarter" if granularity == "quarter" else "month"
+    granularity = granularity if granularity in GRANULARITIES else "month"
     summaries = [summarize_window(cycle) for cycle in intersection_cycles]
     summaries.sort(key=_sort_key)
     top_windows = _select_top_windows(summaries, top_n)
@@ -272,3 +301,34 @@ def build_forecast_response(
     if as_of:
         response["meta"]["as_of"] = as_of
     return response
+
+
+def build_horizon_forecast_response(
+    *,
+    name: str | None,
+    birth: dict[str, Any],
+    range_from: str,
+    horizons: list[tuple[str, str]],
+    granularity: str,
+    as_of: str | None,
+    intersection_cycles: list[Cycle],
+    top_n: int = 6,
+) -> dict[str, Any]:
+    by_horizon: dict[str, dict[str, Any]] = {}
+    for label, horizon_to in horizons:
+        horizon_end = parse_cycle_date(horizon_to, end=True).toordinal()
+        by_horizon[label] = build_forecast_response(
+            name=name,
+            birth=birth,
+            range_from=range_from,
+            range_to=horizon_to,
+            granularity=granularity,
+            as_of=as_of,
+            intersection_cycles=[
+                cycle for cycle in intersection_cycles if cycle.start_ordinal <= horizon_end
+            ],
+            top_n=top_n,
+        )
+    response = dict(by_horizon[horizons[-1][0]])
+    response["horizons"] = by_horizon
+    return response
@@ -1,27 +1,135 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from calendar import monthrange
 from datetime import date, datetime
 from hashlib import sha1
-from typing import Any
+from sys import intern
+from typing import Any, Callable, Union
+
+EvidenceSource = Union[list[dict[str, Any]], Callable[[], list[dict[str, Any]]]]
+
+
+def parse_cycle_date(value: str, *, end: bool) -> date:
+    if len(value) == 7:
+        year, month = map(int, value.split("-"))
+        day = monthrange(year, month)[1] if end else 1
+        return date(year, month, day)
+    if len(value) == 10:
+        year, month, day = map(int, value.split("-"))
+        return date(year, month, day)
+    normalized = normalize_iso_ym(value)
+    year, month = map(int, normalized.split("-"))
+    day = monthrange(year, month)[1] if end else 1
+    return date(year, month, day)
 
 
-@dataclass(frozen=True)
 class Cycle:
-    cycleId: str
-    system: str
-    kind: str
-    domain: str
-    themes: list[str]
-    start: str
-    end: str
-    intensity: float
-    polarity: str
-    evidence: list[dict[str, Any]]
-    peak: str | None = None
-    ageStart: float | None = None
-    ageEnd: float | None = None
-    notes: list[str] | None = None
+    __slots__ = (
+        "cycle_id",
+        "system",
+        "kind",
+        "domain",
+        "themes",
+        "start",
+        "end",
+        "start_ordinal",
+        "end_ordinal",
+        "intensity",
+        "polarity",
+        "peak",
+        "confidence",
+        "notes",
+        "sources",
+        "_evidence",
+    )
+
+    def __init__(
+        self,
+        *,
+        cycle_id: str,
+        system: str,
+        kind: str,
+        domain: str,
+        themes: list[str],
+        start: str,
+        end: str,
+        intensity: float,
+        polarity: str | None,
+        evidence: EvidenceSource,
+        peak: str | None = None,
+        confidence: float | None = None,
+        notes: list[str] | None = None,
+        sources: tuple[Cycle, ...] = (),
+    ) -> None:
+        self.cycle_id = cycle_id
+        self.system = intern(system) if isinstance(system, str) else system
+        self.kind = intern(kind) if isinstance(kind, str) else kind
+        self.domain = intern(domain) if isinstance(domain, str) else domain
+        self.themes = themes
+        self.start = start
+        self.end = end
+        self.start_ordinal = parse_cycle_date(start, end=False).toordinal()
+        self.end_ordinal = parse_cycle_date(end, end=True).toordinal()
+        self.intensity = intensity
+        self.polarity = intern(polarity) if isinstance(polarity, str) else polarity
+        self.peak = peak
+        self.confidence = confidence
+        self.notes = notes
+        self.sources = sources
+        self._evidence = evidence
+
+    @property
+    def evidence(self) -> list[dict[str, Any]]:
+        if callable(self._evidence):
+            self._evidence = self._evidence()
+        return self._evidence
+
+    @classmethod
+    def from_dict(cls, cycle: dict[str, Any]) -> Cycle | None:
+        start = cycle.get("start")
+        end = cycle.get("end")
+        if not isinstance(start, str) or not isinstance(end, str):
+            return None
+        return cls(
+            cycle_id=cycle.get("cycleId"),
+            system=cycle.get("system"),
+            kind=cycle.get("kind"),
+            domain=cycle.get("domain"),
+            themes=cycle.get("themes", []),
+            start=start,
+            end=end,
+            intensity=cycle.get("intensity", 0.0),
+            polarity=cycle.get("polarity"),
+            evidence=cycle.get("evidence", []),
+            peak=cycle.get("peak"),
+            confidence=cycle.get("confidence"),
+            notes=cycle.get("notes"),
+        )
+
+    def sort_key(self) -> tuple:
+        return (self.start, self.end, self.system, self.cycle_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "cycleId": self.cycle_id,
+            "system": self.system,
+            "kind": self.kind,
+            "domain": self.domain,
+            "themes": self.themes,
+            "start": self.start,
+            "end": self.end,
+        }
+        if self.peak is not None:
+            payload["peak"] = self.peak
+        if self.confidence is not None:
+            payload["confidence"] = self.confidence
+        payload["intensity"] = self.intensity
+        if self.polarity is not None:
+            payload["polarity"] = self.polarity
+        payload["evidence"] = self.evidence
+        if self.notes is not None:
+            payload["notes"] = self.notes
+        return payload
 
 
 def normalize_iso_ym(value: date | datetime | str) -> str:
@@ -72,3 +180,11 @@ def sort_cycles(cycles: list[dict[str, Any]]) -> list[dict[str, Any]]:
         )
 
     return sorted(cycles, key=sort_key)
+
+
+def sort_records(cycles: list[Cycle]) -> list[Cycle]:
+    return sorted(cycles, key=Cycle.sort_key)
+
+
+def cycles_to_dicts(cycles: list[Cycle]) -> list[dict[str, Any]]:
+    return [cycle.to_dict() for cycle in cycles]
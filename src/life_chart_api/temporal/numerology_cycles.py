@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date
+from functools import lru_cache
+from typing import Any
+
+from life_chart_api.numerology.utils import reduce_number
+from life_chart_api.temporal.models import (
+    Cycle,
+    cycles_to_dicts,
+    parse_cycle_date,
+    sort_records,
+    stable_id,
+)
+
+_NUMBER_META = {
+    1: ("personality", ["new_beginnings", "drive"], "supporting"),
+    2: ("relationships", ["relationships", "patience"], "neutral"),
+    3: ("mind", ["expression", "creativity"], "supporting"),
+    4: ("career", ["structure", "discipline"], "challenging"),
+    5: ("growth", ["change", "freedom"], "neutral"),
+    6: ("relationships", ["responsibility", "belonging"], "supporting"),
+    7: ("growth", ["spirituality", "learning"], "neutral"),
+    8: ("money", ["ambition", "resources"], "supporting"),
+    9: ("growth", ["completion", "detachment"], "challenging"),
+}
+
+_KIND_INTENSITY = {
+    "personal_year": 0.5,
+    "personal_month": 0.3,
+    "personal_day": 0.15,
+}
+
+
+@lru_cache(maxsize=256)
+def _reduce(value: int) -> int:
+    return reduce_number(value, keep_masters=False).final_value
+
+
+@lru_cache(maxsize=4096)
+def _year_digit_sum(year: int) -> int:
+    total = 0
+    while year:
+        year, digit = divmod(year, 10)
+        total += digit
+    return total
+
+
+def personal_year_number(birth: date, year: int) -> int:
+    return _reduce(birth.month + birth.day + _year_digit_sum(year))
+
+
+def personal_month_number(birth: date, year: int, month: int) -> int:
+    return _reduce(personal_year_number(birth, year) + month)
+
+
+def personal_day_number(birth: date, day: date) -> int:
+    return _reduce(personal_month_number(birth, day.year, day.month) + day.day)
+
+
+def _record(kind: str, number: int, start: str, end: str, trace: dict[str, Any]) -> Cycle:
+    domain, themes, polarity = _NUMBER_META[number]
+    return Cycle(
+        cycle_id=stable_id(["numerology", kind, str(number), start, end]),
+        system="numerology",
+        kind=kind,
+        domain=domain,
+        themes=[f"{kind}:{number}"] + themes,
+        start=start,
+        end=end,
+        intensity=_KIND_INTENSITY[kind],
+        polarity=polarity,
+        evidence=[
+            {
+                "source": f"numerology.{kind}",
+                "value": {"number": number, **trace},
+                "weight": 0.5,
+                "note": "Digit-sum reduction, masters not kept.",
+            }
+        ],
+        notes=[],
+    )
+
+
+def build_numerology_cycles(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    include_days: bool = False,
+) -> list[dict[str, Any]]:
+    return cycles_to_dicts(
+        build_numerology_records(
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+            include_days=include_days,
+        )
+    )
+
+
+def build_numerology_records(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    include_days: bool = False,
+) -> list[Cycle]:
+    birth_date = date.fromisoformat(birth.get("date", ""))
+    range_start = parse_cycle_date(range_from, end=False)
+    range_end = parse_cycle_date(range_to, end=True)
+
+    cycles: list[Cycle] = []
+    for year in range(range_start.year, range_end.year + 1):
+        year_number = personal_year_number(birth_date, year)
+        cycles.append(
+            _record(
+                "personal_year",
+                year_number,
+                f"{year:04d}-01",
+                f"{year:04d}-12",
+                {"year": year},
+            )
+        )
+        first_month = range_start.month if year == range_start.year else 1
+        last_month = range_end.month if year == range_end.year else 12
+        for month in range(first_month, last_month + 1):
+            month_str = f"{year:04d}-{month:02d}"
+            month_number = _reduce(year_number + month)
+            cycles.append(
+                _record(
+                    "personal_month",
+                    month_number,
+                    month_str,
+                    month_str,
+                    {"personalYear": year_number, "month": month},
+                )
+            )
+            if not include_days:
+                continue
+            first_day = range_start.day if (year, month) == (range_start.year, range_start.month) else 1
+            last_day = (
+                range_end.day
+                if (year, month) == (range_end.year, range_end.month)
+                else monthrange(year, month)[1]
+            )
+            for day in range(first_day, last_day + 1):
+                day_str = f"{month_str}-{day:02d}"
+                cycles.append(
+                    _record(
+                        "personal_day",
+                        _reduce(month_number + day),
+                        day_str,
+                        day_str,
+                        {"personalMonth": month_number, "day": day},
+                    )
+                )
+
+    return sort_records(cycles)
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable
+
+import swisseph as swe
+
+from life_chart_api.ephemeris.natal import (
+    NatalContext,
+    datetime_from_julian_day,
+    natal_context_for_birth,
+)
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.temporal.models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    normalize_iso_ym,
+    sort_records,
+    stable_id,
+)
+from life_chart_api.temporal.transit_solver import PositionSeries, find_root, sample_nodes, wrap180
+from life_chart_api.temporal.western_transits import (
+    ASPECTS,
+    SIGNS,
+    TARGET_DOMAINS,
+    date_range,
+    range_julian_days,
+)
+
+# Day-for-a-year: one ephemeris day after birth stands for one tropical year of life.
+_DAYS_PER_YEAR = 365.2422
+
+# Progressed Sun and Moon never station, and the Moon moves under 16 degrees in a
+# progressed year, so yearly nodes bracket every crossing of a target longitude.
+_NODE_STEP_DAYS = 365.25
+
+_ORB = 1.0
+
+# Widest contact window: the progressed Sun (and solar-arc angles) moves at least
+# 0.95 degrees a year, so a 1-degree orb lasts at most this many days either side.
+_MAX_HALF_WIDTH_DAYS = _ORB * _NODE_STEP_DAYS / 0.95
+
+_MOVERS = (
+    ("sun", 0.7),
+    ("moon", 0.5),
+    ("asc", 0.6),
+    ("mc", 0.6),
+)
+
+_NATAL_TARGETS = (
+    ("sun", swe.SUN),
+    ("moon", swe.MOON),
+    ("mercury", swe.MERCURY),
+    ("venus", swe.VENUS),
+    ("mars", swe.MARS),
+    ("jupiter", swe.JUPITER),
+    ("saturn", swe.SATURN),
+)
+
+_LUNATIONS = (
+    ("new", 0.0, 0.7, "supporting"),
+    ("full", 180.0, 0.65, "neutral"),
+)
+
+_EVENT_THEMES = {
+    "progressed_moon_ingress": ["progressed_moon", "emotions", "new_chapter"],
+    "progressed_lunation": ["progressed_lunation", "growth"],
+    "progressed_aspect": ["progressed_aspect", "growth"],
+}
+
+PositionFn = Callable[[float, int], tuple[float, float]]
+Node = tuple[float, float, float]
+
+
+@dataclass(frozen=True)
+class ProgressedEvent:
+    kind: str
+    mover: str
+    jd: float
+    longitude: float
+    half_width_days: float
+    target: str
+    aspect: str | None = None
+
+
+class ProgressedChart:
+    def __init__(self, natal: NatalContext, position: PositionFn = body_position) -> None:
+        self.natal = natal
+        self._position = position
+        self._series: dict[int, PositionSeries] = {}
+        self.angles = {"asc": natal.ascendant, "mc": natal.ascmc[1] % 360.0}
+
+    @property
+    def calls(self) -> int:
+        return sum(series.calls for series in self._series.values())
+
+    def series(self, body: int) -> PositionSeries:
+        series = self._series.get(body)
+        if series is None:
+            series = PositionSeries(self._progressed(body))
+            self._series[body] = series
+        return series
+
+    def _progressed(self, body: int) -> Callable[[float], tuple[float, float]]:
+        jd_birth = self.natal.jd_ut
+
+        def position(jd_ut: float) -> tuple[float, float]:
+            lon, speed = self._position(jd_birth + (jd_ut - jd_birth) / _DAYS_PER_YEAR, body)
+            return lon, speed / _DAYS_PER_YEAR
+
+        return position
+
+    def mover(self, name: str) -> Callable[[float], tuple[float, float]]:
+        if name == "moon":
+            return self.series(swe.MOON)
+        sun = self.series(swe.SUN)
+        if name == "sun":
+            return sun
+        natal_angle = self.angles[name]
+        natal_sun = self.natal.longitude(swe.SUN)
+
+        def solar_arc(jd_ut: float) -> tuple[float, float]:
+            lon, speed = sun(jd_ut)
+            return (natal_angle + lon - natal_sun) % 360.0, speed
+
+        return solar_arc
+
+    def elongation(self, jd_ut: float) -> tuple[float, float]:
+        moon_lon, moon_speed = self.series(swe.MOON)(jd_ut)
+        sun_lon, sun_speed = self.series(swe.SUN)(jd_ut)
+        return (moon_lon - sun_lon) % 360.0, moon_speed - sun_speed
+
+    def natal_points(self) -> dict[str, float]:
+        points = {name: self.natal.longitude(body) for name, body in _NATAL_TARGETS}
+        points.update(self.angles)
+        return points
+
+    def events(self, jd_start: float, jd_end: float) -> list[ProgressedEvent]:
+        events: list[ProgressedEvent] = []
+        moon_nodes = sample_nodes(self.mover("moon"), jd_start, jd_end, _NODE_STEP_DAYS)
+
+        for target, jd, longitude, width in _crossings(
+            self.mover("moon"), moon_nodes, [sign * 30.0 for sign in range(12)]
+        ):
+            events.append(
+                ProgressedEvent(
+                    kind="progressed_moon_ingress",
+                    mover="moon",
+                    jd=jd,
+                    longitude=longitude,
+                    half_width_days=width,
+                    target=SIGNS[int(round(target / 30.0)) % 12],
+                )
+            )
+
+        elongation_nodes = [(node[0], *self.elongation(node[0])) for node in moon_nodes]
+        for phase, angle, _, _ in _LUNATIONS:
+            for _, jd, _, width in _crossings(self.elongation, elongation_nodes, [angle]):
+                events.append(
+                    ProgressedEvent(
+                        kind="progressed_lunation",
+                        mover="moon",
+                        jd=jd,
+                        longitude=self.series(swe.MOON)(jd)[0],
+                        half_width_days=width,
+                        target=phase,
+                    )
+                )
+
+        points = self.natal_points()
+        for mover, _ in _MOVERS:
+            position = self.mover(mover)
+            nodes = [(node[0], *position(node[0])) for node in moon_nodes]
+            targets: dict[float, tuple[str, str]] = {}
+            for point, natal_lon in points.items():
+                if point == mover and mover != "moon":
+                    continue
+                for aspect, angle in ASPECTS.items():
+                    for longitude in {(natal_lon + angle) % 360.0, (natal_lon - angle) % 360.0}:
+                        targets.setdefault(round(longitude, 9), (point, aspect))
+            for target, jd, longitude, width in _crossings(position, nodes, list(targets)):
+                point, aspect = targets[target]
+                events.append(
+                    ProgressedEvent(
+                        kind="progressed_aspect",
+                        mover=mover,
+                        jd=jd,
+                        longitude=longitude,
+                        half_width_days=width,
+                        target=point,
+                        aspect=aspect,
+                    )
+                )
+        return sorted(events, key=lambda event: (event.jd, event.kind, event.mover, event.target))
+
+
+def _crossings(
+    position: Callable[[float], tuple[float, float]],
+    nodes: list[Node],
+    targets: list[float],
+) -> list[tuple[float, float, float, float]]:
+    results = []
+    for prev, node in zip(nodes, nodes[1:], strict=False):
+        motion = wrap180(node[1] - prev[1])
+        if motion <= 0.0:
+            continue
+        half_width = _ORB * (node[0] - prev[0]) / motion
+        for target in targets:
+            f_prev = wrap180(prev[1] - target)
+            f_node = wrap180(node[1] - target)
+            if not f_prev < 0.0 <= f_node or f_node - f_prev > 180.0:
+                continue
+
+            def offset(jd_ut: float, target: float = target) -> tuple[float, float]:
+                lon, speed = position(jd_ut)
+                return wrap180(lon - target), speed
+
+            root = find_root(offset, prev[0], node[0], f_prev, f_node)
+            results.append((target, root, target % 360.0, half_width))
+    return results
+
+
+def _window(jd: float, half_width_days: float) -> tuple[str, str, str]:
+    moment = datetime_from_julian_day(jd)
+    width = timedelta(days=half_width_days)
+    return (
+        normalize_iso_ym(moment - width),
+        normalize_iso_ym(moment + width),
+        moment.strftime("%Y-%m-%d"),
+    )
+
+
+def _method_evidence() -> dict[str, Any]:
+    return {
+        "source": "western.progressed.method",
+        "value": "day-for-a-year",
+        "weight": 0.4,
+        "note": "Secondary progression; solar-arc angles; root-finding on progressed longitude.",
+    }
+
+
+def _peak_evidence(event: ProgressedEvent, value: dict[str, Any]) -> dict[str, Any]:
+    value["longitude"] = round(event.longitude, 2)
+    value["time"] = datetime_from_julian_day(event.jd).strftime("%Y-%m-%dT%H:%MZ")
+    return {
+        "source": "western.progressed.peak",
+        "value": value,
+        "weight": 0.7,
+        "note": "Exact progressed contact.",
+    }
+
+
+def _event_record(event: ProgressedEvent, natal_points: dict[str, float]) -> Cycle:
+    start, end, peak = _window(event.jd, event.half_width_days)
+    if event.kind == "progressed_moon_ingress":
+        return Cycle(
+            cycle_id=stable_id(["western", event.kind, event.target, peak]),
+            system="western",
+            kind=event.kind,
+            domain="personality",
+            themes=_EVENT_THEMES[event.kind] + [f"sign:{event.target}"],
+            start=start,
+            end=end,
+            peak=peak,
+            intensity=0.45,
+            polarity="neutral",
+            evidence=[
+                _peak_evidence(event, {"planet": "moon", "sign": event.target}),
+                _method_evidence(),
+            ],
+            notes=[],
+        )
+    if event.kind == "progressed_lunation":
+        _, _, intensity, polarity = next(row for row in _LUNATIONS if row[0] == event.target)
+        return Cycle(
+            cycle_id=stable_id(["western", event.kind, event.target, peak]),
+            system="western",
+            kind=event.kind,
+            domain="growth",
+            themes=_EVENT_THEMES[event.kind] + [f"phase:{event.target}"],
+            start=start,
+            end=end,
+            peak=peak,
+            intensity=intensity,
+            polarity=polarity,
+            evidence=[
+                _peak_evidence(event, {"phase": event.target}),
+                _method_evidence(),
+            ],
+            notes=[],
+        )
+
+    base = dict(_MOVERS)[event.mover]
+    aspect = event.aspect or "conjunction"
+    if aspect == "trine":
+        base -= 0.15
+    elif aspect == "sextile":
+        base -= 0.25
+    if aspect in ("trine", "sextile"):
+        polarity = "supporting"
+    elif aspect == "conjunction":
+        polarity = "neutral"
+    else:
+        polarity = "challenging"
+    return Cycle(
+        cycle_id=stable_id(["western", event.kind, event.mover, event.target, aspect, peak]),
+        system="western",
+        kind=event.kind,
+        domain=TARGET_DOMAINS[event.target],
+        themes=_EVENT_THEMES[event.kind]
+        + [f"progressed:{event.mover}", f"aspect:{aspect}", f"target:{event.target}"],
+        start=start,
+        end=end,
+        peak=peak,
+        intensity=clamp01(base),
+        polarity=polarity,
+        evidence=[
+            {
+                "source": "western.natal.longitude",
+                "value": {"planet": event.target, "longitude": round(natal_points[event.target], 2)},
+                "weight": 0.8,
+                "note": "Natal longitude.",
+            },
+            _peak_evidence(event, {"progressed": event.mover, "aspect": aspect}),
+            _method_evidence(),
+        ],
+        notes=[],
+    )
+
+
+def build_progressed_cycles(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    natal: NatalContext | None = None,
+) -> list[dict[str, Any]]:
+    return cycles_to_dicts(
+        build_progressed_records(
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+            natal=natal,
+        )
+    )
+
+
+def build_progressed_records(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    natal: NatalContext | None = None,
+) -> list[Cycle]:
+    if natal is None:
+        natal = natal_context_for_birth(birth)
+    range_start, range_end = date_range(normalize_iso_ym(range_from), normalize_iso_ym(range_to))
+    chart = ProgressedChart(natal)
+    points = chart.natal_points()
+    # Contacts are searched past both ends so every window reaching into the range is
+    # found, whatever range or year block the request uses.
+    jd_start, jd_end = range_julian_days(range_start, range_end)
+    events = chart.events(jd_start - _MAX_HALF_WIDTH_DAYS, jd_end + _MAX_HALF_WIDTH_DAYS)
+    start_ordinal = range_start.toordinal()
+    end_ordinal = range_end.toordinal()
+    records = [_event_record(event, points) for event in events]
+    return sort_records(
+        [
+            record
+            for record in records
+            if record.start_ordinal <= end_ordinal and record.end_ordinal >= start_ordinal
+        ]
+    )
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from threading import Lock
+from typing import Any, Callable
+
+from life_chart_api.ephemeris.natal import NATAL_BODIES, julian_day
+from life_chart_api.ephemeris.positions import active_backend, body_position
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.timeline_cache import LRUCache
+
+SKY_BODIES = NATAL_BODIES
+
+_BODY_INDEX = {body: index for index, body in enumerate(SKY_BODIES)}
+
+
+@dataclass(frozen=True)
+class SkyDay:
+    day: date
+    positions: tuple[tuple[float, float], ...]
+
+    def position(self, body: int) -> tuple[float, float]:
+        return self.positions[_BODY_INDEX[body]]
+
+    def longitude(self, body: int) -> float:
+        return self.positions[_BODY_INDEX[body]][0]
+
+
+def _month_keys(start: date, end: date) -> list[tuple[int, int]]:
+    keys = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        keys.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return keys
+
+
+class SkyTable:
+    def __init__(
+        self,
+        max_months: int,
+        position: Callable[[float, int], tuple[float, float]] = body_position,
+    ) -> None:
+        self._blocks = LRUCache(max_months)
+        self._position = position
+        self._lock = Lock()
+        self.calls = 0
+
+    def _build_month(self, year: int, month: int) -> tuple[SkyDay, ...]:
+        rows = []
+        for day_number in range(1, monthrange(year, month)[1] + 1):
+            day = date(year, month, day_number)
+            jd_ut = julian_day(datetime.combine(day, time.min, tzinfo=timezone.utc))
+            rows.append(
+                SkyDay(
+                    day=day,
+                    positions=tuple(self._position(jd_ut, body) for body in SKY_BODIES),
+                )
+            )
+        return tuple(rows)
+
+    def _month(self, backend: str, year: int, month: int) -> tuple[SkyDay, ...]:
+        key = (backend, year, month)
+        rows = self._blocks.get(key)
+        if rows is None:
+            # Built outside the lock so other months stay readable; a concurrent
+            # duplicate build yields identical rows and the last insert wins.
+            rows = self._build_month(year, month)
+            with self._lock:
+                self.calls += len(rows) * len(SKY_BODIES)
+                self._blocks.put(key, rows)
+        return rows
+
+    def days(self, start: date, end: date) -> list[SkyDay]:
+        backend = active_backend()
+        rows: list[SkyDay] = []
+        for year, month in _month_keys(start, end):
+            for row in self._month(backend, year, month):
+                if start <= row.day <= end:
+                    rows.append(row)
+        return rows
+
+    def day(self, day: date) -> SkyDay:
+        return self._month(active_backend(), day.year, day.month)[day.day - 1]
+
+    def stats(self) -> dict[str, Any]:
+        stats = self._blocks.stats()
+        stats["ephemeris_calls"] = self.calls
+        return stats
+
+
+_SKY_TABLE: SkyTable | None = None
+_SKY_LOCK = Lock()
+
+
+def get_sky_table() -> SkyTable:
+    global _SKY_TABLE
+    if _SKY_TABLE is None:
+        with _SKY_LOCK:
+            if _SKY_TABLE is None:
+                _SKY_TABLE = SkyTable(get_settings().SKY_TABLE_CACHE_MONTHS)
+    return _SKY_TABLE
+
+
+def reset_sky_table() -> None:
+    global _SKY_TABLE
+    with _SKY_LOCK:
+        _SKY_TABLE = None
+
+
+def sky_table_stats() -> dict[str, Any]:
+    return get_sky_table().stats()
+
+
+def sky_longitude(day: date, body: int) -> float:
+    return get_sky_table().day(day).longitude(body)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
 from calendar import monthrange
-from datetime import date
-from typing import Any
-
-from life_chart_api.temporal.models import clamp01, normalize_iso_ym, stable_id
+from datetime import date, timedelta
+from functools import partial
+from heapq import heappop, heappush
+from typing import Any, Iterator
+
+from life_chart_api.temporal.models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    parse_cycle_date,
+    stable_id,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 _SYSTEM_WEIGHTS = {
     "western": 0.30,
@@ -13,6 +26,8 @@ _SYSTEM_WEIGHTS = {
     "numerology": 0.10,
 }
 
+_SKY_EVENT_KINDS = frozenset({"station_retrograde", "station_direct", "ingress"})
+
 _THEME_KEYWORDS = {
     "structure_discipline": {"discipline", "responsibility", "structure", "saturn_return", "saturn_transit"},
     "expansion_growth": {"growth", "expansion", "guidance", "jupiter_return"},
@@ -27,19 +42,7 @@ _THEME_KEYWORDS = {
 
 _ELEMENT_TAGS = {"wood", "fire", "earth", "metal", "water"}
 
-
-def _parse_date(value: str, *, end: bool) -> date:
-    if len(value) == 7:
-        year, month = map(int, value.split("-"))
-        day = monthrange(year, month)[1] if end else 1
-        return date(year, month, day)
-    if len(value) == 10:
-        year, month, day = map(int, value.split("-"))
-        return date(year, month, day)
-    normalized = normalize_iso_ym(value)
-    year, month = map(int, normalized.split("-"))
-    day = monthrange(year, month)[1] if end else 1
-    return date(year, month, day)
+GRANULARITIES = ("month", "quarter", "week", "day")
 
 
 def _month_start(dt: date) -> date:
@@ -68,9 +71,32 @@ def _add_months(start: date, months: int) -> date:
     return date(year, month, 1)
 
 
+def _iter_day_windows(range_from: str, range_to: str, granularity: str) -> list[dict[str, Any]]:
+    range_start = parse_cycle_date(range_from, end=False)
+    range_end = parse_cycle_date(range_to, end=True)
+    windows: list[dict[str, Any]] = []
+
+    if granularity == "week":
+        current = range_start - timedelta(days=range_start.weekday())
+        while current <= range_end:
+            iso_year, iso_week, _ = current.isocalendar()
+            end = current + timedelta(days=6)
+            windows.append({"id": f"{iso_year}-W{iso_week:02d}", "start": current, "end": end})
+            current = end + timedelta(days=1)
+    else:
+        current = range_start
+        while current <= range_end:
+            windows.append({"id": current.isoformat(), "start": current, "end": current})
+            current += timedelta(days=1)
+
+    return windows
+
+
 def _iter_windows(range_from: str, range_to: str, granularity: str) -> list[dict[str, Any]]:
-    range_start = _month_start(_parse_date(range_from, end=False))
-    range_end = _month_end(_parse_date(range_to, end=True))
+    if granularity in {"week", "day"}:
+        return _iter_day_windows(range_from, range_to, granularity)
+    range_start = _month_start(parse_cycle_date(range_from, end=False))
+    range_end = _month_end(parse_cycle_date(range_to, end=True))
     windows: list[dict[str, Any]] = []
 
     if granularity == "quarter":
@@ -101,7 +127,10 @@ def _iter_windows(range_from: str, range_to: str, granularity: str) -> list[dict
 
 
 def normalize_time_themes(cycle: dict[str, Any]) -> set[str]:
-    themes = cycle.get("themes", [])
+    return _normalize_themes(cycle.get("themes", []))
+
+
+def _normalize_themes(themes: list[Any]) -> set[str]:
     normalized: set[str] = set()
     for raw in themes:
         if not isinstance(raw, str):
@@ -124,71 +153,236 @@ def normalize_time_themes(cycle: dict[str, Any]) -> set[str]:
     return normalized
 
 
-def build_temporal_intersection_cycles(
-    all_cycles: list[dict[str, Any]],
-    range_from: str,
-    range_to: str,
-    granularity: str = "month",
-) -> list[dict[str, Any]]:
-    granularity = "quarter" if granularity == "quarter" else "month"
-    windows = _iter_windows(range_from, range_to, granularity)
-    intersection_cycles: list[dict[str, Any]] = []
+def _polarity_sign(cycle: Cycle) -> int:
+    polarity = cycle.polarity or "neutral"
+    if polarity == "supporting":
+        return 1
+    if polarity == "challenging":
+        return -1
+    return 0
+
+
+def _sweep_windows(
+    all_cycles: list[Cycle], windows: list[dict[str, Any]]
+) -> Iterator[tuple[dict[str, Any], list[tuple[int, Cycle, int, int]]]]:
+    bounds = sorted(
+        (cycle.start_ordinal, cycle.end_ordinal, index) for index, cycle in enumerate(all_cycles)
+    )
+    next_bound = 0
+    active: dict[int, tuple[int, int]] = {}
+    ends: list[tuple[int, int]] = []
 
     for window in windows:
-        window_start = window["start"]
-        window_end = window["end"]
-        window_id = window["id"]
-        window_days = (window_end - window_start).days + 1
+        window_start = window["start"].toordinal()
+        window_end = window["end"].toordinal()
+        while next_bound < len(bounds) and bounds[next_bound][0] <= window_end:
+            cycle_start, cycle_end, index = bounds[next_bound]
+            next_bound += 1
+            if cycle_end >= window_start:
+                active[index] = (cycle_start, cycle_end)
+                heappush(ends, (cycle_end, index))
+        while ends and ends[0][0] < window_start:
+            _, index = heappop(ends)
+            del active[index]
 
-        overlapping: list[tuple[dict[str, Any], date, date]] = []
-        for cycle in all_cycles:
-            start_raw = cycle.get("start")
-            end_raw = cycle.get("end")
-            if not isinstance(start_raw, str) or not isinstance(end_raw, str):
-                continue
-            cycle_start = _parse_date(start_raw, end=False)
-            cycle_end = _parse_date(end_raw, end=True)
-            if cycle_start <= window_end and cycle_end >= window_start:
-                overlapping.append((cycle, cycle_start, cycle_end))
+        overlapping = [(index, all_cycles[index], *active[index]) for index in sorted(active)]
+        yield window, overlapping
 
-        if not overlapping:
-            continue
 
-        theme_scores: dict[str, float] = {}
-        theme_support: dict[str, float] = {}
-        theme_challenge: dict[str, float] = {}
-        theme_support_systems: dict[str, set[str]] = {}
-        theme_challenge_systems: dict[str, set[str]] = {}
-        systems_present: set[str] = set()
-        weighted_cycles: list[tuple[dict[str, Any], float, int]] = []
+WindowWeights = tuple[dict[str, Any], list[tuple[int, Cycle, float, int]], float, float, int]
+
+
+def _cycle_intensity(cycle: Cycle) -> float:
+    return float(cycle.intensity if cycle.intensity is not None else 0.0)
+
 
-        for cycle, cycle_start, cycle_end in overlapping:
-            system = cycle.get("system")
+def _scalar_window_weights(
+    all_cycles: list[Cycle], windows: list[dict[str, Any]]
+) -> Iterator[WindowWeights]:
+    for window, overlapping in _sweep_windows(all_cycles, windows):
+        window_start_ordinal = window["start"].toordinal()
+        window_end_ordinal = window["end"].toordinal()
+        window_days = window_end_ordinal - window_start_ordinal + 1
+
+        systems_present: set[str] = set()
+        weighted_cycles: list[tuple[int, Cycle, float, int]] = []
+        for index, cycle, cycle_start, cycle_end in overlapping:
+            system = cycle.system
             if system not in _SYSTEM_WEIGHTS:
                 continue
-            intensity = float(cycle.get("intensity", 0.0))
+            intensity = _cycle_intensity(cycle)
             overlap_days = max(
                 0,
-                (min(cycle_end, window_end) - max(cycle_start, window_start)).days + 1,
+                min(cycle_end, window_end_ordinal) - max(cycle_start, window_start_ordinal) + 1,
             )
             overlap_factor = overlap_days / window_days if window_days > 0 else 0.0
             if overlap_factor <= 0.0:
                 continue
             weight = _SYSTEM_WEIGHTS[system] * intensity * overlap_factor
-            polarity = cycle.get("polarity", "neutral")
-            sign = 0
-            if polarity == "supporting":
-                sign = 1
-            elif polarity == "challenging":
-                sign = -1
-
             if weight <= 0.0:
                 continue
-
             systems_present.add(system)
-            weighted_cycles.append((cycle, weight, sign))
+            weighted_cycles.append((index, cycle, weight, _polarity_sign(cycle)))
 
-            for theme in normalize_time_themes(cycle):
+        if not weighted_cycles:
+            continue
+        total_weight = sum(weight for _, _, weight, _ in weighted_cycles)
+        net = sum(weight * sign for _, _, weight, sign in weighted_cycles)
+        yield window, weighted_cycles, total_weight, net, len(systems_present)
+
+
+def _vectorized_window_weights(
+    all_cycles: list[Cycle], windows: list[dict[str, Any]]
+) -> Iterator[WindowWeights]:
+    indices: list[int] = []
+    starts: list[int] = []
+    ends: list[int] = []
+    base_weights: list[float] = []
+    signs: list[int] = []
+    system_ids: list[int] = []
+    system_order = list(_SYSTEM_WEIGHTS)
+    for index, cycle in enumerate(all_cycles):
+        system = cycle.system
+        if system not in _SYSTEM_WEIGHTS:
+            continue
+        indices.append(index)
+        starts.append(cycle.start_ordinal)
+        ends.append(cycle.end_ordinal)
+        base_weights.append(_SYSTEM_WEIGHTS[system] * _cycle_intensity(cycle))
+        signs.append(_polarity_sign(cycle))
+        system_ids.append(system_order.index(system))
+    if not indices:
+        return
+
+    window_starts = np.array([window["start"].toordinal() for window in windows], dtype=np.int64)
+    window_ends = np.array([window["end"].toordinal() for window in windows], dtype=np.int64)
+    window_days = window_ends - window_starts + 1
+    cycle_starts = np.array(starts, dtype=np.int64)
+    cycle_ends = np.array(ends, dtype=np.int64)
+    cycle_systems = np.array(system_ids, dtype=np.int64)
+
+    overlap_days = np.minimum(cycle_ends[None, :], window_ends[:, None]) - np.maximum(
+        cycle_starts[None, :], window_starts[:, None]
+    )
+    overlap_days = np.maximum(overlap_days + 1, 0)
+    weights = np.array(base_weights)[None, :] * (overlap_days / window_days[:, None])
+    weights[weights <= 0.0] = 0.0
+    mask = weights > 0.0
+    signed = np.where(mask, weights * np.array(signs, dtype=np.float64)[None, :], 0.0)
+
+    # cumsum accumulates left to right, matching the scalar path's sum() exactly.
+    totals = np.cumsum(weights, axis=1)[:, -1]
+    nets = np.cumsum(signed, axis=1)[:, -1]
+    systems_counts = np.zeros(len(windows), dtype=np.int64)
+    for system_id in range(len(system_order)):
+        columns = cycle_systems == system_id
+        if columns.any():
+            systems_counts += mask[:, columns].any(axis=1)
+    denominators = np.maximum(0.75, systems_counts * 0.35)
+    magnitudes = np.minimum(totals / denominators, 1.0)
+
+    # A convergence needs two supporting cycles of weight >= 0.15 and a divergence needs
+    # 0.20 on each side, so windows below the 0.20 magnitude floor can never be emitted.
+    for row in np.nonzero(mask.any(axis=1) & (magnitudes >= 0.20))[0]:
+        weighted_cycles = [
+            (indices[column], all_cycles[indices[column]], float(weights[row, column]), signs[column])
+            for column in np.nonzero(mask[row])[0]
+        ]
+        yield windows[row], weighted_cycles, float(totals[row]), float(nets[row]), int(
+            systems_counts[row]
+        )
+
+
+def _window_evidence(
+    weighted_cycles: list[tuple[int, Cycle, float, int]], confidence: float
+) -> list[dict[str, Any]]:
+    evidence = []
+    for _, cycle, weight, sign in weighted_cycles:
+        evidence.append(
+            {
+                "source": "timeline.cycle",
+                "value": {
+                    "system": cycle.system,
+                    "cycleId": cycle.cycle_id,
+                    "kind": cycle.kind,
+                    "themes": cycle.themes,
+                    "polarity": cycle.polarity,
+                    "intensity": cycle.intensity,
+                },
+                "weight": clamp01(weight),
+                "note": f"contribution={'+' if sign > 0 else '-' if sign < 0 else '0'}{weight:.2f}; confidence={confidence:.2f}",
+            }
+        )
+    evidence.sort(key=lambda item: (item["value"].get("system", ""), item["value"].get("cycleId", "")))
+    return evidence
+
+
+def build_temporal_intersection_cycles(
+    all_cycles: list[dict[str, Any]],
+    range_from: str,
+    range_to: str,
+    granularity: str = "month",
+    vectorized: bool | None = None,
+) -> list[dict[str, Any]]:
+    records = [record for record in map(Cycle.from_dict, all_cycles) if record is not None]
+    return cycles_to_dicts(
+        build_temporal_intersection_records(records, range_from, range_to, granularity, vectorized)
+    )
+
+
+def build_temporal_intersection_records(
+    all_cycles: list[Cycle],
+    range_from: str,
+    range_to: str,
+    granularity: str = "month",
+    vectorized: bool | None = None,
+) -> list[Cycle]:
+    granularity = granularity if granularity in GRANULARITIES else "month"
+    windows = _iter_windows(range_from, range_to, granularity)
+    return build_window_records(all_cycles, windows, granularity, vectorized)
+
+
+def iter_windows(range_from: str, range_to: str, granularity: str) -> list[dict[str, Any]]:
+    granularity = granularity if granularity in GRANULARITIES else "month"
+    return _iter_windows(range_from, range_to, granularity)
+
+
+def build_window_records(
+    all_cycles: list[Cycle],
+    windows: list[dict[str, Any]],
+    granularity: str,
+    vectorized: bool | None = None,
+) -> list[Cycle]:
+    intersection_cycles: list[Cycle] = []
+    if not windows:
+        return intersection_cycles
+    if vectorized is None:
+        vectorized = np is not None
+    all_cycles = [cycle for cycle in all_cycles if cycle.kind not in _SKY_EVENT_KINDS]
+    window_weights = (
+        _vectorized_window_weights(all_cycles, windows)
+        if vectorized and np is not None
+        else _scalar_window_weights(all_cycles, windows)
+    )
+    cycle_themes: dict[int, set[str]] = {}
+
+    for window, weighted_cycles, total_weight, net, systems_count in window_weights:
+        window_start = window["start"]
+        window_end = window["end"]
+        window_id = window["id"]
+
+        theme_scores: dict[str, float] = {}
+        theme_support: dict[str, float] = {}
+        theme_challenge: dict[str, float] = {}
+        theme_support_systems: dict[str, set[str]] = {}
+        theme_challenge_systems: dict[str, set[str]] = {}
+
+        for index, cycle, weight, sign in weighted_cycles:
+            system = cycle.system
+            themes = cycle_themes.get(index)
+            if themes is None:
+                themes = cycle_themes[index] = _normalize_themes(cycle.themes)
+            for theme in themes:
                 theme_scores[theme] = theme_scores.get(theme, 0.0) + weight * sign
                 if sign > 0:
                     theme_support[theme] = theme_support.get(theme, 0.0) + weight
@@ -201,9 +395,6 @@ def build_temporal_intersection_cycles(
                     if weight >= 0.15:
                         theme_challenge_systems[theme].add(system)
 
-        if not weighted_cycles:
-            continue
-
         convergences: list[str] = []
         divergences: list[str] = []
         for theme, score in theme_scores.items():
@@ -215,9 +406,7 @@ def build_temporal_intersection_cycles(
             if support_weight >= 0.20 and challenge_weight >= 0.20:
                 divergences.append(theme)
 
-        total_weight = sum(weight for _, weight, _ in weighted_cycles)
-        net = sum(weight * sign for _, weight, sign in weighted_cycles)
-        magnitude = clamp01(total_weight / max(0.75, float(len(systems_present)) * 0.35))
+        magnitude = clamp01(total_weight / max(0.75, float(systems_count) * 0.35))
         intensity = clamp01(0.5 * magnitude + 0.5 * abs(net))
         if net > 0.10:
             polarity = "supporting"
@@ -245,48 +434,29 @@ def build_temporal_intersection_cycles(
         if divergences:
             themes.append("tension")
 
-        systems_count = len(systems_present)
         total_conflicts = len(divergences)
         total_alignments = len(convergences)
         agreement = 1.0 - min(1.0, total_conflicts / max(1, total_alignments + total_conflicts))
         confidence = clamp01((systems_count / 3.0) * 0.6 + agreement * 0.4)
 
-        evidence = []
-        for cycle, weight, sign in weighted_cycles:
-            evidence.append(
-                {
-                    "source": "timeline.cycle",
-                    "value": {
-                        "system": cycle.get("system"),
-                        "cycleId": cycle.get("cycleId"),
-                        "kind": cycle.get("kind"),
-                        "themes": cycle.get("themes", []),
-                        "polarity": cycle.get("polarity"),
-                        "intensity": cycle.get("intensity"),
-                    },
-                    "weight": clamp01(weight),
-                    "note": f"contribution={'+' if sign > 0 else '-' if sign < 0 else '0'}{weight:.2f}; confidence={confidence:.2f}",
-                }
-            )
-        evidence.sort(key=lambda item: (item["value"].get("system", ""), item["value"].get("cycleId", "")))
-
         start_str = window_start.strftime("%Y-%m-%d")
         end_str = window_end.strftime("%Y-%m-%d")
         intersection_cycles.append(
-            {
-                "cycleId": stable_id(["intersection", "window", window_id, granularity]),
-                "system": "intersection",
-                "kind": "window",
-                "domain": "growth",
-                "themes": themes,
-                "start": start_str,
-                "end": end_str,
-                "confidence": confidence,
-                "intensity": intensity,
-                "polarity": polarity,
-                "evidence": evidence,
-                "notes": [],
-            }
+            Cycle(
+                cycle_id=stable_id(["intersection", "window", window_id, granularity]),
+                system="intersection",
+                kind="window",
+                domain="growth",
+                themes=themes,
+                start=start_str,
+                end=end_str,
+                confidence=confidence,
+                intensity=intensity,
+                polarity=polarity,
+                evidence=partial(_window_evidence, weighted_cycles, confidence),
+                notes=[],
+                sources=tuple(cycle for _, cycle, _, _ in weighted_cycles),
+            )
         )
 
     return intersection_cycles
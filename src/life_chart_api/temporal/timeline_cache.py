@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.models import Cycle
+from life_chart_api.temporal.temporal_intersection import build_window_records, iter_windows
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(0, maxsize)
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_CYCLE_BLOCKS: LRUCache | None = None
+_WINDOWS: LRUCache | None = None
+_CACHE_LOCK = Lock()
+
+
+def _caches() -> tuple[LRUCache, LRUCache]:
+    global _CYCLE_BLOCKS, _WINDOWS
+    if _CYCLE_BLOCKS is None or _WINDOWS is None:
+        with _CACHE_LOCK:
+            if _CYCLE_BLOCKS is None or _WINDOWS is None:
+                settings = get_settings()
+                _CYCLE_BLOCKS = LRUCache(settings.TIMELINE_CYCLE_CACHE_BLOCKS)
+                _WINDOWS = LRUCache(settings.TIMELINE_WINDOW_CACHE_SIZE)
+    return _CYCLE_BLOCKS, _WINDOWS
+
+
+def reset_timeline_caches() -> None:
+    global _CYCLE_BLOCKS, _WINDOWS
+    with _CACHE_LOCK:
+        _CYCLE_BLOCKS = None
+        _WINDOWS = None
+
+
+def timeline_cache_stats() -> dict[str, Any]:
+    cycle_blocks, windows = _caches()
+    return {"cycle_blocks": cycle_blocks.stats(), "windows": windows.stats()}
+
+
+def lookup_cycle_blocks(
+    key: Hashable, years: range
+) -> tuple[dict[int, list[Cycle]], list[int]]:
+    cycle_blocks, _ = _caches()
+    blocks: dict[int, list[Cycle]] = {}
+    missing: list[int] = []
+    for year in years:
+        block = cycle_blocks.get((key, year), _MISSING)
+        if block is _MISSING:
+            missing.append(year)
+        else:
+            blocks[year] = block
+    return blocks, missing
+
+
+def store_cycle_block(key: Hashable, year: int, cycles: list[Cycle]) -> None:
+    cycle_blocks, _ = _caches()
+    cycle_blocks.put((key, year), cycles)
+
+
+def cached_window_records(
+    key: Hashable,
+    cycles: list[Cycle],
+    range_from: str,
+    range_to: str,
+    granularity: str,
+) -> tuple[list[Cycle], int]:
+    _, window_cache = _caches()
+    windows = iter_windows(range_from, range_to, granularity)
+    results: dict[str, Cycle | None] = {}
+    missing: list[dict[str, Any]] = []
+    for window in windows:
+        record = window_cache.get((key, granularity, window["id"]), _MISSING)
+        if record is _MISSING:
+            missing.append(window)
+        else:
+            results[window["id"]] = record
+    if missing:
+        computed = {
+            record.start: record for record in build_window_records(cycles, missing, granularity)
+        }
+        for window in missing:
+            record = computed.get(window["start"].strftime("%Y-%m-%d"))
+            results[window["id"]] = record
+            window_cache.put((key, granularity, window["id"]), record)
+    records = [results[window["id"]] for window in windows]
+    return [record for record in records if record is not None], len(missing)
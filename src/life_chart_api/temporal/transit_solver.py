@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+import swisseph as swe
+
+PositionFn = Callable[[float], tuple[float, float]]
+
+_ROOT_TOLERANCE_DAYS = 1.0 / 1440.0
+_MAX_REFINE_STEPS = 60
+
+# Sampling steps are kept shorter than the shortest retrograde or direct phase of
+# each body, so every interval between two samples holds at most one station.
+_SAMPLE_STEP_DAYS = {
+    swe.SUN: 30.0,
+    swe.MOON: 4.0,
+    swe.MERCURY: 5.0,
+    swe.VENUS: 15.0,
+    swe.MARS: 20.0,
+    swe.JUPITER: 60.0,
+    swe.SATURN: 60.0,
+    swe.URANUS: 60.0,
+    swe.NEPTUNE: 60.0,
+    swe.PLUTO: 60.0,
+    swe.MEAN_NODE: 60.0,
+}
+_DEFAULT_STEP_DAYS = 5.0
+
+
+@dataclass(frozen=True)
+class TransitWindow:
+    start_jd: float
+    end_jd: float
+    peak_jd: float
+    peak_delta: float
+    peak_longitude: float
+
+
+@dataclass(frozen=True)
+class StationEvent:
+    jd: float
+    longitude: float
+    retrograde: bool
+
+
+@dataclass(frozen=True)
+class IngressEvent:
+    jd: float
+    sign: int
+    retrograde: bool
+
+
+class PositionSeries:
+    __slots__ = ("_position", "_cache", "calls")
+
+    def __init__(self, position: PositionFn) -> None:
+        self._position = position
+        self._cache: dict[float, tuple[float, float]] = {}
+        self.calls = 0
+
+    def __call__(self, jd_ut: float) -> tuple[float, float]:
+        cached = self._cache.get(jd_ut)
+        if cached is not None:
+            return cached
+        self.calls += 1
+        lon, speed = self._position(jd_ut)
+        value = (lon % 360.0, speed)
+        self._cache[jd_ut] = value
+        return value
+
+
+def wrap180(value: float) -> float:
+    return (value + 180.0) % 360.0 - 180.0
+
+
+def rank_window(window: TransitWindow) -> tuple[float, float]:
+    return round(window.peak_delta, 6), window.peak_jd
+
+
+def sample_step_days(body: int) -> float:
+    return _SAMPLE_STEP_DAYS.get(body, _DEFAULT_STEP_DAYS)
+
+
+def find_root(
+    fn: Callable[[float], tuple[float, float | None]],
+    lo: float,
+    hi: float,
+    f_lo: float,
+    f_hi: float,
+    *,
+    tol: float = _ROOT_TOLERANCE_DAYS,
+) -> float:
+    if f_lo == 0.0:
+        return lo
+    if f_hi == 0.0:
+        return hi
+    t = lo + (hi - lo) * f_lo / (f_lo - f_hi)
+    side = 0
+    for _ in range(_MAX_REFINE_STEPS):
+        value, slope = fn(t)
+        if value == 0.0:
+            return t
+        if (value < 0.0) == (f_lo < 0.0):
+            lo, f_lo = t, value
+            if side == 1:
+                f_hi /= 2.0
+            side = 1
+        else:
+            hi, f_hi = t, value
+            if side == -1:
+                f_lo /= 2.0
+            side = -1
+        if hi - lo < tol:
+            break
+        candidate = None
+        if slope:
+            newton = t - value / slope
+            if lo < newton < hi:
+                candidate = newton
+        if candidate is None:
+            candidate = (lo * f_hi - hi * f_lo) / (f_hi - f_lo)
+            if not lo < candidate < hi:
+                candidate = 0.5 * (lo + hi)
+        if abs(candidate - t) < tol:
+            return candidate
+        t = candidate
+    return t
+
+
+def sample_count(jd_start: float, jd_end: float, step: float) -> int:
+    return max(1, int(math.ceil((jd_end - jd_start) / step))) + 1
+
+
+def sample_nodes(
+    position: PositionFn, jd_start: float, jd_end: float, step: float
+) -> list[tuple[float, float, float]]:
+    count = sample_count(jd_start, jd_end, step) - 1
+    spacing = (jd_end - jd_start) / count
+    raw = []
+    for index in range(count + 1):
+        jd = jd_end if index == count else jd_start + index * spacing
+        lon, speed = position(jd)
+        raw.append((jd, lon % 360.0, speed))
+
+    nodes = [raw[0]]
+    for prev, node in zip(raw, raw[1:], strict=False):
+        if prev[2] != 0.0 and node[2] != 0.0 and (prev[2] < 0.0) != (node[2] < 0.0):
+            station_jd = find_root(
+                lambda t: (position(t)[1], None), prev[0], node[0], prev[2], node[2]
+            )
+            lon, speed = position(station_jd)
+            nodes.append((station_jd, lon % 360.0, speed))
+        nodes.append(node)
+    return nodes
+
+
+def find_stations(nodes: list[tuple[float, float, float]]) -> list[StationEvent]:
+    stations = []
+    for prev, node, following in zip(nodes, nodes[1:], nodes[2:], strict=False):
+        if (prev[2] < 0.0) == (following[2] < 0.0):
+            continue
+        if abs(node[2]) < min(abs(prev[2]), abs(following[2])):
+            stations.append(StationEvent(jd=node[0], longitude=node[1], retrograde=prev[2] > 0.0))
+    return stations
+
+
+def find_ingresses(
+    position: PositionFn, nodes: list[tuple[float, float, float]]
+) -> list[IngressEvent]:
+    ingresses = []
+    for prev, node in zip(nodes, nodes[1:], strict=False):
+        prev_sign = int(prev[1] // 30.0) % 12
+        sign = int(node[1] // 30.0) % 12
+        if prev_sign == sign:
+            continue
+        retrograde = wrap180(node[1] - prev[1]) < 0.0
+        boundary = (prev_sign if retrograde else sign) * 30.0
+        fn = _offset_fn(position, boundary, 0.0)
+        root = find_root(
+            fn, prev[0], node[0], wrap180(prev[1] - boundary), wrap180(node[1] - boundary)
+        )
+        ingresses.append(IngressEvent(jd=root, sign=sign, retrograde=retrograde))
+    return ingresses
+
+
+def _offset_fn(position: PositionFn, target: float, level: float):
+    def fn(jd_ut: float) -> tuple[float, float | None]:
+        lon, speed = position(jd_ut)
+        return wrap180(lon - target) - level, speed
+
+    return fn
+
+
+def _crosses(a: float, b: float) -> bool:
+    return (a < 0.0) != (b < 0.0) and abs(a - b) < 180.0
+
+
+def peak_inside(jd_ut: float, peak_start: float | None, peak_end: float | None) -> bool:
+    return (peak_start is None or jd_ut >= peak_start) and (peak_end is None or jd_ut <= peak_end)
+
+
+def _near_miss(offsets: list[float], idx: int) -> bool:
+    before, offset, after = offsets[idx - 1], offsets[idx], offsets[idx + 1]
+    if (before < 0.0) != (offset < 0.0) or (after < 0.0) != (offset < 0.0):
+        return False
+    return abs(offset) <= abs(before) and abs(offset) <= abs(after)
+
+
+def _solve_target(
+    position: PositionFn,
+    nodes: list[tuple[float, float, float]],
+    target: float,
+    orb: float,
+    peak_start: float | None = None,
+    peak_end: float | None = None,
+) -> TransitWindow | None:
+    offsets = [wrap180(lon - target) for _, lon, _ in nodes]
+
+    for idx in range(len(nodes) - 1):
+        if offsets[idx] != 0.0 and _crosses(offsets[idx], offsets[idx + 1]):
+            if (peak_start is not None and nodes[idx + 1][0] < peak_start) or (
+                peak_end is not None and nodes[idx][0] > peak_end
+            ):
+                continue
+            fn = _offset_fn(position, target, 0.0)
+            root = find_root(fn, nodes[idx][0], nodes[idx + 1][0], offsets[idx], offsets[idx + 1])
+            if not peak_inside(root, peak_start, peak_end):
+                continue
+            peak_index = idx
+            peak_jd = root
+            peak_offset = fn(root)[0]
+            break
+    else:
+        candidates: range | list[int] = range(len(nodes))
+        if peak_start is not None or peak_end is not None:
+            # Without an exact hit inside the bounds, only a near miss that turns back
+            # inside them counts; anything else belongs to a neighbouring range.
+            candidates = [
+                idx
+                for idx in range(1, len(nodes) - 1)
+                if peak_inside(nodes[idx][0], peak_start, peak_end) and _near_miss(offsets, idx)
+            ]
+            if not candidates:
+                return None
+        peak_index = min(candidates, key=lambda idx: (abs(offsets[idx]), idx))
+        peak_jd = nodes[peak_index][0]
+        peak_offset = offsets[peak_index]
+
+    if abs(peak_offset) > orb:
+        return None
+
+    start_jd = nodes[0][0]
+    right_jd, right_offset = peak_jd, peak_offset
+    for idx in range(peak_index, -1, -1):
+        offset = offsets[idx]
+        if abs(offset) > orb:
+            level = math.copysign(orb, offset)
+            fn = _offset_fn(position, target, level)
+            start_jd = find_root(fn, nodes[idx][0], right_jd, offset - level, right_offset - level)
+            break
+        right_jd, right_offset = nodes[idx][0], offset
+
+    end_jd = nodes[-1][0]
+    left_jd, left_offset = peak_jd, peak_offset
+    for idx in range(peak_index + 1, len(nodes)):
+        offset = offsets[idx]
+        if abs(offset) > orb:
+            level = math.copysign(orb, offset)
+            fn = _offset_fn(position, target, level)
+            end_jd = find_root(fn, left_jd, nodes[idx][0], left_offset - level, offset - level)
+            break
+        left_jd, left_offset = nodes[idx][0], offset
+
+    peak_lon, _ = position(peak_jd)
+    return TransitWindow(
+        start_jd=start_jd,
+        end_jd=end_jd,
+        peak_jd=peak_jd,
+        peak_delta=abs(peak_offset),
+        peak_longitude=peak_lon,
+    )
+
+
+def _best_window(
+    position: PositionFn,
+    nodes: list[tuple[float, float, float]],
+    natal_lon: float,
+    aspect_angle: float,
+    orb: float,
+    peak_start: float | None = None,
+    peak_end: float | None = None,
+) -> TransitWindow | None:
+    targets = sorted({(natal_lon + aspect_angle) % 360.0, (natal_lon - aspect_angle) % 360.0})
+    best: TransitWindow | None = None
+    for target in targets:
+        window = _solve_target(position, nodes, target, orb, peak_start, peak_end)
+        if window is None:
+            continue
+        if best is None or rank_window(window) < rank_window(best):
+            best = window
+    return best
+
+
+def find_transit_window(
+    *,
+    position: PositionFn,
+    natal_lon: float,
+    aspect_angle: float,
+    orb: float,
+    jd_start: float,
+    jd_end: float,
+    step: float,
+) -> TransitWindow | None:
+    series = position if isinstance(position, PositionSeries) else PositionSeries(position)
+    nodes = sample_nodes(series, jd_start, jd_end, step)
+    return _best_window(series, nodes, natal_lon, aspect_angle, orb)
+
+
+class TransitSweep:
+    def __init__(
+        self,
+        position: Callable[[float, int], tuple[float, float]],
+        jd_start: float,
+        jd_end: float,
+    ) -> None:
+        self._position = position
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self._series: dict[int, PositionSeries] = {}
+        self._nodes: dict[int, list[tuple[float, float, float]]] = {}
+
+    @property
+    def calls(self) -> int:
+        return sum(series.calls for series in self._series.values())
+
+    def series(self, body: int) -> PositionSeries:
+        series = self._series.get(body)
+        if series is None:
+            position = self._position
+            series = PositionSeries(lambda jd_ut: position(jd_ut, body))
+            self._series[body] = series
+        return series
+
+    def nodes(self, body: int) -> list[tuple[float, float, float]]:
+        nodes = self._nodes.get(body)
+        if nodes is None:
+            nodes = sample_nodes(self.series(body), self.jd_start, self.jd_end, sample_step_days(body))
+            self._nodes[body] = nodes
+        return nodes
+
+    def pending_calls(self, body: int) -> int:
+        if body in self._nodes:
+            return 0
+        return sample_count(self.jd_start, self.jd_end, sample_step_days(body))
+
+    def stations(self, body: int) -> list[StationEvent]:
+        return find_stations(self.nodes(body))
+
+    def ingresses(self, body: int) -> list[IngressEvent]:
+        return find_ingresses(self.series(body), self.nodes(body))
+
+    def window(
+        self,
+        body: int,
+        natal_lon: float,
+        aspect_angle: float,
+        orb: float,
+        peak_start: float | None = None,
+        peak_end: float | None = None,
+    ) -> TransitWindow | None:
+        return _best_window(
+            self.series(body), self.nodes(body), natal_lon, aspect_angle, orb, peak_start, peak_end
+        )
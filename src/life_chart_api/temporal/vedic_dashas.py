@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timezone
-from typing import Any
-from zoneinfo import ZoneInfo
+from datetime import date
+from typing import Any, Iterator
 
 import swisseph as swe
 
-from life_chart_api.temporal.models import clamp01, normalize_iso_ym, sort_cycles, stable_id
+from life_chart_api.ephemeris.natal import NatalContext, natal_context_for_birth
+from life_chart_api.temporal.models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    normalize_iso_ym,
+    parse_cycle_date,
+    sort_records,
+    stable_id,
+)
 
 _DASHA_SEQUENCE = [
     ("Ketu", 7),
@@ -56,6 +64,22 @@ _DASHA_INTENSITY = {
     "Ketu": 0.7,
 }
 
+DASHA_DEPTHS = ("maha", "antar", "pratyantar", "sookshma")
+
+_DASHA_LEVEL_LABELS = {
+    "antar": "Antardasha",
+    "pratyantar": "Pratyantardasha",
+    "sookshma": "Sookshma dasha",
+}
+
+_DASHA_LEVEL_INTENSITY = {
+    "antar": 0.85,
+    "pratyantar": 0.7,
+    "sookshma": 0.55,
+}
+
+_VIMSHOTTARI_YEARS = 120.0
+
 _NAKSHATRA_NAMES = [
     "Ashwini",
     "Bharani",
@@ -87,48 +111,6 @@ _NAKSHATRA_NAMES = [
 ]
 
 
-def _normalize_time(time_str: str) -> str:
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{time_str}:00"
-    if len(parts) == 3:
-        return time_str
-    raise ValueError("time must be HH:MM or HH:MM:SS")
-
-
-def _to_utc(date_str: str, time_str: str, tz_name: str) -> datetime:
-    normalized_time = _normalize_time(time_str)
-    tzinfo = ZoneInfo(tz_name)
-    local_dt = datetime.strptime(
-        f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S"
-    ).replace(tzinfo=tzinfo)
-    return local_dt.astimezone(timezone.utc)
-
-
-def _julday_ut(dt_utc: datetime) -> float:
-    hour_decimal = (
-        dt_utc.hour
-        + dt_utc.minute / 60.0
-        + dt_utc.second / 3600.0
-        + dt_utc.microsecond / 3_600_000_000.0
-    )
-    return swe.julday(
-        dt_utc.year,
-        dt_utc.month,
-        dt_utc.day,
-        hour_decimal,
-        swe.GREG_CAL,
-    )
-
-
-def _moon_sidereal_longitude(dt_utc: datetime) -> float:
-    jd_ut = _julday_ut(dt_utc)
-    ayanamsa = swe.get_ayanamsa_ut(jd_ut)
-    values, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
-    lon = (values[0] - ayanamsa) % 360.0
-    return lon
-
-
 def _nakshatra_index_and_fraction(lon: float) -> tuple[int, float]:
     segment = 360.0 / 27.0
     index = int(lon // segment)
@@ -150,32 +132,126 @@ def _overlaps(start: str, end: str, range_from: str, range_to: str) -> bool:
     return start <= range_to and end >= range_from
 
 
+def _iter_sub_periods(
+    chain: tuple[str, ...],
+    start: float,
+    end: float,
+    levels: tuple[str, ...],
+    range_start: int,
+    range_end: int,
+) -> Iterator[tuple[str, tuple[str, ...], float, float]]:
+    first = [lord for lord, _ in _DASHA_SEQUENCE].index(chain[-1])
+    span = end - start
+    cursor = start
+    for offset in range(len(_DASHA_SEQUENCE)):
+        if cursor > range_end + 1:
+            return
+        lord, years = _DASHA_SEQUENCE[(first + offset) % len(_DASHA_SEQUENCE)]
+        sub_end = cursor + span * years / _VIMSHOTTARI_YEARS
+        if sub_end >= range_start:
+            sub_chain = chain + (lord,)
+            yield levels[0], sub_chain, cursor, sub_end
+            if len(levels) > 1:
+                yield from _iter_sub_periods(
+                    sub_chain, cursor, sub_end, levels[1:], range_start, range_end
+                )
+        cursor = sub_end
+
+
+def _sub_period_cycle(
+    level: str,
+    chain: tuple[str, ...],
+    start_str: str,
+    end_str: str,
+    sequence: list[str],
+) -> Cycle:
+    lord = chain[-1]
+    return Cycle(
+        cycle_id=stable_id(["vedic", level, *chain, start_str, end_str]),
+        system="vedic",
+        kind=f"dasha_{level}",
+        domain="growth",
+        themes=_DASHA_TAGS.get(lord, ["scaffold"]),
+        start=start_str,
+        end=end_str,
+        intensity=clamp01(_DASHA_INTENSITY.get(lord, 0.6) * _DASHA_LEVEL_INTENSITY[level]),
+        polarity=_DASHA_POLARITY.get(lord, "neutral"),
+        evidence=[
+            {
+                "source": "vedic.vimshottari.lord",
+                "value": lord,
+                "weight": 0.8,
+                "note": f"{_DASHA_LEVEL_LABELS[level]} lord.",
+            },
+            {
+                "source": "vedic.vimshottari.chain",
+                "value": list(chain),
+                "weight": 0.6,
+                "note": "Lords from mahadasha down.",
+            },
+            {
+                "source": "vedic.vimshottari.sequence",
+                "value": sequence,
+                "weight": 0.5,
+                "note": "Standard Vimshottari order.",
+            },
+        ],
+        notes=["approx: sidereal moon longitude"],
+    )
+
+
 def build_vedic_dasha_cycles(
     *,
     birth: dict[str, Any],
     range_from: str,
     range_to: str,
     as_of: str | None = None,
+    natal: NatalContext | None = None,
+    depth: str = "maha",
 ) -> list[dict[str, Any]]:
-    dt_utc = _to_utc(
-        birth.get("date", ""),
-        birth.get("time", ""),
-        birth.get("timezone", "UTC"),
+    return cycles_to_dicts(
+        build_vedic_dasha_records(
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+            natal=natal,
+            depth=depth,
+        )
     )
-    moon_lon = _moon_sidereal_longitude(dt_utc)
+
+
+def build_vedic_dasha_records(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    natal: NatalContext | None = None,
+    depth: str = "maha",
+) -> list[Cycle]:
+    if natal is None:
+        natal = natal_context_for_birth(birth)
+    dt_utc = natal.utc
+    moon_lon = natal.sidereal_longitude(swe.MOON)
     nak_index, fraction = _nakshatra_index_and_fraction(moon_lon)
     nak_name = _NAKSHATRA_NAMES[nak_index]
     start_lord = _lord_for_nakshatra(nak_index)
 
     range_from_norm = normalize_iso_ym(range_from)
     range_to_norm = normalize_iso_ym(range_to)
+    sub_levels = DASHA_DEPTHS[1 : DASHA_DEPTHS.index(depth) + 1] if depth in DASHA_DEPTHS else ()
+    range_start = parse_cycle_date(range_from, end=False).toordinal()
+    range_end = parse_cycle_date(range_to, end=True).toordinal()
 
     birth_month_start = date(dt_utc.year, dt_utc.month, 1)
 
     sequence = [lord for lord, _ in _DASHA_SEQUENCE]
     durations = {lord: years for lord, years in _DASHA_SEQUENCE}
 
-    cycles: list[dict[str, Any]] = []
+    cycles: list[Cycle] = []
+    sub_cycles: list[Cycle] = []
+    maha_count = 0
     current_start = birth_month_start
 
     start_years_full = durations[start_lord]
@@ -184,7 +260,7 @@ def build_vedic_dasha_cycles(
 
     sequence_index = sequence.index(start_lord)
     cycle_count = 0
-    while len(cycles) < 36 and current_start.strftime("%Y-%m") <= range_to_norm:
+    while maha_count < 36 and current_start.strftime("%Y-%m") <= range_to_norm:
         lord = sequence[sequence_index % len(sequence)]
         if cycle_count == 0:
             months = remaining_months
@@ -195,40 +271,28 @@ def build_vedic_dasha_cycles(
         end_str = end_date.strftime("%Y-%m")
 
         if _overlaps(start_str, end_str, range_from_norm, range_to_norm):
-            cycle = {
-                "cycleId": stable_id(["vedic", "maha", lord, start_str, end_str]),
-                "system": "vedic",
-                "kind": "dasha_maha",
-                "domain": "growth",
-                "themes": _DASHA_TAGS.get(lord, ["scaffold"]),
-                "start": start_str,
-                "end": end_str,
-                "intensity": clamp01(_DASHA_INTENSITY.get(lord, 0.6)),
-                "polarity": _DASHA_POLARITY.get(lord, "neutral"),
-                "evidence": [
-                    {
-                        "source": "vedic.vimshottari.lord",
-                        "value": lord,
-                        "weight": 0.8,
-                        "note": "Mahadasha lord.",
-                    },
-                    {
-                        "source": "vedic.nakshatra",
-                        "value": {"index": nak_index + 1, "name": nak_name},
-                        "weight": 0.7,
-                        "note": "Birth nakshatra.",
-                    },
-                    {
-                        "source": "vedic.vimshottari.sequence",
-                        "value": sequence,
-                        "weight": 0.5,
-                        "note": "Standard Vimshottari order.",
-                    },
-                ],
-                "notes": ["approx: sidereal moon longitude"],
-            }
+            evidence = [
+                {
+                    "source": "vedic.vimshottari.lord",
+                    "value": lord,
+                    "weight": 0.8,
+                    "note": "Mahadasha lord.",
+                },
+                {
+                    "source": "vedic.nakshatra",
+                    "value": {"index": nak_index + 1, "name": nak_name},
+                    "weight": 0.7,
+                    "note": "Birth nakshatra.",
+                },
+                {
+                    "source": "vedic.vimshottari.sequence",
+                    "value": sequence,
+                    "weight": 0.5,
+                    "note": "Standard Vimshottari order.",
+                },
+            ]
             if cycle_count == 0 and 0.0 < fraction < 1.0:
-                cycle["evidence"].append(
+                evidence.append(
                     {
                         "source": "vedic.vimshottari.assumptions",
                         "value": {"fraction_completed": round(fraction, 3)},
@@ -236,10 +300,47 @@ def build_vedic_dasha_cycles(
                         "note": "Approx: fractional start based on moon longitude.",
                     }
                 )
-            cycles.append(cycle)
+            cycles.append(
+                Cycle(
+                    cycle_id=stable_id(["vedic", "maha", lord, start_str, end_str]),
+                    system="vedic",
+                    kind="dasha_maha",
+                    domain="growth",
+                    themes=_DASHA_TAGS.get(lord, ["scaffold"]),
+                    start=start_str,
+                    end=end_str,
+                    intensity=clamp01(_DASHA_INTENSITY.get(lord, 0.6)),
+                    polarity=_DASHA_POLARITY.get(lord, "neutral"),
+                    evidence=evidence,
+                    notes=["approx: sidereal moon longitude"],
+                )
+            )
+            maha_count += 1
+
+            if sub_levels:
+                maha_start = current_start.toordinal()
+                maha_end = end_date.toordinal()
+                full_months = int(round(durations[lord] * 12))
+                virtual_start = maha_end - (maha_end - maha_start) * full_months / months
+                for level, chain, sub_start, sub_end in _iter_sub_periods(
+                    (lord,), virtual_start, maha_end, sub_levels, range_start, range_end
+                ):
+                    first_day = max(round(sub_start), maha_start)
+                    last_day = round(sub_end) - 1
+                    if last_day < first_day or last_day < range_start or first_day > range_end:
+                        continue
+                    sub_cycles.append(
+                        _sub_period_cycle(
+                            level,
+                            chain,
+                            date.fromordinal(first_day).isoformat(),
+                            date.fromordinal(last_day).isoformat(),
+                            sequence,
+                        )
+                    )
 
         current_start = end_date
         sequence_index += 1
         cycle_count += 1
 
-    return sort_cycles(cycles)
+    return sort_records(cycles + sub_cycles)
@@ -1,76 +1,298 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta, timezone
+import logging
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
-from zoneinfo import ZoneInfo
 
 import swisseph as swe
 
-from life_chart_api.temporal.models import clamp01, normalize_iso_ym, sort_cycles, stable_id
+from life_chart_api.ephemeris.natal import (
+    NatalContext,
+    datetime_from_julian_day,
+    julian_day,
+    natal_context_for_birth,
+)
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.crossing_index import CROSSING_INDEX, CrossingIndexRange
+from life_chart_api.temporal.models import (
+    Cycle,
+    clamp01,
+    cycles_to_dicts,
+    normalize_iso_ym,
+    sort_records,
+    stable_id,
+)
+from life_chart_api.temporal.sky_table import sky_longitude
+from life_chart_api.temporal.transit_solver import (
+    TransitSweep,
+    peak_inside,
+    sample_count,
+    sample_step_days,
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 _ORB_RETURN = 2.0
 _ORB_SATURN_ASPECT = 1.5
+_ORB_OUTER_ASPECT = 1.5
 
-_ASPECTS = {
+ASPECTS = {
     "conjunction": 0.0,
+    "sextile": 60.0,
     "square": 90.0,
+    "trine": 120.0,
     "opposition": 180.0,
 }
+_MINOR_ASPECTS = ("trine", "sextile")
+
+NATAL_POINTS = (
+    ("sun", swe.SUN),
+    ("moon", swe.MOON),
+    ("mercury", swe.MERCURY),
+    ("venus", swe.VENUS),
+    ("mars", swe.MARS),
+    ("jupiter", swe.JUPITER),
+    ("saturn", swe.SATURN),
+    ("uranus", swe.URANUS),
+    ("neptune", swe.NEPTUNE),
+    ("pluto", swe.PLUTO),
+    ("node", swe.MEAN_NODE),
+)
+_PERSONAL_POINTS = ("sun", "moon", "mercury", "venus", "mars", "asc", "mc")
+_OUTER_POINTS = ("jupiter", "saturn", "uranus", "neptune", "pluto", "node")
+
+TARGET_DOMAINS = {
+    "sun": "career",
+    "moon": "relationships",
+    "mercury": "mind",
+    "venus": "relationships",
+    "mars": "energy",
+    "jupiter": "growth",
+    "saturn": "career",
+    "uranus": "growth",
+    "neptune": "growth",
+    "pluto": "growth",
+    "node": "growth",
+    "asc": "growth",
+    "mc": "career",
+}
+
+_OUTER_PLANETS = (
+    ("transit_uranus_aspect", swe.URANUS, 0.7),
+    ("transit_neptune_aspect", swe.NEPTUNE, 0.65),
+    ("transit_pluto_aspect", swe.PLUTO, 0.75),
+)
+
+# Ephemeris calls per combination and year of range, measured on the solver.
+# The solver also samples each body once; the crossing index answers from its
+# process-wide blocks and is counted as free.
+_SOLVER_CALLS_PER_COMBINATION_YEAR = 0.5
+_SCAN_WINDOW_DAYS = 93
 
 _EVENT_THEMES = {
     "return_saturn": ["saturn_return", "discipline", "responsibility"],
     "return_jupiter": ["jupiter_return", "expansion", "growth"],
     "transit_saturn_aspect": ["saturn_transit", "pressure", "structure"],
+    "transit_uranus_aspect": ["uranus_transit", "disruption", "awakening"],
+    "transit_neptune_aspect": ["neptune_transit", "spirituality", "dissolution"],
+    "transit_pluto_aspect": ["pluto_transit", "transformation", "pressure"],
+    "station_retrograde": ["station", "review", "slowdown"],
+    "station_direct": ["station", "momentum", "release"],
+    "ingress": ["ingress", "new_chapter"],
 }
 
-
-def _normalize_time(time_str: str) -> str:
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{time_str}:00"
-    if len(parts) == 3:
-        return time_str
-    raise ValueError("time must be HH:MM or HH:MM:SS")
+_STATION_WINDOW_DAYS = 7
+_INGRESS_WINDOW_DAYS = 14
+
+_EVENT_BODIES = (
+    ("jupiter", swe.JUPITER, 0.4),
+    ("saturn", swe.SATURN, 0.45),
+    ("uranus", swe.URANUS, 0.35),
+    ("neptune", swe.NEPTUNE, 0.3),
+    ("pluto", swe.PLUTO, 0.3),
+)
+
+SIGNS = (
+    "aries",
+    "taurus",
+    "gemini",
+    "cancer",
+    "leo",
+    "virgo",
+    "libra",
+    "scorpio",
+    "sagittarius",
+    "capricorn",
+    "aquarius",
+    "pisces",
+)
+
+
+@dataclass(frozen=True)
+class TransitCombination:
+    kind: str
+    planet_id: int
+    target: str
+    aspect: str
+    orb: float
+    intensity: float
+    polarity: str
+    tier: int
+
+
+@dataclass(frozen=True)
+class TransitPlan:
+    combinations: tuple[TransitCombination, ...]
+    estimated_calls: int
+    dropped: int
+
+
+def _aspect_polarity(aspect: str, major: str) -> str:
+    return "supporting" if aspect in _MINOR_ASPECTS else major
+
+
+def _aspect_intensity(aspect: str, base: float) -> float:
+    if aspect == "trine":
+        return base - 0.15
+    if aspect == "sextile":
+        return base - 0.25
+    return base
+
+
+def _aspect_tier(aspect: str, major_tier: int) -> int:
+    if aspect == "sextile":
+        return 4
+    if aspect == "trine":
+        return 3
+    return major_tier
+
+
+def transit_combinations() -> list[TransitCombination]:
+    combinations = [
+        TransitCombination(
+            kind=kind,
+            planet_id=planet_id,
+            target=target,
+            aspect="conjunction",
+            orb=_ORB_RETURN,
+            intensity=intensity,
+            polarity=polarity,
+            tier=0,
+        )
+        for kind, planet_id, target, polarity, intensity in (
+            ("return_saturn", swe.SATURN, "saturn", "challenging", 0.85),
+            ("return_jupiter", swe.JUPITER, "jupiter", "supporting", 0.65),
+        )
+    ]
+    for target in ("sun", "moon", "asc"):
+        for aspect in ASPECTS:
+            combinations.append(
+                TransitCombination(
+                    kind="transit_saturn_aspect",
+                    planet_id=swe.SATURN,
+                    target=target,
+                    aspect=aspect,
+                    orb=_ORB_SATURN_ASPECT,
+                    intensity=_aspect_intensity(aspect, 0.75),
+                    polarity=_aspect_polarity(aspect, "challenging"),
+                    tier=_aspect_tier(aspect, 0),
+                )
+            )
+    for kind, planet_id, base in _OUTER_PLANETS:
+        for target in _PERSONAL_POINTS + _OUTER_POINTS:
+            for aspect in ASPECTS:
+                combinations.append(
+                    TransitCombination(
+                        kind=kind,
+                        planet_id=planet_id,
+                        target=target,
+                        aspect=aspect,
+                        orb=_ORB_OUTER_ASPECT,
+                        intensity=_aspect_intensity(aspect, base),
+                        polarity=_aspect_polarity(
+                            aspect, "neutral" if aspect == "conjunction" else "challenging"
+                        ),
+                        tier=_aspect_tier(aspect, 1 if target in _PERSONAL_POINTS else 2),
+                    )
+                )
+    return combinations
+
+
+def estimate_transit_calls(
+    combinations: list[TransitCombination] | tuple[TransitCombination, ...],
+    *,
+    method: str,
+    range_start: date,
+    range_end: date,
+) -> int:
+    if method == "scan":
+        months = len(_month_range(range_start, range_end))
+        return len(combinations) * (months + _SCAN_WINDOW_DAYS + 1)
+    if method == "index":
+        return 0
+    jd_start, jd_end = range_julian_days(range_start, range_end)
+    bodies = {combination.planet_id for combination in combinations}
+    sampling = sum(sample_count(jd_start, jd_end, sample_step_days(body)) for body in bodies)
+    years = (jd_end - jd_start) / 365.25
+    return sampling + math.ceil(len(combinations) * years * _SOLVER_CALLS_PER_COMBINATION_YEAR)
+
+
+def plan_western_transits(
+    *,
+    method: str,
+    range_start: date,
+    range_end: date,
+    cap: int,
+) -> TransitPlan:
+    combinations = transit_combinations()
+    total = len(combinations)
+    estimate = estimate_transit_calls(
+        combinations, method=method, range_start=range_start, range_end=range_end
+    )
+    tier = max(combination.tier for combination in combinations)
+    while estimate > cap and tier > 0:
+        combinations = [combination for combination in combinations if combination.tier < tier]
+        estimate = estimate_transit_calls(
+            combinations, method=method, range_start=range_start, range_end=range_end
+        )
+        tier -= 1
+    return TransitPlan(
+        combinations=tuple(combinations),
+        estimated_calls=estimate,
+        dropped=total - len(combinations),
+    )
 
 
-def _to_utc(date_str: str, time_str: str, tz_name: str) -> datetime:
-    normalized_time = _normalize_time(time_str)
-    tzinfo = ZoneInfo(tz_name)
-    local_dt = datetime.strptime(
-        f"{date_str} {normalized_time}", "%Y-%m-%d %H:%M:%S"
-    ).replace(tzinfo=tzinfo)
-    return local_dt.astimezone(timezone.utc)
+def _bracket(range_from: str, range_to: str, pad_months: int) -> tuple[date, date, date, date]:
+    peak_start, peak_end = date_range(normalize_iso_ym(range_from), normalize_iso_ym(range_to))
+    # With padding, events are solved over the wider bracket but only kept when their
+    # exact time falls inside the requested range, so adjacent ranges never split one.
+    range_start = _add_months(peak_start, -pad_months)
+    range_end = _add_months(peak_end, pad_months)
+    return peak_start, peak_end, range_start, _last_day_of_month(range_end.year, range_end.month)
 
 
-def _julday_ut(dt_utc: datetime) -> float:
-    hour_decimal = (
-        dt_utc.hour
-        + dt_utc.minute / 60.0
-        + dt_utc.second / 3600.0
-        + dt_utc.microsecond / 3_600_000_000.0
-    )
-    return swe.julday(
-        dt_utc.year,
-        dt_utc.month,
-        dt_utc.day,
-        hour_decimal,
-        swe.GREG_CAL,
+def plan_western_range(
+    *,
+    range_from: str,
+    range_to: str,
+    method: str | None = None,
+    pad_months: int = 0,
+) -> TransitPlan:
+    _, _, range_start, range_end = _bracket(range_from, range_to, pad_months)
+    return plan_western_transits(
+        method=method or get_settings().WESTERN_TRANSIT_METHOD,
+        range_start=range_start,
+        range_end=range_end,
+        cap=get_settings().WESTERN_TRANSIT_CALL_CAP,
     )
 
 
-def _planet_longitude(dt_utc: datetime, planet_id: int) -> float:
-    jd_ut = _julday_ut(dt_utc)
-    values, _ = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-    return values[0] % 360.0
-
-
-def _ascendant_longitude(dt_utc: datetime, lat: float, lon: float) -> float:
-    jd_ut = _julday_ut(dt_utc)
-    try:
-        _, ascmc = swe.houses_ex(jd_ut, lat, lon, b"P")
-    except Exception:
-        _, ascmc = swe.houses(jd_ut, lat, lon, b"P")
-    return ascmc[0] % 360.0
+def _planet_position(jd_ut: float, planet_id: int) -> tuple[float, float]:
+    return body_position(jd_ut, planet_id)
 
 
 def _angular_distance(a: float, b: float) -> float:
@@ -100,7 +322,12 @@ def _last_day_of_month(year: int, month: int) -> date:
     return date(year, month + 1, 1) - timedelta(days=1)
 
 
-def _date_range(from_ym: str, to_ym: str) -> tuple[date, date]:
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def date_range(from_ym: str, to_ym: str) -> tuple[date, date]:
     from_year, from_month = map(int, from_ym.split("-"))
     to_year, to_month = map(int, to_ym.split("-"))
     start = date(from_year, from_month, 1)
@@ -121,8 +348,7 @@ def _find_event_window(
     best_month = None
     best_delta = 999.0
     for month_start in monthly_dates:
-        dt = datetime(month_start.year, month_start.month, 1, tzinfo=timezone.utc)
-        trans_lon = _planet_longitude(dt, planet_id)
+        trans_lon = sky_longitude(month_start, planet_id)
         delta = _aspect_delta(natal_lon, trans_lon, aspect_angle)
         if delta < best_delta:
             best_delta = delta
@@ -143,8 +369,7 @@ def _find_event_window(
     peak_day = None
     peak_delta = 999.0
     while current <= window_end:
-        dt = datetime(current.year, current.month, current.day, tzinfo=timezone.utc)
-        trans_lon = _planet_longitude(dt, planet_id)
+        trans_lon = sky_longitude(current, planet_id)
         delta = _aspect_delta(natal_lon, trans_lon, aspect_angle)
         if delta < peak_delta:
             peak_delta = delta
@@ -162,150 +387,358 @@ def _find_event_window(
     return first_day, last_day, peak_day, peak_delta
 
 
+def range_julian_days(range_start: date, range_end: date) -> tuple[float, float]:
+    jd_start = julian_day(datetime.combine(range_start, time.min, tzinfo=timezone.utc))
+    jd_end = julian_day(datetime.combine(range_end, time.max, tzinfo=timezone.utc))
+    return jd_start, jd_end
+
+
+# The range end is 23:59:59.999 UT, which rounds to the next midnight on the way back.
+def _clamp_day(day: date, range_start: date, range_end: date) -> date:
+    return min(max(day, range_start), range_end)
+
+
+def _locate_event(
+    *,
+    sweep: TransitSweep | CrossingIndexRange | None,
+    natal_lon: float,
+    planet_id: int,
+    aspect_angle: float,
+    orb: float,
+    range_start: date,
+    range_end: date,
+    peak_range: tuple[date, date] | None = None,
+) -> tuple[date, date, date, float, float, datetime | None] | None:
+    peak_start, peak_end = peak_range or (range_start, range_end)
+    if sweep is None:
+        result = _find_event_window(
+            natal_lon=natal_lon,
+            planet_id=planet_id,
+            aspect_angle=aspect_angle,
+            orb=orb,
+            range_start=range_start,
+            range_end=range_end,
+        )
+        if result is None or not peak_start <= result[2] <= peak_end:
+            return None
+        start_day, end_day, peak_day, delta = result
+        trans_lon = sky_longitude(peak_day, planet_id)
+        return start_day, end_day, peak_day, delta, trans_lon, None
+
+    peak_jds = range_julian_days(peak_start, peak_end) if peak_range else (None, None)
+    window = sweep.window(planet_id, natal_lon, aspect_angle, orb, *peak_jds)
+    if window is None:
+        return None
+    peak_time = datetime_from_julian_day(window.peak_jd)
+    return (
+        _clamp_day(datetime_from_julian_day(window.start_jd).date(), range_start, range_end),
+        _clamp_day(datetime_from_julian_day(window.end_jd).date(), range_start, range_end),
+        _clamp_day(peak_time.date(), peak_start, peak_end),
+        window.peak_delta,
+        window.peak_longitude,
+        peak_time,
+    )
+
+
+def _method_evidence(method: str) -> dict[str, Any]:
+    if method == "scan":
+        return {
+            "source": "western.transit.method",
+            "value": "monthly+daily",
+            "weight": 0.4,
+            "note": "Coarse-to-fine scan.",
+        }
+    if method == "index":
+        return {
+            "source": "western.transit.method",
+            "value": "crossing-index",
+            "weight": 0.4,
+            "note": "Binary search over precomputed crossing segments.",
+        }
+    return {
+        "source": "western.transit.method",
+        "value": "bracket+newton",
+        "weight": 0.4,
+        "note": "Root-finding on ephemeris longitude and speed.",
+    }
+
+
+def _peak_value(base: dict[str, Any], peak_time: datetime | None) -> dict[str, Any]:
+    if peak_time is not None:
+        base["time"] = peak_time.strftime("%Y-%m-%dT%H:%MZ")
+    return base
+
+
+def _event_window(day: date, days: int, range_start: date, range_end: date) -> tuple[str, str]:
+    start = max(day - timedelta(days=days), range_start)
+    end = min(day + timedelta(days=days), range_end)
+    return normalize_iso_ym(start), normalize_iso_ym(end)
+
+
+def _station_ingress_records(
+    *,
+    sweep: TransitSweep,
+    range_start: date,
+    range_end: date,
+    budget: int,
+    peak_range: tuple[date, date] | None = None,
+) -> list[Cycle]:
+    peak_jds = range_julian_days(*peak_range) if peak_range else (None, None)
+    cycles: list[Cycle] = []
+    spent = 0
+    for planet, body, intensity in _EVENT_BODIES:
+        if spent + sweep.pending_calls(body) > budget:
+            break
+        series = sweep.series(body)
+        before = series.calls
+        stations = sweep.stations(body)
+        ingresses = sweep.ingresses(body)
+        spent += series.calls - before
+
+        for station in stations:
+            if not peak_inside(station.jd, *peak_jds):
+                continue
+            moment = datetime_from_julian_day(station.jd)
+            kind = "station_retrograde" if station.retrograde else "station_direct"
+            start_str, end_str = _event_window(
+                moment.date(), _STATION_WINDOW_DAYS, range_start, range_end
+            )
+            peak_str = moment.strftime("%Y-%m-%d")
+            cycles.append(
+                Cycle(
+                    cycle_id=stable_id(["western", kind, planet, peak_str]),
+                    system="western",
+                    kind=kind,
+                    domain="growth",
+                    themes=_EVENT_THEMES[kind] + [f"planet:{planet}"],
+                    start=start_str,
+                    end=end_str,
+                    peak=peak_str,
+                    intensity=clamp01(intensity),
+                    polarity="challenging" if station.retrograde else "supporting",
+                    evidence=[
+                        {
+                            "source": "western.transit.peak",
+                            "value": {
+                                "planet": planet,
+                                "longitude": round(station.longitude, 2),
+                                "time": moment.strftime("%Y-%m-%dT%H:%MZ"),
+                            },
+                            "weight": 0.7,
+                            "note": "Ephemeris speed changes sign.",
+                        },
+                        _method_evidence("solver"),
+                    ],
+                    notes=[],
+                )
+            )
+
+        for ingress in ingresses:
+            if not peak_inside(ingress.jd, *peak_jds):
+                continue
+            moment = datetime_from_julian_day(ingress.jd)
+            sign = SIGNS[ingress.sign]
+            start_str, end_str = _event_window(
+                moment.date(), _INGRESS_WINDOW_DAYS, range_start, range_end
+            )
+            peak_str = moment.strftime("%Y-%m-%d")
+            cycles.append(
+                Cycle(
+                    cycle_id=stable_id(["western", "ingress", planet, sign, peak_str]),
+                    system="western",
+                    kind="ingress",
+                    domain="growth",
+                    themes=_EVENT_THEMES["ingress"] + [f"planet:{planet}", f"sign:{sign}"],
+                    start=start_str,
+                    end=end_str,
+                    peak=peak_str,
+                    intensity=clamp01(intensity - 0.05),
+                    polarity="neutral",
+                    evidence=[
+                        {
+                            "source": "western.transit.peak",
+                            "value": {
+                                "planet": planet,
+                                "sign": sign,
+                                "retrograde": ingress.retrograde,
+                                "time": moment.strftime("%Y-%m-%dT%H:%MZ"),
+                            },
+                            "weight": 0.7,
+                            "note": "Longitude crosses a sign boundary.",
+                        },
+                        _method_evidence("solver"),
+                    ],
+                    notes=[],
+                )
+            )
+    return cycles
+
+
 def build_western_transit_cycles(
     *,
     birth: dict[str, Any],
     range_from: str,
     range_to: str,
     as_of: str | None = None,
+    method: str | None = None,
+    natal: NatalContext | None = None,
+    pad_months: int = 0,
 ) -> list[dict[str, Any]]:
-    dt_utc = _to_utc(
-        birth.get("date", ""),
-        birth.get("time", ""),
-        birth.get("timezone", "UTC"),
+    return cycles_to_dicts(
+        build_western_transit_records(
+            birth=birth,
+            range_from=range_from,
+            range_to=range_to,
+            as_of=as_of,
+            method=method,
+            natal=natal,
+            pad_months=pad_months,
+        )
     )
-    lat = birth.get("location", {}).get("lat", 0.0)
-    lon = birth.get("location", {}).get("lon", 0.0)
-
-    natal = {
-        "sun": _planet_longitude(dt_utc, swe.SUN),
-        "moon": _planet_longitude(dt_utc, swe.MOON),
-        "saturn": _planet_longitude(dt_utc, swe.SATURN),
-        "jupiter": _planet_longitude(dt_utc, swe.JUPITER),
-        "asc": _ascendant_longitude(dt_utc, lat, lon),
-    }
-
-    range_from_norm = normalize_iso_ym(range_from)
-    range_to_norm = normalize_iso_ym(range_to)
-    range_start, range_end = _date_range(range_from_norm, range_to_norm)
 
-    cycles: list[dict[str, Any]] = []
 
-    for kind, planet_id, natal_key, orb, polarity, intensity in (
-        ("return_saturn", swe.SATURN, "saturn", _ORB_RETURN, "challenging", 0.85),
-        ("return_jupiter", swe.JUPITER, "jupiter", _ORB_RETURN, "supporting", 0.65),
-    ):
-        result = _find_event_window(
-            natal_lon=natal[natal_key],
-            planet_id=planet_id,
-            aspect_angle=0.0,
-            orb=orb,
+def build_western_transit_records(
+    *,
+    birth: dict[str, Any],
+    range_from: str,
+    range_to: str,
+    as_of: str | None = None,
+    method: str | None = None,
+    natal: NatalContext | None = None,
+    pad_months: int = 0,
+) -> list[Cycle]:
+    method = method or get_settings().WESTERN_TRANSIT_METHOD
+    if natal is None:
+        natal = natal_context_for_birth(birth)
+
+    natal_points = {name: natal.longitude(body) for name, body in NATAL_POINTS}
+    natal_points["asc"] = natal.ascendant
+    natal_points["mc"] = natal.ascmc[1] % 360.0
+
+    peak_start, peak_end, range_start, range_end = _bracket(range_from, range_to, pad_months)
+    peak_range = (peak_start, peak_end) if pad_months > 0 else None
+    sweep: TransitSweep | CrossingIndexRange | None = None
+    if method == "index":
+        sweep = CrossingIndexRange(CROSSING_INDEX, *range_julian_days(range_start, range_end))
+    elif method != "scan":
+        sweep = TransitSweep(_planet_position, *range_julian_days(range_start, range_end))
+
+    plan = plan_western_transits(
+        method=method,
+        range_start=range_start,
+        range_end=range_end,
+        cap=get_settings().WESTERN_TRANSIT_CALL_CAP,
+    )
+    if plan.dropped:
+        _LOGGER.warning(
+            "Western transit call cap dropped %d combinations for %s..%s (estimated calls %d)",
+            plan.dropped,
+            range_start.isoformat(),
+            range_end.isoformat(),
+            plan.estimated_calls,
+        )
+    cycles: list[Cycle] = []
+
+    for combination in plan.combinations:
+        result = _locate_event(
+            sweep=sweep,
+            natal_lon=natal_points[combination.target],
+            planet_id=combination.planet_id,
+            aspect_angle=ASPECTS[combination.aspect],
+            orb=combination.orb,
             range_start=range_start,
             range_end=range_end,
+            peak_range=peak_range,
         )
         if result is None:
             continue
-        start_day, end_day, peak_day, delta = result
-        trans_lon = _planet_longitude(
-            datetime(peak_day.year, peak_day.month, peak_day.day, tzinfo=timezone.utc),
-            planet_id,
-        )
+        start_day, end_day, peak_day, delta, trans_lon, peak_time = result
         start_str = normalize_iso_ym(start_day)
         end_str = normalize_iso_ym(end_day)
         peak_str = peak_day.strftime("%Y-%m-%d")
+        target_key = combination.target
+        natal_evidence = {
+            "source": "western.natal.longitude",
+            "value": {"planet": target_key, "longitude": round(natal_points[target_key], 2)},
+            "weight": 0.8,
+            "note": "Natal longitude.",
+        }
+        if combination.kind.startswith("return_"):
+            cycles.append(
+                Cycle(
+                    cycle_id=stable_id(["western", combination.kind, target_key, start_str, end_str]),
+                    system="western",
+                    kind=combination.kind,
+                    domain="growth",
+                    themes=_EVENT_THEMES[combination.kind],
+                    start=start_str,
+                    end=end_str,
+                    peak=peak_str,
+                    intensity=clamp01(combination.intensity),
+                    polarity=combination.polarity,
+                    evidence=[
+                        natal_evidence,
+                        {
+                            "source": "western.transit.peak",
+                            "value": _peak_value(
+                                {"longitude": round(trans_lon, 2), "delta": round(delta, 2)}, peak_time
+                            ),
+                            "weight": 0.6,
+                            "note": "Closest approach within orb.",
+                        },
+                        _method_evidence(method),
+                    ],
+                    notes=[],
+                )
+            )
+            continue
+        aspect_name = combination.aspect
         cycles.append(
-            {
-                "cycleId": stable_id(["western", kind, natal_key, start_str, end_str]),
-                "system": "western",
-                "kind": kind,
-                "domain": "growth",
-                "themes": _EVENT_THEMES[kind],
-                "start": start_str,
-                "end": end_str,
-                "peak": peak_str,
-                "intensity": clamp01(intensity),
-                "polarity": polarity,
-                "evidence": [
-                    {
-                        "source": "western.natal.longitude",
-                        "value": {"planet": natal_key, "longitude": round(natal[natal_key], 2)},
-                        "weight": 0.8,
-                        "note": "Natal longitude.",
-                    },
+            Cycle(
+                cycle_id=stable_id(
+                    ["western", combination.kind, target_key, aspect_name, start_str, end_str]
+                ),
+                system="western",
+                kind=combination.kind,
+                domain=TARGET_DOMAINS[target_key],
+                themes=_EVENT_THEMES[combination.kind]
+                + [f"aspect:{aspect_name}", f"target:{target_key}"],
+                start=start_str,
+                end=end_str,
+                peak=peak_str,
+                intensity=clamp01(combination.intensity),
+                polarity=combination.polarity,
+                evidence=[
+                    natal_evidence,
                     {
                         "source": "western.transit.peak",
-                        "value": {"longitude": round(trans_lon, 2), "delta": round(delta, 2)},
+                        "value": _peak_value(
+                            {"aspect": aspect_name, "longitude": round(trans_lon, 2), "delta": round(delta, 2)},
+                            peak_time,
+                        ),
                         "weight": 0.6,
                         "note": "Closest approach within orb.",
                     },
-                    {
-                        "source": "western.transit.method",
-                        "value": "monthly+daily",
-                        "weight": 0.4,
-                        "note": "Coarse-to-fine scan.",
-                    },
+                    _method_evidence(method),
                 ],
-                "notes": [],
-            }
+                notes=[],
+            )
         )
 
-    for target_key, domain in (("sun", "career"), ("moon", "relationships"), ("asc", "growth")):
-        for aspect_name, angle in _ASPECTS.items():
-            result = _find_event_window(
-                natal_lon=natal[target_key],
-                planet_id=swe.SATURN,
-                aspect_angle=angle,
-                orb=_ORB_SATURN_ASPECT,
+    budget = get_settings().WESTERN_EVENT_CALL_BUDGET
+    if budget > 0:
+        cycles.extend(
+            _station_ingress_records(
+                sweep=(
+                    sweep
+                    if isinstance(sweep, TransitSweep)
+                    else TransitSweep(_planet_position, *range_julian_days(range_start, range_end))
+                ),
                 range_start=range_start,
                 range_end=range_end,
+                budget=budget,
+                peak_range=peak_range,
             )
-            if result is None:
-                continue
-            start_day, end_day, peak_day, delta = result
-            trans_lon = _planet_longitude(
-                datetime(peak_day.year, peak_day.month, peak_day.day, tzinfo=timezone.utc),
-                swe.SATURN,
-            )
-            start_str = normalize_iso_ym(start_day)
-            end_str = normalize_iso_ym(end_day)
-            peak_str = peak_day.strftime("%Y-%m-%d")
-            cycles.append(
-                {
-                    "cycleId": stable_id(
-                        ["western", "transit_saturn_aspect", target_key, aspect_name, start_str, end_str]
-                    ),
-                    "system": "western",
-                    "kind": "transit_saturn_aspect",
-                    "domain": domain,
-                    "themes": _EVENT_THEMES["transit_saturn_aspect"]
-                    + [f"aspect:{aspect_name}", f"target:{target_key}"],
-                    "start": start_str,
-                    "end": end_str,
-                    "peak": peak_str,
-                    "intensity": clamp01(0.75),
-                    "polarity": "challenging",
-                    "evidence": [
-                        {
-                            "source": "western.natal.longitude",
-                            "value": {"planet": target_key, "longitude": round(natal[target_key], 2)},
-                            "weight": 0.8,
-                            "note": "Natal longitude.",
-                        },
-                        {
-                            "source": "western.transit.peak",
-                            "value": {"aspect": aspect_name, "longitude": round(trans_lon, 2), "delta": round(delta, 2)},
-                            "weight": 0.6,
-                            "note": "Closest approach within orb.",
-                        },
-                        {
-                            "source": "western.transit.method",
-                            "value": "monthly+daily",
-                            "weight": 0.4,
-                            "note": "Coarse-to-fine scan.",
-                        },
-                    ],
-                    "notes": [],
-                }
-            )
+        )
 
-    return sort_cycles(cycles)
+    return sort_records(cycles)
@@ -5,6 +5,9 @@ SCHEMA_VERSION_TIMELINE = "phase2.3"
 SCHEMA_VERSION_TIMELINE_SCAFFOLD = "phase2.1"
 SCHEMA_VERSION_FORECAST = "phase2.4"
 SCHEMA_VERSION_NARRATIVE = "phase3.2"
+SCHEMA_VERSION_RETURNS = "phase2.5"
+SCHEMA_VERSION_NOW = "phase2.6"
+SCHEMA_VERSION_TRANSITS = "phase2.7"
 SCHEMA_VERSION_ERROR = "v1"
 
 
@@ -19,6 +22,12 @@ def schema_version_for_path(path: str) -> str:
         return SCHEMA_VERSION_FORECAST
     if path.startswith("/profile/narrative"):
         return SCHEMA_VERSION_NARRATIVE
+    if path.startswith("/profile/returns"):
+        return SCHEMA_VERSION_RETURNS
+    if path.startswith("/profile/now"):
+        return SCHEMA_VERSION_NOW
+    if path.startswith("/profile/transits"):
+        return SCHEMA_VERSION_TRANSITS
     if path.startswith("/numerology/compute"):
         return "v1"
     if path.startswith("/meta"):
@@ -0,0 +1,34 @@
+import pytest
+
+from life_chart_api.inputs.birth_moment import get_zone, normalize_birth_moment
+
+
+def test_birth_moment_exact_local_time():
+    moment = normalize_birth_moment("1999-02-26", "14:00", "Asia/Kolkata")
+    assert moment.resolution == "exact"
+    assert moment.fold == 0
+    assert moment.utc.isoformat() == "1999-02-26T08:30:00+00:00"
+    assert moment.local.isoformat() == "1999-02-26T14:00:00+05:30"
+    assert normalize_birth_moment("1999-02-26", "14:00", "Asia/Kolkata") is moment
+
+
+def test_birth_moment_ambiguous_time_takes_first_occurrence():
+    moment = normalize_birth_moment("2021-11-07", "01:30:00", "America/New_York")
+    assert moment.resolution == "ambiguous"
+    assert moment.fold == 0
+    assert moment.utc.isoformat() == "2021-11-07T05:30:00+00:00"
+
+
+def test_birth_moment_nonexistent_time_uses_pre_transition_offset():
+    moment = normalize_birth_moment("2021-03-14", "02:30", "America/New_York")
+    assert moment.resolution == "nonexistent"
+    assert moment.fold == 0
+    assert moment.utc.isoformat() == "2021-03-14T07:30:00+00:00"
+
+
+def test_birth_moment_rejects_invalid_input():
+    with pytest.raises(ValueError, match="Invalid timezone: Mars/Olympus"):
+        normalize_birth_moment("1999-02-26", "14:00", "Mars/Olympus")
+    with pytest.raises(ValueError, match="HH:MM"):
+        normalize_birth_moment("1999-02-26", "14", "UTC")
+    assert get_zone("UTC") is get_zone("UTC")
@@ -0,0 +1,67 @@
+from life_chart_api.main import app
+from life_chart_api.temporal.chinese_luck_pillars import build_chinese_flowing_pillar_cycles
+from tests.asgi_client import call_app
+
+_BIRTH = {"date": "1999-02-26", "time": "14:00:00", "timezone": "UTC"}
+
+
+def _by_start(cycles: list[dict], kind: str) -> dict[str, dict]:
+    return {cycle["start"]: cycle for cycle in cycles if cycle["kind"] == kind}
+
+
+def test_flowing_pillars_follow_sexagenary_tables():
+    cycles = build_chinese_flowing_pillar_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2030-12"
+    )
+    annual = _by_start(cycles, "annual_pillar")
+    monthly = _by_start(cycles, "monthly_pillar")
+
+    assert len(annual) == 5
+    assert len(monthly) == 60
+    assert annual["2026-01"]["end"] == "2026-12"
+    assert "pillar:bing-wu" in annual["2026-01"]["themes"]
+    assert "pillar:ding-wei" in annual["2027-01"]["themes"]
+    assert "pillar:geng-yin" in monthly["2026-01"]["themes"]
+    assert "pillar:ren-yin" in monthly["2027-01"]["themes"]
+
+
+def test_flowing_pillars_tag_ten_god_and_branch_relations():
+    cycles = build_chinese_flowing_pillar_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2026-12"
+    )
+    annual = _by_start(cycles, "annual_pillar")["2026-01"]
+    monthly = _by_start(cycles, "monthly_pillar")
+
+    assert "tenGod:robWealth" in annual["themes"]
+    assert {"combination:day", "combination:hour"} <= set(annual["themes"])
+    assert {"clash:year", "clash:month"} <= set(monthly["2026-08"]["themes"])
+    assert {"combination:year", "combination:month"} <= set(monthly["2026-09"]["themes"])
+    assert monthly["2026-08"]["evidence"][0]["value"]["clashes"] == ["year", "month"]
+    assert not any(theme.startswith("clash:") for theme in monthly["2026-02"]["themes"])
+
+
+def test_timeline_includes_chinese_flow_cycles():
+    status, _, payload = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={
+            "date": "1999-02-26",
+            "time": "14:00:00",
+            "timezone": "UTC",
+            "city": "Hyderabad",
+            "region": "Telangana",
+            "country": "India",
+            "lat": 17.385,
+            "lon": 78.4867,
+            "from": "2026-03",
+            "to": "2026-05",
+            "include": "chinese_flow",
+        },
+        headers={"X-Forwarded-For": "10.22.0.1"},
+    )
+    assert status == 200
+    kinds = [cycle["kind"] for cycle in payload["cycles"]]
+    assert kinds.count("annual_pillar") == 1
+    assert kinds.count("monthly_pillar") == 3
+    assert {cycle["system"] for cycle in payload["cycles"]} == {"chinese"}
@@ -0,0 +1,96 @@
+import pickle
+
+from life_chart_api.temporal.models import Cycle, sort_records
+from life_chart_api.temporal.temporal_intersection import (
+    build_temporal_intersection_cycles,
+    build_temporal_intersection_records,
+)
+
+
+def _cycle_dict(cycle_id: str, system: str, start: str, end: str) -> dict:
+    return {
+        "cycleId": cycle_id,
+        "system": system,
+        "kind": "dasha_maha",
+        "domain": "growth",
+        "themes": ["growth", "guidance"],
+        "start": start,
+        "end": end,
+        "peak": "2026-03-14",
+        "intensity": 0.7,
+        "polarity": "supporting",
+        "evidence": [{"source": "test", "value": 1, "weight": 0.5, "note": "n"}],
+        "notes": [],
+    }
+
+
+def test_cycle_round_trips_public_dict_shape():
+    payload = _cycle_dict("c1", "vedic", "2026-01", "2026-06")
+    record = Cycle.from_dict(payload)
+    assert not hasattr(record, "__dict__")
+    assert record.to_dict() == payload
+    assert list(record.to_dict()) == list(payload)
+    assert record.start_ordinal < record.end_ordinal
+    assert Cycle.from_dict({"cycleId": "x", "start": None, "end": "2026-01"}) is None
+
+
+def test_cycle_evidence_is_built_once_on_access():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return [{"source": "lazy"}]
+
+    record = Cycle(
+        cycle_id="c",
+        system="western",
+        kind="k",
+        domain="growth",
+        themes=[],
+        start="2026-01",
+        end="2026-02",
+        intensity=0.5,
+        polarity="neutral",
+        evidence=factory,
+    )
+    assert not calls
+    assert record.evidence == [{"source": "lazy"}]
+    assert record.to_dict()["evidence"] == [{"source": "lazy"}]
+    assert len(calls) == 1
+
+
+def test_intersection_records_match_dict_api_and_pickle():
+    cycles = [
+        _cycle_dict("a", "vedic", "2026-01", "2026-12"),
+        _cycle_dict("b", "western", "2026-02", "2026-05"),
+        _cycle_dict("c", "chinese", "2025-01", "2034-01"),
+    ]
+    records = sort_records([Cycle.from_dict(cycle) for cycle in cycles])
+    windows = build_temporal_intersection_records(records, "2026-01", "2026-06")
+    assert [window.to_dict() for window in windows] == build_temporal_intersection_cycles(
+        cycles, "2026-01", "2026-06"
+    )
+    assert {source.cycle_id for source in windows[1].sources} == {"a", "b", "c"}
+    restored = pickle.loads(pickle.dumps(records))
+    assert [record.to_dict() for record in restored] == [record.to_dict() for record in records]
+
+
+def test_missing_polarity_is_kept_raw_and_counts_as_neutral():
+    payload = _cycle_dict("p", "chinese", "2026-01", "2026-06")
+    del payload["polarity"]
+    record = Cycle.from_dict(payload)
+    assert record.polarity is None
+    assert record.to_dict() == payload
+
+    windows = build_temporal_intersection_cycles(
+        [payload, _cycle_dict("a", "vedic", "2026-01", "2026-12")], "2026-01", "2026-03"
+    )
+    sources = [
+        evidence
+        for window in windows
+        for evidence in window["evidence"]
+        if evidence["source"] == "timeline.cycle" and evidence["value"]["cycleId"] == "p"
+    ]
+    assert sources
+    assert all(evidence["value"]["polarity"] is None for evidence in sources)
+    assert all("contribution=0" in evidence["note"] for evidence in sources)
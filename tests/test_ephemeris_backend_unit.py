@@ -0,0 +1,40 @@
+import pytest
+import swisseph as swe
+
+from life_chart_api.ephemeris import positions
+from life_chart_api.ephemeris.positions import body_position, moshier_position, swiss_position
+from life_chart_api.main import app
+from life_chart_api.settings import get_settings, load_settings
+from tests.asgi_client import call_app
+
+
+def test_moshier_backend_routes_positions(monkeypatch):
+    monkeypatch.setenv("EPHEMERIS_BACKEND", "moshier")
+    get_settings.cache_clear()
+    try:
+        jd_ut = swe.julday(2026, 3, 1, 12.0, swe.GREG_CAL)
+        assert positions.active_backend() == "moshier"
+        assert body_position(jd_ut, swe.MARS) == moshier_position(jd_ut, swe.MARS)
+        status = positions.ephemeris_status()
+        assert status == {"backend": "moshier", "effective": "moshier", "table": None}
+    finally:
+        get_settings.cache_clear()
+
+
+def test_default_backend_is_swiss_and_reported_on_ready():
+    jd_ut = swe.julday(2026, 3, 1, 12.0, swe.GREG_CAL)
+    assert positions.active_backend() == "swiss"
+    assert body_position(jd_ut, swe.VENUS) == swiss_position(jd_ut, swe.VENUS)
+
+    status, _, payload = call_app(app, "GET", "/ready")
+    assert status == 200
+    ephemeris = payload["checks"]["ephemeris"]
+    assert ephemeris["backend"] == "swiss"
+    assert ephemeris["effective"] in {"swiss", "moshier"}
+
+
+def test_table_backend_requires_table_path(monkeypatch):
+    monkeypatch.setenv("EPHEMERIS_BACKEND", "table")
+    monkeypatch.delenv("EPHEMERIS_TABLE_PATH", raising=False)
+    with pytest.raises(RuntimeError, match="EPHEMERIS_TABLE_PATH"):
+        load_settings()
@@ -0,0 +1,71 @@
+import swisseph as swe
+
+from life_chart_api.ephemeris import positions
+from life_chart_api.ephemeris.positions import body_position, swiss_position
+from life_chart_api.ephemeris.table import (
+    EphemerisTable,
+    measure_error_bounds,
+    open_table,
+    record_error_bounds,
+    write_table,
+)
+from life_chart_api.settings import get_settings
+
+
+def _build(path, bodies=(swe.SUN, swe.MOON, swe.SATURN)) -> float:
+    start_jd = swe.julday(2026, 1, 1, 0.0, swe.GREG_CAL)
+    write_table(path, start_jd=start_jd, day_count=120, position=swiss_position, bodies=bodies)
+    table = EphemerisTable(path)
+    try:
+        bounds = measure_error_bounds(table, swiss_position, samples=300)
+    finally:
+        table.close()
+    record_error_bounds(path, bounds)
+    return start_jd
+
+
+def test_ephemeris_table_hermite_matches_swisseph(tmp_path):
+    path = tmp_path / "ephemeris.bin"
+    start_jd = _build(path)
+
+    table = EphemerisTable(path)
+    try:
+        assert table.bodies == (swe.SUN, swe.MOON, swe.SATURN)
+        for body in table.bodies:
+            bound = table.error_bound(body)
+            assert bound is not None
+            assert bound < 0.005
+        for offset in (0.0, 10.25, 33.5, 71.9, 118.75):
+            jd_ut = start_jd + offset
+            for body in table.bodies:
+                lon, speed = table.position(jd_ut, body)
+                ref_lon, ref_speed = swiss_position(jd_ut, body)
+                assert abs((lon - ref_lon + 180.0) % 360.0 - 180.0) < 0.005
+                assert abs(speed - ref_speed) < 0.01
+        assert not table.covers(start_jd + 200.0, swe.SUN)
+        assert not table.covers(start_jd + 10.0, swe.MARS)
+    finally:
+        table.close()
+
+
+def test_body_position_uses_configured_table(tmp_path, monkeypatch):
+    path = tmp_path / "ephemeris.bin"
+    start_jd = _build(path)
+
+    monkeypatch.setenv("EPHEMERIS_TABLE_PATH", str(path))
+    get_settings.cache_clear()
+    try:
+        table = positions.active_table()
+        assert table is not None
+        jd_ut = start_jd + 42.3
+        assert body_position(jd_ut, swe.SATURN) == table.position(jd_ut, swe.SATURN)
+        assert body_position(jd_ut, swe.MARS) == swiss_position(jd_ut, swe.MARS)
+        assert body_position(start_jd - 5.0, swe.SUN) == swiss_position(start_jd - 5.0, swe.SUN)
+        assert positions.ephemeris_status() == {
+            "backend": "table",
+            "effective": "table",
+            "table": str(path),
+        }
+    finally:
+        get_settings.cache_clear()
+        open_table.cache_clear()
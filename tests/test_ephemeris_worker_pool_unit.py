@@ -0,0 +1,46 @@
+import pytest
+
+from life_chart_api.astrology.vedic.compute import compute_vedic_features
+from life_chart_api.ephemeris.natal import natal_context_for_birth
+from life_chart_api.ephemeris.workers import EphemerisWorkerPool
+from life_chart_api.temporal.western_transits import build_western_transit_cycles
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00",
+    "timezone": "Asia/Kolkata",
+    "location": {"lat": 17.385, "lon": 78.4867},
+}
+
+
+def test_in_process_pool_runs_inline_and_reports_errors():
+    pool = EphemerisWorkerPool(0)
+    assert pool.in_process
+    assert pool.run(natal_context_for_birth, _BIRTH) == natal_context_for_birth(_BIRTH)
+
+    future = pool.submit(natal_context_for_birth, {**_BIRTH, "timezone": "Mars/Olympus"})
+    with pytest.raises(ValueError, match="Invalid timezone"):
+        future.result()
+
+
+def test_process_pool_matches_in_process_results():
+    pool = EphemerisWorkerPool(2)
+    try:
+        assert not pool.in_process
+        natal = pool.run(natal_context_for_birth, _BIRTH)
+        assert natal == natal_context_for_birth(_BIRTH)
+
+        vedic = pool.submit(compute_vedic_features, "1999-02-26", "14:00", "Asia/Kolkata", 17.385, 78.4867)
+        transits = pool.submit(
+            build_western_transit_cycles,
+            birth=_BIRTH,
+            range_from="2026-01",
+            range_to="2027-12",
+            natal=natal,
+        )
+        assert vedic.result() == compute_vedic_features("1999-02-26", "14:00", "Asia/Kolkata", 17.385, 78.4867)
+        assert transits.result() == build_western_transit_cycles(
+            birth=_BIRTH, range_from="2026-01", range_to="2027-12", natal=natal
+        )
+    finally:
+        pool.shutdown()
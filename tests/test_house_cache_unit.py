@@ -0,0 +1,45 @@
+import swisseph as swe
+
+from life_chart_api.ephemeris.natal import _cached_houses, house_cache_stats, placidus_houses
+from life_chart_api.main import app
+from tests.asgi_client import call_app
+
+
+def test_house_cache_quantizes_time_and_location():
+    _cached_houses.cache_clear()
+    jd_ut = swe.julday(1999, 2, 26, 8.5, swe.GREG_CAL)
+
+    cusps, ascmc = placidus_houses(jd_ut, 17.385, 78.4867)
+    assert len(cusps) == 12
+    assert len(ascmc) >= 4
+    assert placidus_houses(jd_ut + 0.2 / 86400.0, 17.38502, 78.48668) is placidus_houses(jd_ut, 17.385, 78.4867)
+    assert placidus_houses(jd_ut + 2.0 / 86400.0, 17.385, 78.4867) != (cusps, ascmc)
+    assert placidus_houses(jd_ut, 17.385, 78.4867, swe.FLG_SIDEREAL) != (cusps, ascmc)
+
+    stats = house_cache_stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 2
+    assert stats["hit_rate"] == 0.4
+    assert stats["size"] == 3
+
+
+def test_house_cache_stats_reported_on_metrics():
+    status, _, payload = call_app(app, "GET", "/metrics")
+    assert status == 200
+    assert set(payload["caches"]["houses"]) == {"hits", "misses", "size", "maxsize", "hit_rate"}
+
+
+def test_house_cache_keys_sidereal_cusps_by_ayanamsa():
+    _cached_houses.cache_clear()
+    jd_ut = swe.julday(1999, 2, 26, 8.5, swe.GREG_CAL)
+    try:
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        lahiri, _ = placidus_houses(jd_ut, 17.385, 78.4867, swe.FLG_SIDEREAL)
+        swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+        fagan, _ = placidus_houses(jd_ut, 17.385, 78.4867, swe.FLG_SIDEREAL)
+    finally:
+        swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    assert fagan != lahiri
+    assert house_cache_stats()["misses"] == 2
+    assert placidus_houses(jd_ut, 17.385, 78.4867, swe.FLG_SIDEREAL)[0] == lahiri
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from life_chart_api.astrology.vedic.compute import (
+    _planet_placements,
+    _sign_index_from_lon,
+    compute_vedic_features,
+    compute_vedic_features_batch,
+)
+from life_chart_api.astrology.western.compute import (
+    compute_western_features,
+    compute_western_features_batch,
+)
+from life_chart_api.ephemeris.natal import build_natal_context
+from life_chart_api.inputs.birth_moment import birth_utc
+
+_TIMEZONES = ["UTC", "Asia/Kolkata", "America/New_York", "Europe/London", "Australia/Sydney"]
+
+
+def _columns(count: int) -> tuple[list, list, list, list, list]:
+    rng = random.Random(7)
+    dates, times, tzs, lats, lons = [], [], [], [], []
+    for _ in range(count):
+        dates.append(f"{rng.randint(1920, 2020)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+        times.append(f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}")
+        tzs.append(rng.choice(_TIMEZONES))
+        lats.append(round(rng.uniform(-60.0, 60.0), 4))
+        lons.append(round(rng.uniform(-180.0, 180.0), 4))
+    return dates, times, tzs, lats, lons
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_western_batch_matches_scalar(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    columns = _columns(60)
+    batch = compute_western_features_batch(*columns, vectorized=vectorized)
+
+    assert len(batch) == 60
+    for index, row in enumerate(zip(*columns, strict=True)):
+        assert batch.row(index) == compute_western_features(*row)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_vedic_batch_matches_scalar(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    columns = _columns(60)
+    batch = compute_vedic_features_batch(*columns, vectorized=vectorized)
+
+    assert len(batch) == 60
+    for index, row in enumerate(zip(*columns, strict=True)):
+        assert batch.row(index) == compute_vedic_features(*row)
+        date, time, tz, lat, lon = row
+        natal = build_natal_context(birth_utc(date, time, tz), lat, lon)
+        moon = _planet_placements(natal, _sign_index_from_lon(natal.sidereal_ascendant))["Moon"]
+        assert (batch.moon_nakshatra[index], batch.moon_pada[index]) == (
+            moon["nakshatra"],
+            moon["pada"],
+        )
+
+
+def test_batch_rejects_ragged_columns():
+    dates, times, tzs, lats, lons = _columns(3)
+    with pytest.raises(ValueError, match="same length"):
+        compute_western_features_batch(dates, times, tzs, lats, lons[:2])
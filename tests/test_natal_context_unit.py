@@ -0,0 +1,58 @@
+import pytest
+import swisseph as swe
+
+from life_chart_api.astrology.vedic.compute import compute_vedic_features
+from life_chart_api.astrology.western.compute import compute_western_features
+from life_chart_api.ephemeris.natal import NATAL_BODIES, natal_context_for_birth
+from life_chart_api.temporal.vedic_dashas import build_vedic_dasha_cycles
+from life_chart_api.temporal.western_transits import build_western_transit_cycles
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00",
+    "timezone": "Asia/Kolkata",
+    "location": {"lat": 17.385, "lon": 78.4867},
+}
+
+
+def test_natal_context_holds_birth_moment():
+    natal = natal_context_for_birth(_BIRTH)
+
+    assert natal.utc.isoformat() == "1999-02-26T08:30:00+00:00"
+    assert set(natal.positions) == set(NATAL_BODIES)
+    assert len(natal.cusps) >= 12
+    assert 0.0 <= natal.ascendant < 360.0
+    assert 23.0 < natal.ayanamsa < 24.5
+    assert natal.sidereal_longitude(swe.MOON) == pytest.approx(
+        (natal.longitude(swe.MOON) - natal.ayanamsa) % 360.0
+    )
+
+
+def test_engines_accept_shared_natal_context(monkeypatch):
+    natal = natal_context_for_birth(_BIRTH)
+    args = ("1999-02-26", "14:00", "Asia/Kolkata", 17.385, 78.4867)
+    western = compute_western_features(*args)
+    vedic = compute_vedic_features(*args)
+    dashas = build_vedic_dasha_cycles(birth=_BIRTH, range_from="2020-01", range_to="2030-12")
+    transits = build_western_transit_cycles(birth=_BIRTH, range_from="2026-01", range_to="2027-12")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("natal context rebuilt")
+
+    monkeypatch.setattr("life_chart_api.astrology.western.compute.build_natal_context", fail)
+    monkeypatch.setattr("life_chart_api.astrology.vedic.compute.build_natal_context", fail)
+    monkeypatch.setattr("life_chart_api.temporal.vedic_dashas.natal_context_for_birth", fail)
+    monkeypatch.setattr("life_chart_api.temporal.western_transits.natal_context_for_birth", fail)
+    assert compute_western_features(*args, natal=natal) == western
+    assert compute_vedic_features(*args, natal=natal) == vedic
+    assert build_vedic_dasha_cycles(
+        birth=_BIRTH, range_from="2020-01", range_to="2030-12", natal=natal
+    ) == dashas
+    assert build_western_transit_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2027-12", natal=natal
+    ) == transits
+
+
+def test_natal_context_rejects_invalid_timezone():
+    with pytest.raises(ValueError, match="Invalid timezone"):
+        natal_context_for_birth({**_BIRTH, "timezone": "Mars/Olympus"})
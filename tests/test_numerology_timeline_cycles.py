@@ -0,0 +1,90 @@
+from datetime import date
+
+from life_chart_api.main import app
+from life_chart_api.numerology.compute import compute_personal_year
+from life_chart_api.temporal.numerology_cycles import (
+    build_numerology_cycles,
+    personal_day_number,
+    personal_month_number,
+    personal_year_number,
+)
+from tests.asgi_client import call_app
+
+_BIRTH = {"date": "1999-02-26", "time": "14:00:00", "timezone": "UTC"}
+_PARAMS = {
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+}
+_HEADERS = {"X-Forwarded-For": "10.23.0.1"}
+
+
+def test_personal_numbers_match_numerology_compute():
+    birth = date(1999, 2, 26)
+    for year in range(1990, 2060):
+        expected = compute_personal_year("1999-02-26", forecast_year=year).reduction.final_value
+        assert personal_year_number(birth, year) == expected
+    assert personal_year_number(birth, 2026) == 2
+    assert personal_month_number(birth, 2026, 3) == 5
+    assert personal_day_number(birth, date(2026, 3, 14)) == 1
+
+
+def test_numerology_builder_covers_years_months_and_days():
+    cycles = build_numerology_cycles(birth=_BIRTH, range_from="2026-01", range_to="2028-12")
+    kinds = [cycle["kind"] for cycle in cycles]
+    assert kinds.count("personal_year") == 3
+    assert kinds.count("personal_month") == 36
+    assert "personal_day" not in kinds
+
+    daily = build_numerology_cycles(
+        birth=_BIRTH, range_from="2024-01", range_to="2028-12", include_days=True
+    )
+    days = [cycle for cycle in daily if cycle["kind"] == "personal_day"]
+    assert len(days) == (date(2028, 12, 31) - date(2024, 1, 1)).days + 1
+    assert all(cycle["system"] == "numerology" for cycle in daily)
+
+
+def test_timeline_numerology_days_only_at_day_granularity():
+    status, _, payload = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={**_PARAMS, "from": "2026-01", "to": "2026-06", "include": "numerology"},
+        headers=_HEADERS,
+    )
+    assert status == 200
+    kinds = [cycle["kind"] for cycle in payload["cycles"]]
+    assert kinds.count("personal_year") == 1
+    assert kinds.count("personal_month") == 6
+    assert "personal_day" not in kinds
+
+    status, _, payload = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={
+            **_PARAMS,
+            "from": "2026-03-01",
+            "to": "2026-03-10",
+            "include": "vedic,numerology,intersection_time",
+            "granularity": "day",
+        },
+        headers=_HEADERS,
+    )
+    assert status == 200
+    days = [cycle for cycle in payload["cycles"] if cycle["kind"] == "personal_day"]
+    assert [cycle["start"] for cycle in days] == [f"2026-03-{day:02d}" for day in range(1, 11)]
+    day_ids = {cycle["cycleId"] for cycle in days}
+    window_sources = {
+        entry["value"].get("cycleId")
+        for cycle in payload["cycles"]
+        if cycle["system"] == "intersection"
+        for entry in cycle["evidence"]
+        if isinstance(entry["value"], dict)
+    }
+    assert day_ids & window_sources
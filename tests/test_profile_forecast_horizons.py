@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import jsonschema
+
+from life_chart_api.main import app
+from tests.asgi_client import call_app
+
+_PARAMS = {
+    "name": "Example Person",
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+    "from": "2026-01",
+    "include": "western,vedic,chinese",
+    "granularity": "month",
+}
+
+
+def _forecast_schema() -> dict:
+    schema_path = (
+        Path(__file__).resolve().parents[1]
+        / "src"
+        / "life_chart_api"
+        / "schemas"
+        / "temporal"
+        / "forecast_response.schema.json"
+    )
+    return json.loads(schema_path.read_text(encoding="utf-8"))
+
+
+def test_forecast_horizons_share_one_computation():
+    status, _, payload = call_app(
+        app, "GET", "/profile/forecast", params={**_PARAMS, "horizons": "12m,3m,60m"}
+    )
+    assert status == 200
+    jsonschema.validate(payload, _forecast_schema())
+    assert list(payload["horizons"]) == ["3m", "12m", "60m"]
+    assert payload["horizons"]["3m"]["meta"]["range"] == {"from": "2026-01", "to": "2026-03"}
+    assert payload["horizons"]["12m"]["meta"]["range"] == {"from": "2026-01", "to": "2026-12"}
+    assert payload["meta"]["range"] == {"from": "2026-01", "to": "2030-12"}
+    assert payload["topWindows"] == payload["horizons"]["60m"]["topWindows"]
+    for window in payload["horizons"]["3m"]["topWindows"]:
+        assert window["start"] <= "2026-03-31"
+    short_ids = {window["windowId"] for window in payload["horizons"]["12m"]["byDomain"]["growth"]}
+    long_ids = {window["windowId"] for window in payload["horizons"]["60m"]["byDomain"]["growth"]}
+    assert short_ids <= long_ids
+
+
+def test_forecast_horizons_validation():
+    status, _, payload = call_app(
+        app, "GET", "/profile/forecast", params={**_PARAMS, "horizons": "3m,1y"}
+    )
+    assert status == 400
+    assert payload["error"]["details"][0]["path"] == "query.horizons"
+
+    status, _, payload = call_app(
+        app, "GET", "/profile/forecast", params={**_PARAMS, "horizons": "3m,120m"}
+    )
+    assert status == 400
+    assert payload["error"]["code"] == "INVALID_INPUT"
@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import jsonschema
+
+from life_chart_api.main import app
+from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
+from tests.asgi_client import call_app
+
+_BASE_PARAMS = {
+    "name": "Example Person",
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+    "include": "western,vedic,chinese",
+}
+
+
+def _forecast_schema() -> dict:
+    schema_path = (
+        Path(__file__).resolve().parents[1]
+        / "src"
+        / "life_chart_api"
+        / "schemas"
+        / "temporal"
+        / "forecast_response.schema.json"
+    )
+    return json.loads(schema_path.read_text(encoding="utf-8"))
+
+
+def test_day_granularity_forecast_for_90_days():
+    params = {**_BASE_PARAMS, "from": "2026-03-01", "to": "2026-05-29", "granularity": "day"}
+    status, _, payload = call_app(app, "GET", "/profile/forecast", params=params)
+    assert status == 200
+    assert payload["meta"]["granularity"] == "day"
+    assert payload["meta"]["range"] == {"from": "2026-03-01", "to": "2026-05-29"}
+    for window in payload["topWindows"]:
+        assert window["start"] == window["end"]
+        assert "2026-03-01" <= window["start"] <= "2026-05-29"
+    jsonschema.validate(payload, _forecast_schema())
+
+
+def test_week_granularity_forecast_accepts_month_range():
+    params = {**_BASE_PARAMS, "from": "2026-01", "to": "2026-06", "granularity": "week"}
+    status, _, payload = call_app(app, "GET", "/profile/forecast", params=params)
+    assert status == 200
+    assert payload["meta"]["granularity"] == "week"
+    jsonschema.validate(payload, _forecast_schema())
+
+
+def test_day_granularity_range_cap():
+    params = {**_BASE_PARAMS, "from": "2026-01-01", "to": "2026-06-30", "granularity": "day"}
+    status, _, payload = call_app(app, "GET", "/profile/forecast", params=params)
+    assert status == 400
+    assert payload["error"]["code"] == "INVALID_INPUT"
+    assert payload["error"]["details"][0]["issue"] == "max 92 days"
+
+
+def test_week_windows_are_iso_weeks():
+    cycles = [
+        {
+            "cycleId": "a",
+            "system": "vedic",
+            "themes": ["growth"],
+            "start": "2026-01",
+            "end": "2026-03",
+            "intensity": 0.9,
+            "polarity": "supporting",
+        },
+        {
+            "cycleId": "b",
+            "system": "western",
+            "themes": ["expansion"],
+            "start": "2026-01-20",
+            "end": "2026-02-10",
+            "intensity": 0.9,
+            "polarity": "supporting",
+        },
+    ]
+    windows = build_temporal_intersection_cycles(cycles, "2026-01-01", "2026-01-31", "week")
+    assert [window["themes"][0] for window in windows] == [
+        "window:2026-W01",
+        "window:2026-W02",
+        "window:2026-W03",
+        "window:2026-W04",
+        "window:2026-W05",
+    ]
+    assert windows[0]["start"] == "2025-12-29"
+    assert windows[-1]["end"] == "2026-02-01"
+    assert "expansion_growth" in windows[3]["themes"]
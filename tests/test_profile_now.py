@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+import jsonschema
+from referencing import Registry, Resource
+
+from life_chart_api.main import app
+from life_chart_api.temporal.models import parse_cycle_date
+from tests.asgi_client import call_app
+
+_PARAMS = {
+    "name": "Example Person",
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+}
+_HEADERS = {"X-Forwarded-For": "10.24.0.1"}
+
+
+def _get(path: str, params: dict):
+    return call_app(app, "GET", path, params={**_PARAMS, **params}, headers=_HEADERS)
+
+
+def _covers(cycle: dict, day: str) -> bool:
+    start = parse_cycle_date(cycle["start"], end=False).isoformat()
+    end = parse_cycle_date(cycle["end"], end=True).isoformat()
+    return start <= day <= end
+
+
+def test_now_returns_only_cycles_active_on_date():
+    status, _, payload = _get(
+        "/profile/now",
+        {"as_of": "2026-03-14", "include": "western,vedic,chinese", "dasha_depth": "antar"},
+    )
+    assert status == 200
+    assert payload["meta"]["as_of"] == "2026-03-14"
+    active = payload["active"]
+    assert active
+    assert all(_covers(cycle, "2026-03-14") for cycle in active)
+    kinds = {cycle["kind"] for cycle in active}
+    assert {"dasha_maha", "dasha_antar", "luck_pillar"} <= kinds
+    assert any(cycle["system"] == "western" for cycle in active)
+
+    window = payload["window"]
+    assert window["system"] == "intersection"
+    assert window["start"] == window["end"] == "2026-03-14"
+
+
+def test_now_matches_timeline_for_every_source():
+    include = "vedic,chinese,chinese_flow,numerology,western,progressed"
+    for as_of, granularity in (("2026-07-01", "month"), ("2026-03-14", "day")):
+        status, _, now = _get(
+            "/profile/now",
+            {"as_of": as_of, "include": include, "granularity": granularity},
+        )
+        assert status == 200
+        bound = as_of[:7] if granularity == "month" else as_of
+        status, _, timeline = _get(
+            "/profile/timeline",
+            {"from": bound, "to": bound, "include": include, "granularity": granularity},
+        )
+        assert status == 200
+        expected = {
+            (cycle["cycleId"], cycle["start"], cycle["end"])
+            for cycle in timeline["cycles"]
+            if _covers(cycle, as_of)
+        }
+        active = {(cycle["cycleId"], cycle["start"], cycle["end"]) for cycle in now["active"]}
+        assert active == expected
+        assert {"transit_neptune_aspect", "progressed_aspect"} <= {
+            cycle["kind"] for cycle in now["active"]
+        }
+    assert now["window"]["start"] == now["window"]["end"] == "2026-03-14"
+
+
+def test_now_schema_valid_and_rejects_bad_as_of():
+    status, _, payload = _get("/profile/now", {"as_of": "2027-01-05"})
+    assert status == 200
+
+    schema_dir = Path(__file__).resolve().parents[1] / "src" / "life_chart_api" / "schemas" / "temporal"
+    resources = []
+    for path in (schema_dir / "now_response.schema.json", schema_dir / "cycle.schema.json"):
+        contents = json.loads(path.read_text(encoding="utf-8"))
+        contents["$id"] = path.resolve().as_uri()
+        resources.append((contents["$id"], Resource.from_contents(contents)))
+    schema = resources[0][1].contents
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls(schema, registry=Registry().with_resources(resources)).validate(payload)
+
+    status, _, error = _get("/profile/now", {"as_of": "2026-02-30"})
+    assert status == 400
+    assert error["error"]["details"][0]["path"] == "query.as_of"
@@ -0,0 +1,75 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+import jsonschema
+
+from life_chart_api.main import app
+from tests.asgi_client import call_app
+
+_HEADERS = {"X-Forwarded-For": "10.20.0.1"}
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+}
+
+
+def _get(params: dict):
+    return call_app(app, "GET", "/profile/returns", params={**_BIRTH, **params}, headers=_HEADERS)
+
+
+def _moment(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_lunar_returns_repeat_at_natal_longitude():
+    status, _, payload = _get({"body": "moon", "count": 12, "from": "2026-01"})
+    assert status == 200
+    returns = payload["returns"]
+    assert [item["index"] for item in returns] == list(range(1, 13))
+    longitudes = {item["longitude"] for item in returns}
+    assert max(longitudes) - min(longitudes) < 0.001
+    moments = [_moment(item["moment"]) for item in returns]
+    gaps = [(b - a).total_seconds() / 86400.0 for a, b in zip(moments, moments[1:], strict=False)]
+    assert all(26.5 < gap < 28.5 for gap in gaps)
+
+
+def test_solar_return_near_birthday_validates_schema():
+    status, _, payload = _get({"body": "sun", "from": "2026-01"})
+    assert status == 200
+    assert payload["meta"]["body"] == "sun"
+    assert payload["meta"]["from"] == "2026-01-01"
+    (solar,) = payload["returns"]
+    assert solar["moment"].startswith(("2026-02-25", "2026-02-26", "2026-02-27"))
+    assert solar["chart"]
+
+    schema_path = (
+        Path(__file__).resolve().parents[1]
+        / "src"
+        / "life_chart_api"
+        / "schemas"
+        / "temporal"
+        / "returns_response.schema.json"
+    )
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    jsonschema.validators.validator_for(schema)(schema).validate(payload)
+
+
+def test_returns_rejects_invalid_query():
+    for params, path in (
+        ({"body": "mars"}, "query.body"),
+        ({"count": 0}, "query.count"),
+        ({"count": 25}, "query.count"),
+        ({"from": "2026-13"}, "query.from"),
+    ):
+        status, _, payload = _get(params)
+        assert status == 400
+        assert payload["error"]["code"] == "INVALID_INPUT"
+        assert payload["error"]["details"][0]["path"] == path
@@ -0,0 +1,115 @@
+import json
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+
+import jsonschema
+
+from life_chart_api.ephemeris.natal import julian_day, natal_context_for_birth
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.main import app
+from life_chart_api.temporal.sky_table import SKY_BODIES, SkyTable, get_sky_table, reset_sky_table
+from life_chart_api.temporal.western_transits import NATAL_POINTS
+from tests.asgi_client import call_app
+
+_PARAMS = {
+    "name": "Example Person",
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+}
+_OTHER = {**_PARAMS, "date": "1987-07-09", "time": "06:30:00", "lat": 40.7128, "lon": -74.006}
+_HEADERS = {"X-Forwarded-For": "10.25.0.1"}
+
+
+def _get(params: dict):
+    return call_app(app, "GET", "/profile/transits/daily", params=params, headers=_HEADERS)
+
+
+def test_daily_feed_shares_sky_table_across_users():
+    reset_sky_table()
+    status, _, payload = _get({**_PARAMS, "from": "2026-01", "to": "2026-12"})
+    assert status == 200
+    assert len(payload["days"]) == 365
+    assert payload["days"][0]["date"] == "2026-01-01"
+    assert payload["days"][-1]["date"] == "2026-12-31"
+    calls = get_sky_table().calls
+    assert calls == 365 * len(SKY_BODIES)
+
+    status, _, other = _get({**_OTHER, "from": "2026-01", "to": "2026-12"})
+    assert status == 200
+    assert get_sky_table().calls == calls
+    assert other["days"] != payload["days"]
+
+
+def test_daily_aspects_match_ephemeris():
+    reset_sky_table()
+    status, _, payload = _get({**_PARAMS, "from": "2026-03-01", "to": "2026-03-10"})
+    assert status == 200
+    bodies = dict(NATAL_POINTS)
+    angles = {"conjunction": 0.0, "sextile": 60.0, "square": 90.0, "trine": 120.0, "opposition": 180.0}
+    natal = natal_context_for_birth(
+        {
+            "date": _PARAMS["date"],
+            "time": _PARAMS["time"],
+            "timezone": _PARAMS["timezone"],
+            "location": {"lat": _PARAMS["lat"], "lon": _PARAMS["lon"]},
+        }
+    )
+    seen = 0
+    for day in payload["days"]:
+        orbs = [aspect["orb"] for aspect in day["aspects"]]
+        assert orbs == sorted(orbs)
+        moment = datetime.combine(date.fromisoformat(day["date"]), time.min, tzinfo=timezone.utc)
+        jd_ut = julian_day(moment)
+        for aspect in day["aspects"]:
+            lon, _ = body_position(jd_ut, bodies[aspect["transit"]])
+            assert 0.0 <= aspect["orb"] <= (6.0 if aspect["transit"] == "moon" else 1.0)
+            if aspect["natal"] in bodies:
+                seen += 1
+                natal_lon = natal.longitude(bodies[aspect["natal"]])
+                separation = abs((lon - natal_lon + 180.0) % 360.0 - 180.0)
+                assert abs(abs(separation - angles[aspect["aspect"]]) - aspect["orb"]) < 0.01
+    assert seen
+
+
+def test_sky_table_drops_least_recent_month_at_capacity():
+    calls = []
+
+    def position(jd_ut: float, body: int) -> tuple[float, float]:
+        calls.append((jd_ut, body))
+        return float(body), 1.0
+
+    table = SkyTable(2, position=position)
+    assert len(table.days(date(2026, 1, 15), date(2026, 3, 2))) == 47
+    assert table.stats()["size"] == 2
+    before = table.calls
+    table.day(date(2026, 3, 1))
+    assert table.calls == before
+    table.day(date(2026, 1, 20))
+    assert table.calls == before + 31 * len(SKY_BODIES)
+    assert len(calls) == table.calls
+
+
+def test_daily_schema_valid_and_rejects_bad_range():
+    status, _, payload = _get({**_PARAMS, "from": "2026-05-01", "to": "2026-05-07"})
+    assert status == 200
+    schema_path = (
+        Path(__file__).resolve().parents[1]
+        / "src"
+        / "life_chart_api"
+        / "schemas"
+        / "temporal"
+        / "daily_transits_response.schema.json"
+    )
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    jsonschema.validators.validator_for(schema)(schema).validate(payload)
+
+    status, _, payload = _get({**_PARAMS, "from": "2026-01", "to": "2027-06"})
+    assert status == 400
+    status, _, payload = _get({**_PARAMS, "from": "2026-05-07", "to": "2026-05-01"})
+    assert status == 400
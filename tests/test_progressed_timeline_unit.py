@@ -0,0 +1,147 @@
+import json
+from pathlib import Path
+
+import jsonschema
+import swisseph as swe
+from referencing import Registry, Resource
+
+from life_chart_api.ephemeris.natal import datetime_from_julian_day, natal_context_for_birth
+from life_chart_api.ephemeris.positions import body_position
+from life_chart_api.main import app
+from life_chart_api.temporal.progressions import ProgressedChart, build_progressed_cycles
+from life_chart_api.temporal.western_transits import date_range, range_julian_days
+from tests.asgi_client import call_app
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "location": {"lat": 17.385, "lon": 78.4867},
+}
+_PROGRESSED_KINDS = {"progressed_moon_ingress", "progressed_lunation", "progressed_aspect"}
+_SIGN_START = {"leo": 120.0, "virgo": 150.0}
+
+
+def _events(range_from: str, range_to: str) -> tuple[ProgressedChart, list]:
+    chart = ProgressedChart(natal_context_for_birth(_BIRTH))
+    return chart, chart.events(*range_julian_days(*date_range(range_from, range_to)))
+
+
+def test_sixty_month_range_costs_a_handful_of_calls():
+    chart, events = _events("2026-01", "2030-12")
+
+    assert chart.calls < 80
+    ingresses = [event for event in events if event.kind == "progressed_moon_ingress"]
+    assert [event.target for event in ingresses] == ["leo", "virgo"]
+    for event in ingresses:
+        lon, _ = chart.series(swe.MOON)(event.jd)
+        assert abs((lon - _SIGN_START[event.target] + 180.0) % 360.0 - 180.0) < 1e-4
+
+
+def test_progressed_moon_matches_day_for_a_year_ephemeris():
+    chart, events = _events("2026-01", "2030-12")
+    natal = chart.natal
+
+    aspects = [event for event in events if event.kind == "progressed_aspect"]
+    assert {event.mover for event in aspects} >= {"moon", "sun"}
+    for event in aspects:
+        if event.mover != "moon":
+            continue
+        progressed_jd = natal.jd_ut + (event.jd - natal.jd_ut) / 365.2422
+        lon, _ = body_position(progressed_jd, swe.MOON)
+        assert abs(lon - event.longitude) < 1e-3
+
+
+def test_progressed_lunations_hit_exact_phase():
+    chart, events = _events("2000-01", "2040-12")
+
+    lunations = [
+        (datetime_from_julian_day(event.jd).year, event.target)
+        for event in events
+        if event.kind == "progressed_lunation"
+    ]
+    assert lunations == [(2002, "full"), (2018, "new"), (2032, "full")]
+    for event in events:
+        if event.kind == "progressed_lunation":
+            elongation, _ = chart.elongation(event.jd)
+            target = 0.0 if event.target == "new" else 180.0
+            assert abs((elongation - target + 180.0) % 360.0 - 180.0) < 1e-4
+
+
+def test_progressed_cycles_in_timeline_validate_against_schema():
+    direct = build_progressed_cycles(birth=_BIRTH, range_from="2026-01", range_to="2026-12")
+    assert direct
+    assert {cycle["kind"] for cycle in direct} <= _PROGRESSED_KINDS
+    assert all(cycle["system"] == "western" for cycle in direct)
+
+    status, _, payload = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={
+            "date": "1999-02-26",
+            "time": "14:00:00",
+            "timezone": "UTC",
+            "city": "Hyderabad",
+            "region": "Telangana",
+            "country": "India",
+            "lat": 17.385,
+            "lon": 78.4867,
+            "from": "2026-01",
+            "to": "2027-12",
+            "include": "progressed,intersection_time",
+        },
+        headers={"X-Forwarded-For": "10.21.0.1"},
+    )
+    assert status == 200
+    kinds = {cycle["kind"] for cycle in payload["cycles"] if cycle["system"] == "western"}
+    assert kinds and kinds <= _PROGRESSED_KINDS
+    assert {cycle["cycleId"] for cycle in direct} <= {cycle["cycleId"] for cycle in payload["cycles"]}
+
+    schema_dir = Path(__file__).resolve().parents[1] / "src" / "life_chart_api" / "schemas" / "temporal"
+    resources = []
+    for path in (schema_dir / "timeline_response.schema.json", schema_dir / "cycle.schema.json"):
+        contents = json.loads(path.read_text(encoding="utf-8"))
+        contents["$id"] = path.resolve().as_uri()
+        resources.append((contents["$id"], Resource.from_contents(contents)))
+    schema = resources[0][1].contents
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls(schema, registry=Registry().with_resources(resources)).validate(payload)
+
+
+def test_progressed_timeline_does_not_depend_on_requested_range():
+    def timeline(range_from: str, range_to: str) -> list[dict]:
+        status, _, payload = call_app(
+            app,
+            "GET",
+            "/profile/timeline",
+            params={
+                "date": "1999-02-26",
+                "time": "14:00:00",
+                "timezone": "UTC",
+                "city": "Hyderabad",
+                "region": "Telangana",
+                "country": "India",
+                "lat": 17.385,
+                "lon": 78.4867,
+                "from": range_from,
+                "to": range_to,
+                "include": "progressed",
+            },
+            headers={"X-Forwarded-For": "10.21.0.2"},
+        )
+        assert status == 200
+        return payload["cycles"]
+
+    narrow = timeline("2026-01", "2026-12")
+    wide = [
+        cycle
+        for cycle in timeline("2024-01", "2028-12")
+        if cycle["start"] <= "2026-12" and cycle["end"] >= "2026-01"
+    ]
+
+    assert [cycle["cycleId"] for cycle in narrow] == [cycle["cycleId"] for cycle in wide]
+    # Exact in mid-2027, but its one-degree window opens inside 2026.
+    assert ("2026-06", "2027-07-01", "2028-07") in {
+        (cycle["start"], cycle["peak"], cycle["end"]) for cycle in narrow
+    }
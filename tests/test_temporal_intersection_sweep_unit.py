@@ -0,0 +1,55 @@
+import json
+import random
+
+from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
+
+_THEMES = ["discipline", "growth", "relationships", "element:fire", "pillar:x", "pressure", "learning"]
+
+
+def _random_cycles(rng: random.Random, count: int) -> list[dict]:
+    cycles = []
+    for index in range(count):
+        year = rng.randint(2020, 2030)
+        month = rng.randint(1, 12)
+        length = rng.randint(0, 30)
+        end_year = year + (month - 1 + length) // 12
+        end_month = (month - 1 + length) % 12 + 1
+        if rng.random() < 0.5:
+            start, end = f"{year}-{month:02d}", f"{end_year}-{end_month:02d}"
+        else:
+            start = f"{year}-{month:02d}-{rng.randint(1, 28):02d}"
+            end = f"{end_year}-{end_month:02d}-{rng.randint(1, 28):02d}"
+        cycles.append(
+            {
+                "cycleId": f"c{index}",
+                "system": rng.choice(["western", "vedic", "chinese", "numerology"]),
+                "kind": "k",
+                "themes": rng.sample(_THEMES, rng.randint(1, 3)),
+                "start": start,
+                "end": end,
+                "intensity": round(rng.random(), 2),
+                "polarity": rng.choice(["supporting", "challenging", "neutral"]),
+            }
+        )
+    return cycles
+
+
+def test_sweep_matches_single_window_evaluation():
+    rng = random.Random(11)
+    for _ in range(10):
+        cycles = _random_cycles(rng, 40)
+        swept = build_temporal_intersection_cycles(cycles, "2021-01", "2028-12", "month")
+        single = []
+        for year in range(2021, 2029):
+            for month in range(1, 13):
+                ym = f"{year}-{month:02d}"
+                single.extend(build_temporal_intersection_cycles(cycles, ym, ym, "month"))
+        assert json.dumps(swept) == json.dumps(single)
+
+
+def test_sweep_ignores_cycles_without_string_bounds():
+    cycles = _random_cycles(random.Random(5), 10)
+    with_invalid = cycles + [{"cycleId": "bad", "system": "vedic", "start": None, "end": "2024-01"}]
+    assert build_temporal_intersection_cycles(
+        with_invalid, "2022-01", "2026-12", "quarter"
+    ) == build_temporal_intersection_cycles(cycles, "2022-01", "2026-12", "quarter")
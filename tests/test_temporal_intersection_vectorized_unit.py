@@ -0,0 +1,58 @@
+import json
+import random
+
+import pytest
+
+import life_chart_api.temporal.temporal_intersection as temporal_intersection
+from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
+
+_THEMES = ["discipline", "growth", "relationships", "element:water", "dm:strong", "pressure"]
+
+
+def _random_cycles(rng: random.Random, count: int) -> list[dict]:
+    cycles = []
+    for index in range(count):
+        year = rng.randint(2020, 2030)
+        month = rng.randint(1, 12)
+        length = rng.randint(0, 30)
+        end_year = year + (month - 1 + length) // 12
+        end_month = (month - 1 + length) % 12 + 1
+        cycles.append(
+            {
+                "cycleId": f"c{index}",
+                "system": rng.choice(["western", "vedic", "chinese", "numerology", "other"]),
+                "kind": "k",
+                "themes": rng.sample(_THEMES, rng.randint(1, 3)),
+                "start": f"{year}-{month:02d}-{rng.randint(1, 28):02d}",
+                "end": f"{end_year}-{end_month:02d}",
+                "intensity": round(rng.random() * 1.2 - 0.1, 2),
+                "polarity": rng.choice(["supporting", "challenging", "neutral"]),
+            }
+        )
+    return cycles
+
+
+def test_vectorized_matches_scalar_path():
+    pytest.importorskip("numpy")
+    rng = random.Random(23)
+    for granularity in ("month", "quarter"):
+        for _ in range(10):
+            cycles = _random_cycles(rng, 50)
+            scalar = build_temporal_intersection_cycles(
+                cycles, "2021-01", "2029-12", granularity, vectorized=False
+            )
+            vectorized = build_temporal_intersection_cycles(
+                cycles, "2021-01", "2029-12", granularity, vectorized=True
+            )
+            assert json.dumps(vectorized) == json.dumps(scalar)
+
+
+def test_falls_back_without_numpy(monkeypatch):
+    cycles = _random_cycles(random.Random(4), 30)
+    expected = build_temporal_intersection_cycles(cycles, "2022-01", "2026-12", vectorized=False)
+    monkeypatch.setattr(temporal_intersection, "np", None)
+    assert build_temporal_intersection_cycles(cycles, "2022-01", "2026-12") == expected
+    assert (
+        build_temporal_intersection_cycles(cycles, "2022-01", "2026-12", vectorized=True)
+        == expected
+    )
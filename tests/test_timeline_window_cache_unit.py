@@ -0,0 +1,183 @@
+from life_chart_api.main import app
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.timeline_cache import reset_timeline_caches, timeline_cache_stats
+from tests.asgi_client import call_app
+
+_PARAMS = {
+    "name": "Example Person",
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "city": "Hyderabad",
+    "region": "Telangana",
+    "country": "India",
+    "lat": 17.385,
+    "lon": 78.4867,
+    "include": "vedic,chinese,western,intersection_time",
+    "granularity": "month",
+}
+_HEADERS = {"X-Forwarded-For": "10.0.0.17"}
+
+
+def _timeline(range_from: str, range_to: str) -> dict:
+    status, _, payload = call_app(
+        app, "GET", "/profile/timeline", params={**_PARAMS, "from": range_from, "to": range_to},
+        headers=_HEADERS,
+    )
+    assert status == 200
+    return payload
+
+
+def test_extending_range_only_computes_new_windows():
+    reset_timeline_caches()
+    _timeline("2026-01", "2026-12")
+    first = timeline_cache_stats()
+    assert first["windows"]["misses"] == 12
+    assert first["windows"]["hits"] == 0
+
+    _timeline("2026-01", "2027-06")
+    second = timeline_cache_stats()
+    assert second["windows"]["hits"] == 12
+    assert second["windows"]["misses"] == 12 + 6
+    assert second["cycle_blocks"]["hits"] == first["cycle_blocks"]["misses"]
+
+
+def test_cached_timeline_matches_fresh_computation():
+    reset_timeline_caches()
+    _timeline("2025-07", "2026-06")
+    _timeline("2026-03", "2027-02")
+    warm = _timeline("2026-01", "2026-12")
+
+    reset_timeline_caches()
+    cold = _timeline("2026-01", "2026-12")
+
+    assert warm == cold
+
+
+def test_cache_stats_report_cached_and_computed_counts():
+    reset_timeline_caches()
+    params = {**_PARAMS, "from": "2026-01", "to": "2026-06", "cache_stats": "true"}
+    status, _, cold = call_app(app, "GET", "/profile/timeline", params=params, headers=_HEADERS)
+    assert status == 200
+    status, _, warm = call_app(app, "GET", "/profile/timeline", params=params, headers=_HEADERS)
+    assert status == 200
+
+    blocks = cold["meta"]["cache"]["cycle_blocks"]
+    assert blocks["cached"] == 0 and blocks["computed"] > 0
+    assert cold["meta"]["cache"]["windows"] == {"cached": 0, "computed": 6}
+    plan = cold["meta"]["cache"]["western_plan"]
+    assert plan["estimated_calls"] > 0 and plan["dropped"] == 0
+    assert warm["meta"]["cache"] == {
+        "cycle_blocks": {"cached": blocks["computed"], "computed": 0},
+        "windows": {"cached": 6, "computed": 0},
+        "western_plan": {"estimated_calls": 0, "dropped": 0},
+    }
+    assert "cache" not in _timeline("2026-01", "2026-06")["meta"]
+
+    forecast_params = {
+        key: value for key, value in params.items() if key not in {"include", "cache_stats"}
+    }
+    status, _, forecast = call_app(
+        app,
+        "GET",
+        "/profile/forecast",
+        params={**forecast_params, "include": "vedic,chinese,western", "cache_stats": "true"},
+        headers=_HEADERS,
+    )
+    assert status == 200
+    assert forecast["meta"]["cache"]["windows"] == {"cached": 6, "computed": 0}
+
+
+def test_window_cache_keyed_by_included_systems():
+    reset_timeline_caches()
+    full = _timeline("2026-01", "2026-06")
+    status, _, vedic_only = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={**_PARAMS, "include": "vedic,intersection_time", "from": "2026-01", "to": "2026-06"},
+        headers=_HEADERS,
+    )
+    assert status == 200
+    assert timeline_cache_stats()["windows"]["hits"] == 0
+    assert vedic_only["cycles"] != full["cycles"]
+
+
+def test_western_transit_across_year_blocks_is_one_cycle():
+    reset_timeline_caches()
+    status, _, payload = call_app(
+        app,
+        "GET",
+        "/profile/timeline",
+        params={
+            **_PARAMS,
+            "date": "1990-05-17",
+            "time": "12:00:00",
+            "timezone": "Europe/London",
+            "city": "London",
+            "region": "England",
+            "country": "United Kingdom",
+            "lat": 51.5074,
+            "lon": -0.1278,
+            "include": "western",
+            "from": "2028-07",
+            "to": "2029-06",
+        },
+        headers=_HEADERS,
+    )
+    assert status == 200
+
+    squares = [
+        cycle
+        for cycle in payload["cycles"]
+        if cycle["kind"] == "transit_pluto_aspect"
+        and "aspect:square" in cycle["themes"]
+        and "target:mercury" in cycle["themes"]
+        and cycle["end"] >= "2028-12"
+        and cycle["start"] <= "2029-01"
+    ]
+    assert [(cycle["start"], cycle["peak"], cycle["end"]) for cycle in squares] == [
+        ("2028-10", "2029-01-12", "2029-03")
+    ]
+    peak = next(e["value"] for e in squares[0]["evidence"] if e["source"] == "western.transit.peak")
+    assert peak["time"].startswith(squares[0]["peak"])
+    assert not [cycle for cycle in payload["cycles"] if cycle["peak"].endswith(("-01-01", "-12-31"))]
+
+
+def test_as_of_does_not_split_cache_entries():
+    reset_timeline_caches()
+    params = {**_PARAMS, "from": "2026-01", "to": "2026-06", "cache_stats": "true"}
+    status, _, first = call_app(
+        app, "GET", "/profile/timeline", params={**params, "as_of": "2026-02-01"}, headers=_HEADERS
+    )
+    assert status == 200
+    status, _, second = call_app(
+        app, "GET", "/profile/timeline", params={**params, "as_of": "2026-05-01"}, headers=_HEADERS
+    )
+    assert status == 200
+
+    assert second["meta"]["cache"]["cycle_blocks"]["computed"] == 0
+    assert second["meta"]["cache"]["windows"]["computed"] == 0
+    assert second["cycles"] == first["cycles"]
+
+
+def test_cache_stats_report_western_tiers_dropped_by_call_cap(monkeypatch, caplog):
+    reset_timeline_caches()
+    monkeypatch.setenv("WESTERN_TRANSIT_CALL_CAP", "0")
+    get_settings.cache_clear()
+    try:
+        with caplog.at_level("WARNING", logger="life_chart_api.temporal.western_transits"):
+            status, _, payload = call_app(
+                app,
+                "GET",
+                "/profile/timeline",
+                params={**_PARAMS, "from": "2026-01", "to": "2026-06", "cache_stats": "true"},
+                headers=_HEADERS,
+            )
+    finally:
+        get_settings.cache_clear()
+        reset_timeline_caches()
+    assert status == 200
+
+    assert payload["meta"]["cache"]["western_plan"]["dropped"] > 0
+    assert any("call cap dropped" in record.getMessage() for record in caplog.records)
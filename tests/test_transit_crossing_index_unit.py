@@ -0,0 +1,85 @@
+import math
+
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.crossing_index import CrossingIndex
+from life_chart_api.temporal.transit_solver import find_transit_window
+from life_chart_api.temporal.western_transits import build_western_transit_cycles
+
+_MINUTE = 1.0 / 1440.0
+
+
+def _retrograde_position(jd: float, body: int) -> tuple[float, float]:
+    phase = 2.0 * math.pi * jd / 360.0
+    return (0.05 * jd + 4.0 * math.sin(phase)) % 360.0, 0.05 + 4.0 * 2.0 * math.pi / 360.0 * math.cos(phase)
+
+
+def test_crossing_index_matches_solver_windows():
+    index = CrossingIndex(_retrograde_position, block_days=1000.0)
+    jd_start = 2451545.0 + 100.0
+    jd_end = jd_start + 2500.0
+    for natal in (12.0, 40.0, 75.0, 130.0):
+        for angle in (0.0, 90.0, 180.0):
+            indexed = index.window(6, natal, angle, 1.5, jd_start, jd_end)
+            solved = find_transit_window(
+                position=lambda jd: _retrograde_position(jd, 6),
+                natal_lon=natal,
+                aspect_angle=angle,
+                orb=1.5,
+                jd_start=jd_start,
+                jd_end=jd_end,
+                step=60.0,
+            )
+            if solved is None:
+                assert indexed is None
+                continue
+            assert indexed is not None
+            assert abs(indexed.peak_jd - solved.peak_jd) < 5 * _MINUTE
+            assert abs(indexed.start_jd - solved.start_jd) < 5 * _MINUTE
+            assert abs(indexed.end_jd - solved.end_jd) < 5 * _MINUTE
+            assert abs(indexed.peak_delta - solved.peak_delta) < 1e-3
+
+
+def test_crossing_index_merges_windows_across_blocks():
+    def position(jd: float, body: int) -> tuple[float, float]:
+        return (0.1 * (jd - 2451545.0)) % 360.0, 0.1
+
+    index = CrossingIndex(position, block_days=50.0)
+    windows = index.windows(0, 10.0, 2.0, 2451545.0, 2451545.0 + 400.0)
+
+    assert len(windows) == 1
+    assert abs(windows[0].start_jd - (2451545.0 + 80.0)) < _MINUTE
+    assert abs(windows[0].peak_jd - (2451545.0 + 100.0)) < _MINUTE
+    assert abs(windows[0].end_jd - (2451545.0 + 120.0)) < _MINUTE
+
+
+def test_western_transit_builder_index_method_matches_solver(monkeypatch):
+    birth = {
+        "date": "1999-02-26",
+        "time": "14:00:00",
+        "timezone": "UTC",
+        "location": {"lat": 17.385, "lon": 78.4867},
+    }
+
+    # The solver reuses its aspect sweep for stations; lift the event budget so the
+    # index method, which samples them afresh, is not cut short.
+    monkeypatch.setenv("WESTERN_EVENT_CALL_BUDGET", "100000")
+    get_settings.cache_clear()
+    try:
+        solved = build_western_transit_cycles(
+            birth=birth, range_from="2026-01", range_to="2035-12", method="solver"
+        )
+        indexed = build_western_transit_cycles(
+            birth=birth, range_from="2026-01", range_to="2035-12", method="index"
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert [(c["kind"], c["start"], c["peak"], c["end"]) for c in indexed] == [
+        (c["kind"], c["start"], c["peak"], c["end"]) for c in solved
+    ]
+    for cycle in indexed:
+        methods = [e["value"] for e in cycle["evidence"] if e["source"] == "western.transit.method"]
+        if cycle["kind"] in {"station_retrograde", "station_direct", "ingress"}:
+            assert methods == ["bracket+newton"]
+        else:
+            assert methods == ["crossing-index"]
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+from life_chart_api.ephemeris.natal import natal_context_for_birth
+from life_chart_api.main import app
+from life_chart_api.temporal.vedic_dashas import build_vedic_dasha_cycles
+from tests.asgi_client import call_app
+
+_BIRTH = {
+    "date": "1946-05-01",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "location": {
+        "city": "Hyderabad",
+        "region": "Telangana",
+        "country": "India",
+        "lat": 17.385,
+        "lon": 78.4867,
+    },
+}
+
+
+def _build(range_from: str, range_to: str, depth: str) -> list[dict]:
+    return build_vedic_dasha_cycles(
+        birth=_BIRTH,
+        range_from=range_from,
+        range_to=range_to,
+        natal=natal_context_for_birth(_BIRTH),
+        depth=depth,
+    )
+
+
+def test_maha_depth_matches_default_output():
+    assert _build("2020-01", "2030-12", "maha") == build_vedic_dasha_cycles(
+        birth=_BIRTH, range_from="2020-01", range_to="2030-12"
+    )
+
+
+def test_sub_periods_tile_days_within_range():
+    cycles = _build("2026-01", "2030-12", "pratyantar")
+    for kind in ("dasha_antar", "dasha_pratyantar"):
+        level = [cycle for cycle in cycles if cycle["kind"] == kind]
+        assert level
+        for previous, current in zip(level, level[1:], strict=False):
+            previous_end = date.fromisoformat(previous["end"])
+            assert date.fromisoformat(current["start"]) == previous_end + timedelta(days=1)
+        assert level[0]["start"] <= "2026-01-01"
+        assert level[-1]["end"] >= "2030-12-31"
+    chains = [
+        next(item["value"] for item in cycle["evidence"] if item["source"] == "vedic.vimshottari.chain")
+        for cycle in cycles
+        if cycle["kind"] == "dasha_pratyantar"
+    ]
+    assert all(len(chain) == 3 for chain in chains)
+
+
+def test_sub_periods_are_stable_across_ranges():
+    narrow = _build("2027-03-01", "2027-08-31", "sookshma")
+    wide = _build("2020-01", "2034-12", "sookshma")
+    wide_ids = {cycle["cycleId"] for cycle in wide}
+    assert narrow
+    assert all(cycle["cycleId"] in wide_ids for cycle in narrow)
+
+
+def test_timeline_accepts_dasha_depth():
+    params = {
+        "name": "Example Person",
+        "date": "1999-02-26",
+        "time": "14:00:00",
+        "timezone": "UTC",
+        "city": "Hyderabad",
+        "region": "Telangana",
+        "country": "India",
+        "lat": 17.385,
+        "lon": 78.4867,
+        "from": "2026-01",
+        "to": "2026-06",
+        "include": "vedic,intersection_time",
+        "granularity": "week",
+        "dasha_depth": "pratyantar",
+    }
+    status, _, payload = call_app(app, "GET", "/profile/timeline", params=params)
+    assert status == 200
+    kinds = {cycle["kind"] for cycle in payload["cycles"]}
+    assert {"dasha_maha", "dasha_antar", "dasha_pratyantar", "window"} <= kinds
+
+    status, _, payload = call_app(
+        app, "GET", "/profile/timeline", params={**params, "dasha_depth": "hora"}
+    )
+    assert status == 400
+    assert payload["error"]["code"] == "INVALID_INPUT"
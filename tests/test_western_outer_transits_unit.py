@@ -0,0 +1,91 @@
+from datetime import date
+
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.western_transits import (
+    build_western_transit_cycles,
+    estimate_transit_calls,
+    plan_western_transits,
+    transit_combinations,
+)
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "location": {"lat": 17.385, "lon": 78.4867},
+}
+_OUTER_KINDS = {"transit_uranus_aspect", "transit_neptune_aspect", "transit_pluto_aspect"}
+
+
+def _aspects(plan) -> set[str]:
+    return {combination.aspect for combination in plan.combinations}
+
+
+def test_outer_planets_cover_every_natal_point_and_aspect():
+    combinations = [c for c in transit_combinations() if c.kind in _OUTER_KINDS]
+    targets = {combination.target for combination in combinations}
+
+    assert len(combinations) == 3 * 13 * 5
+    assert {"sun", "moon", "mercury", "venus", "mars", "node", "asc", "mc"} <= targets
+    assert {c.aspect for c in combinations} == {
+        "conjunction",
+        "sextile",
+        "square",
+        "trine",
+        "opposition",
+    }
+
+
+def test_transit_cost_estimate_grows_with_range_and_method():
+    combinations = transit_combinations()
+    one_year = estimate_transit_calls(
+        combinations, method="solver", range_start=date(2026, 1, 1), range_end=date(2026, 12, 31)
+    )
+    five_years = estimate_transit_calls(
+        combinations, method="solver", range_start=date(2026, 1, 1), range_end=date(2030, 12, 31)
+    )
+    scan = estimate_transit_calls(
+        combinations, method="scan", range_start=date(2026, 1, 1), range_end=date(2026, 12, 31)
+    )
+
+    assert 0 < one_year < five_years < scan
+
+
+def test_transit_cap_drops_minor_aspects_first():
+    start, end = date(2026, 1, 1), date(2026, 12, 31)
+    full = plan_western_transits(method="scan", range_start=start, range_end=end, cap=10**9)
+    capped = plan_western_transits(
+        method="scan", range_start=start, range_end=end, cap=full.estimated_calls - 1
+    )
+    tight = plan_western_transits(method="scan", range_start=start, range_end=end, cap=0)
+
+    assert full.dropped == 0
+    assert _aspects(full) - _aspects(capped) == {"sextile"}
+    assert capped.estimated_calls <= full.estimated_calls - 1
+    assert "trine" not in _aspects(tight)
+    assert {c.kind for c in tight.combinations} == {
+        "return_saturn",
+        "return_jupiter",
+        "transit_saturn_aspect",
+    }
+
+
+def test_builder_emits_outer_aspects_and_respects_cap(monkeypatch):
+    cycles = build_western_transit_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2027-12"
+    )
+    outer = [cycle for cycle in cycles if cycle["kind"] in _OUTER_KINDS]
+    assert outer
+    for cycle in outer:
+        assert any(theme.startswith("target:") for theme in cycle["themes"])
+
+    monkeypatch.setenv("WESTERN_TRANSIT_CALL_CAP", "0")
+    get_settings.cache_clear()
+    try:
+        capped = build_western_transit_cycles(
+            birth=_BIRTH, range_from="2026-01", range_to="2027-12"
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert not [cycle for cycle in capped if cycle["kind"] in _OUTER_KINDS]
@@ -0,0 +1,101 @@
+import math
+
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.temporal_intersection import build_temporal_intersection_cycles
+from life_chart_api.temporal.transit_solver import (
+    PositionSeries,
+    find_ingresses,
+    find_stations,
+    sample_nodes,
+)
+from life_chart_api.temporal.western_transits import build_western_transit_cycles
+
+_BIRTH = {
+    "date": "1999-02-26",
+    "time": "14:00:00",
+    "timezone": "UTC",
+    "location": {"lat": 17.385, "lon": 78.4867},
+}
+_EVENT_KINDS = {"station_retrograde", "station_direct", "ingress"}
+
+
+def _planets(cycles: list[dict]) -> set[str]:
+    return {
+        theme.split(":", 1)[1]
+        for cycle in cycles
+        if cycle["kind"] in _EVENT_KINDS
+        for theme in cycle["themes"]
+        if theme.startswith("planet:")
+    }
+
+
+def test_stations_and_ingresses_on_oscillating_motion():
+    def position(jd: float) -> tuple[float, float]:
+        phase = 2.0 * math.pi * jd / 360.0
+        return 25.0 + 10.0 * math.sin(phase), 10.0 * 2.0 * math.pi / 360.0 * math.cos(phase)
+
+    series = PositionSeries(position)
+    nodes = sample_nodes(series, 0.0, 360.0, 30.0)
+    stations = find_stations(nodes)
+    ingresses = find_ingresses(series, nodes)
+
+    assert [station.retrograde for station in stations] == [True, False]
+    assert abs(stations[0].jd - 90.0) < 1e-3
+    assert abs(stations[1].jd - 270.0) < 1e-3
+    assert [(ingress.sign, ingress.retrograde) for ingress in ingresses] == [
+        (1, False),
+        (0, True),
+    ]
+    assert abs(ingresses[0].jd - 360.0 * math.asin(0.5) / (2.0 * math.pi)) < 1e-3
+
+
+def test_western_builder_emits_stations_and_ingresses():
+    cycles = build_western_transit_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2026-12"
+    )
+    events = [cycle for cycle in cycles if cycle["kind"] in _EVENT_KINDS]
+
+    assert {cycle["kind"] for cycle in events} == _EVENT_KINDS
+    saturn_ingress = [
+        cycle
+        for cycle in events
+        if cycle["kind"] == "ingress" and "planet:saturn" in cycle["themes"]
+    ]
+    assert [cycle["peak"] for cycle in saturn_ingress] == ["2026-02-14"]
+    assert "sign:aries" in saturn_ingress[0]["themes"]
+    assert _planets(events) == {"jupiter", "saturn", "uranus", "neptune", "pluto"}
+
+
+def test_western_event_call_budget_limits_bodies(monkeypatch):
+    monkeypatch.setenv("WESTERN_EVENT_CALL_BUDGET", "30")
+    get_settings.cache_clear()
+    try:
+        limited = build_western_transit_cycles(
+            birth=_BIRTH, range_from="2026-01", range_to="2026-12", method="scan"
+        )
+        reused = build_western_transit_cycles(
+            birth=_BIRTH, range_from="2026-01", range_to="2026-12", method="solver"
+        )
+        monkeypatch.setenv("WESTERN_EVENT_CALL_BUDGET", "0")
+        get_settings.cache_clear()
+        disabled = build_western_transit_cycles(
+            birth=_BIRTH, range_from="2026-01", range_to="2026-12"
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert _planets(limited) == {"jupiter", "saturn"}
+    # The solver's aspect pass already sampled every event body over the same bracket.
+    assert _planets(reused) == {"jupiter", "saturn", "uranus", "neptune", "pluto"}
+    assert not [cycle for cycle in disabled if cycle["kind"] in _EVENT_KINDS]
+
+
+def test_intersection_ignores_sky_events():
+    cycles = build_western_transit_cycles(
+        birth=_BIRTH, range_from="2026-01", range_to="2026-12"
+    )
+    natal_only = [cycle for cycle in cycles if cycle["kind"] not in _EVENT_KINDS]
+
+    assert build_temporal_intersection_cycles(
+        cycles, "2026-01", "2026-12"
+    ) == build_temporal_intersection_cycles(natal_only, "2026-01", "2026-12")
@@ -0,0 +1,151 @@
+import math
+
+from life_chart_api.settings import get_settings
+from life_chart_api.temporal.transit_solver import PositionSeries, TransitSweep, find_transit_window
+from life_chart_api.temporal.western_transits import build_western_transit_cycles
+
+_MINUTE = 1.0 / 1440.0
+
+
+def test_transit_solver_linear_motion_minute_precision():
+    def position(jd: float) -> tuple[float, float]:
+        return (10.0 + 0.1 * jd) % 360.0, 0.1
+
+    series = PositionSeries(position)
+    window = find_transit_window(
+        position=series,
+        natal_lon=15.0,
+        aspect_angle=0.0,
+        orb=1.0,
+        jd_start=0.0,
+        jd_end=200.0,
+        step=30.0,
+    )
+
+    assert window is not None
+    assert abs(window.start_jd - 40.0) < _MINUTE
+    assert abs(window.peak_jd - 50.0) < _MINUTE
+    assert abs(window.end_jd - 60.0) < _MINUTE
+    assert window.peak_delta < 1e-6
+    assert series.calls < 40
+
+
+def test_transit_solver_station_inside_orb():
+    def position(jd: float) -> tuple[float, float]:
+        phase = 2.0 * math.pi * jd / 360.0
+        return 100.0 + 5.0 * math.sin(phase), 5.0 * 2.0 * math.pi / 360.0 * math.cos(phase)
+
+    window = find_transit_window(
+        position=position,
+        natal_lon=15.5,
+        aspect_angle=90.0,
+        orb=1.0,
+        jd_start=0.0,
+        jd_end=180.0,
+        step=60.0,
+    )
+
+    assert window is not None
+    assert abs(window.peak_jd - 90.0) < 0.05
+    assert abs(window.peak_delta - 0.5) < 1e-4
+    expected_offset = 360.0 / (2.0 * math.pi) * math.acos(0.9)
+    assert abs(window.start_jd - (90.0 - expected_offset)) < _MINUTE
+    assert abs(window.end_jd - (90.0 + expected_offset)) < _MINUTE
+
+
+def test_transit_solver_outside_orb_returns_none():
+    def position(jd: float) -> tuple[float, float]:
+        return (10.0 + 0.1 * jd) % 360.0, 0.1
+
+    window = find_transit_window(
+        position=position,
+        natal_lon=200.0,
+        aspect_angle=0.0,
+        orb=1.0,
+        jd_start=0.0,
+        jd_end=200.0,
+        step=30.0,
+    )
+    assert window is None
+
+
+def test_transit_sweep_shares_samples_across_targets():
+    def position(jd: float, body: int) -> tuple[float, float]:
+        phase = 2.0 * math.pi * jd / 360.0
+        return (0.05 * jd + 4.0 * math.sin(phase)) % 360.0, 0.05 + 4.0 * 2.0 * math.pi / 360.0 * math.cos(phase)
+
+    sweep = TransitSweep(position, 0.0, 1800.0)
+    targets = [(natal, angle) for natal in (12.0, 40.0, 75.0) for angle in (0.0, 90.0, 180.0)]
+    windows = [sweep.window(6, natal, angle, 1.5) for natal, angle in targets]
+    sampled_calls = len(sweep.nodes(6))
+
+    assert any(window is not None for window in windows)
+    assert sweep.calls < sampled_calls + 12 * len(targets)
+    for (natal, angle), window in zip(targets, windows, strict=True):
+        single = find_transit_window(
+            position=lambda jd: position(jd, 6),
+            natal_lon=natal,
+            aspect_angle=angle,
+            orb=1.5,
+            jd_start=0.0,
+            jd_end=1800.0,
+            step=60.0,
+        )
+        if window is None:
+            assert single is None
+        else:
+            assert single is not None
+            assert abs(single.peak_jd - window.peak_jd) < _MINUTE
+
+
+def test_western_transit_builder_solver_and_scan_methods(monkeypatch):
+    birth = {
+        "date": "1999-02-26",
+        "time": "14:00:00",
+        "timezone": "UTC",
+        "location": {"lat": 17.385, "lon": 78.4867},
+    }
+
+    monkeypatch.setenv("WESTERN_TRANSIT_CALL_CAP", "1000000")
+    get_settings.cache_clear()
+    try:
+        solved = build_western_transit_cycles(
+            birth=birth, range_from="2026-01", range_to="2027-12", method="solver"
+        )
+        scanned = build_western_transit_cycles(
+            birth=birth, range_from="2026-01", range_to="2027-12", method="scan"
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert solved
+    assert {cycle["kind"] for cycle in solved} == {cycle["kind"] for cycle in scanned}
+    for cycle in solved:
+        methods = [e["value"] for e in cycle["evidence"] if e["source"] == "western.transit.method"]
+        assert methods == ["bracket+newton"]
+        peak = next(e["value"] for e in cycle["evidence"] if e["source"] == "western.transit.peak")
+        assert peak["time"].startswith(cycle["peak"])
+        assert cycle["start"] <= cycle["peak"][:7] <= cycle["end"]
+
+
+def test_western_transit_solver_windows_stay_inside_range(monkeypatch):
+    birth = {
+        "date": "1990-05-17",
+        "time": "12:00:00",
+        "timezone": "Europe/London",
+        "location": {"lat": 51.5074, "lon": -0.1278},
+    }
+
+    monkeypatch.setenv("WESTERN_TRANSIT_CALL_CAP", "1000000")
+    get_settings.cache_clear()
+    try:
+        cycles = build_western_transit_cycles(
+            birth=birth, range_from="2034-01", range_to="2034-12", method="solver"
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert any(cycle["kind"] == "transit_uranus_aspect" for cycle in cycles)
+    for cycle in cycles:
+        assert "2034-01" <= cycle["start"] <= cycle["end"] <= "2034-12"
+        assert "2034-01-01" <= cycle["peak"] <= "2034-12-31"